@@ -26,6 +26,7 @@ from weaviate_cli.commands.cancel import cancel
 from weaviate_cli.commands.assign import assign
 from weaviate_cli.commands.revoke import revoke
 from weaviate_cli.commands.benchmark import benchmark
+from weaviate_cli.commands.export import export
 from weaviate_cli import __version__
 
 
@@ -78,6 +79,7 @@ main.add_command(cancel)
 main.add_command(assign)
 main.add_command(revoke)
 main.add_command(benchmark)
+main.add_command(export)
 
 if __name__ == "__main__":
     main()
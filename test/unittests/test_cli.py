@@ -50,3 +50,21 @@ def test_main_commands_registered():
     assert "update" in main.commands
     assert "restore" in main.commands
     assert "query" in main.commands
+    assert "export" in main.commands
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["sweep", "--matrix", "matrix.json"],
+        ["ef-sweep"],
+        ["mixed"],
+        ["cold-tenants"],
+    ],
+)
+def test_benchmark_graph_needs_csv_output(cli_runner, args):
+    with cli_runner.isolated_filesystem():
+        open("matrix.json", "w").close()
+        result = cli_runner.invoke(main, ["benchmark", *args, "--generate-graph"])
+    assert result.exit_code == 1
+    assert "--generate-graph can only be used when --output=csv" in result.output
@@ -0,0 +1,1589 @@
+import asyncio
+import csv
+import itertools
+import json
+import queue
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+import weaviate_cli.managers.benchmark_manager as benchmark_manager
+from weaviate.collections.classes.tenants import Tenant, TenantActivityStatus
+
+from weaviate_cli.managers.benchmark_manager import (
+    ArrivalProcess,
+    ArrivalSchedule,
+    BenchmarkColdTenantManager,
+    BenchmarkEfSweepManager,
+    BenchmarkLatencyManager,
+    BenchmarkMixedManager,
+    BenchmarkQPSManager,
+    BenchmarkRecallManager,
+    BenchmarkSweepManager,
+    BenchmarkThroughputManager,
+    FilterCase,
+    LatencyHistogram,
+    PhaseHistograms,
+    QueryCorpus,
+    SloPolicy,
+    SloRule,
+    TenantWorkload,
+    _LoadGeneratorPool,
+    RecallProbe,
+    _best_operating_point,
+    _concurrency_levels,
+    _load_sweep_matrix,
+    _search_param_steps,
+    exact_top_k,
+)
+
+
+def _make_collection(certainties):
+    collection = MagicMock()
+    objects = [MagicMock(metadata=MagicMock(certainty=c)) for c in certainties]
+    for method in ("hybrid", "bm25", "near_text"):
+        setattr(
+            collection.query, method, AsyncMock(return_value=MagicMock(objects=objects))
+        )
+    return collection
+
+
+class TestRunQueryReturnMode:
+    def _run(self, collection, return_mode, query_type="hybrid"):
+        manager = BenchmarkQPSManager(MagicMock())
+        return asyncio.run(
+            manager._run_query_and_collect_latency(
+                collection, "action", 10, [], query_type, return_mode=return_mode
+            )
+        )
+
+    def test_ids_only_requests_no_properties_or_metadata(self):
+        collection = _make_collection([None, None])
+        took, certainties = self._run(collection, "ids-only")
+
+        kwargs = collection.query.hybrid.await_args.kwargs
+        assert kwargs["return_properties"] == []
+        assert kwargs["return_metadata"] is None
+        assert took is not None
+        assert certainties == []
+
+    def test_metadata_requests_certainty_without_properties(self):
+        collection = _make_collection([0.9, 0.8])
+        _, certainties = self._run(collection, "metadata", query_type="bm25")
+
+        kwargs = collection.query.bm25.await_args.kwargs
+        assert kwargs["return_properties"] == []
+        assert kwargs["return_metadata"].certainty is True
+        assert certainties == [0.9, 0.8]
+
+    def test_full_returns_every_property(self):
+        collection = _make_collection([0.5])
+        self._run(collection, "full", query_type="near_text")
+
+        kwargs = collection.query.near_text.await_args.kwargs
+        assert kwargs["return_properties"] is None
+
+
+def test_certainty_requires_metadata():
+    manager = BenchmarkQPSManager(MagicMock())
+    with pytest.raises(Exception, match="--certainty needs"):
+        asyncio.run(
+            manager.run_benchmark(
+                collection="Movies", certainty=True, return_mode="ids-only"
+            )
+        )
+
+
+class TestRunPhaseCoordinatedOmission:
+    def test_latency_includes_queue_wait(self, capsys):
+        manager = BenchmarkQPSManager(MagicMock())
+
+        async def _slow_query(*args, **kwargs):
+            await asyncio.sleep(0.02)
+            return 20, []
+
+        manager._run_query_and_collect_latency = _slow_query
+        # One worker at 200 QPS can serve ~50 QPS, so requests queue up.
+        stats, exceeded = asyncio.run(
+            manager._run_phase(
+                MagicMock(),
+                ["action"],
+                10,
+                qps=200,
+                duration=1,
+                phase_name="Main Test",
+                show_certainty=False,
+                csv_writer=None,
+                query_type="hybrid",
+                latency_threshold=100000,
+                concurrency=1,
+            )
+        )
+
+        assert not exceeded
+        assert stats.latency.min >= 19_000
+        # Corrected latency grows with the backlog instead of staying at ~20 ms.
+        assert stats.latency.max > 200_000
+        out = capsys.readouterr().out
+        assert "P50/P99 service time: 20.00/20.00 ms" in out
+        assert "queue lag" in out
+
+
+class TestLatencyHistogram:
+    def test_small_values_are_exact(self):
+        hist = LatencyHistogram()
+        for v in [0, 1, 2, 3, 250]:
+            hist.record(v)
+        assert hist.percentiles([20, 40, 60, 80, 100]) == [0, 1, 2, 3, 250]
+
+    def test_percentiles_within_relative_error(self):
+        rng = np.random.default_rng(7)
+        values = rng.lognormal(mean=8, sigma=1.5, size=20000).astype(np.int64)
+        hist = LatencyHistogram()
+        for v in values:
+            hist.record(int(v))
+
+        for q in (50, 90, 99, 99.9):
+            expected = np.percentile(values, q, method="inverted_cdf")
+            assert hist.percentile(q) == pytest.approx(expected, rel=0.01)
+        assert hist.max == values.max()
+        assert hist.mean() == pytest.approx(values.mean())
+
+    def test_memory_is_constant(self):
+        hist = LatencyHistogram()
+        size = hist.counts.nbytes
+        for v in range(0, 10**7, 997):
+            hist.record(v)
+        assert hist.counts.nbytes == size
+        hist.record(10**15)
+        assert hist.max == hist.max_value
+
+    def test_merge_and_serialize_roundtrip(self):
+        a, b = LatencyHistogram(), LatencyHistogram()
+        for v in range(1, 1000):
+            a.record(v)
+            b.record(v * 1000)
+        a.merge(b)
+        assert a.total == 1998
+        assert a.min == 1 and a.max == 999000
+
+        restored = LatencyHistogram.from_dict(json.loads(json.dumps(a.to_dict())))
+        np.testing.assert_array_equal(restored.counts, a.counts)
+        assert restored.percentiles([50, 99]) == a.percentiles([50, 99])
+        rows = a.csv_rows()
+        assert sum(count for _, count, _ in rows) == 1998
+        assert rows[-1][2] == pytest.approx(100.0)
+
+    def test_phase_histograms_record_microseconds(self):
+        stats = PhaseHistograms()
+        stats.record(0.25, 0.2, 0.05, [0.9])
+        assert stats.latency.max == 250
+        assert stats.service.max == 200
+        assert stats.queue_lag.max == 50
+        assert stats.certainty.max == 900000
+
+
+class _FakeAsyncQuery:
+    async def hybrid(self, **kwargs):
+        await asyncio.sleep(0.002)
+        return SimpleNamespace(objects=[])
+
+
+class _FakeAsyncCollection:
+    query = _FakeAsyncQuery()
+
+    def with_consistency_level(self, _):
+        return self
+
+    def with_tenant(self, _):
+        return self
+
+
+class _FakeAsyncClient:
+    """Picklable stand-in for a WeaviateAsyncClient used by spawned processes."""
+
+    def __init__(self):
+        self.collections = SimpleNamespace(get=lambda name: _FakeAsyncCollection())
+
+    async def connect(self):
+        pass
+
+    async def close(self):
+        pass
+
+
+def _fake_client_factory():
+    return _FakeAsyncClient()
+
+
+class TestMultiProcessLoadGenerator:
+    def test_processes_share_rate_and_merge_histograms(self, capsys):
+        manager = BenchmarkQPSManager(MagicMock(), client_factory=_fake_client_factory)
+        pool = _LoadGeneratorPool(2, _fake_client_factory, "Movies", None, None)
+        pool.start()
+        manager._load_generators = pool
+        try:
+            stats, exceeded = asyncio.run(
+                manager._run_load_phase(
+                    None,
+                    ["action"],
+                    10,
+                    40,
+                    2,
+                    "Main Test",
+                    False,
+                    None,
+                    "hybrid",
+                    10000,
+                )
+            )
+        finally:
+            pool.close()
+
+        assert not exceeded
+        # 40 QPS split over two processes for two seconds.
+        assert 60 <= stats.latency.total <= 84
+        out = capsys.readouterr().out
+        assert "across 2 processes" in out
+        assert "Total queries:" in out
+
+    def test_interval_reports_carry_a_running_total(self):
+        manager = BenchmarkQPSManager(MagicMock())
+
+        def _stats(queries):
+            stats = PhaseHistograms()
+            for _ in range(queries):
+                stats.record(5.0, 5.0, 0.0)
+            return stats.to_dict()
+
+        results = queue.Queue()
+        manager._load_generators = SimpleNamespace(
+            processes=[None, None],
+            commands=[MagicMock(), MagicMock()],
+            results=results,
+            stop=threading.Event(),
+        )
+
+        def _feed():
+            for queries in (2, 3):
+                for index in range(2):
+                    results.put(("interval", index, _stats(queries)))
+                time.sleep(1.1)
+            for index in range(2):
+                results.put(
+                    ("done", index, _stats(5), False, None, ArrivalSchedule().to_dict())
+                )
+
+        totals = []
+        manager._report_percentiles = lambda *a, total_queries=None, **kw: (
+            totals.append(total_queries)
+        )
+        feeder = threading.Thread(target=_feed)
+        feeder.start()
+        stats, _ = asyncio.run(
+            manager._run_phase_multiprocess(
+                ["action"], 10, 40, 2, "Main Test", False, None, "hybrid", 10000
+            )
+        )
+        feeder.join()
+
+        assert stats.latency.total == 10
+        assert totals == [4, 10]
+
+    def test_processes_require_client_factory(self):
+        manager = BenchmarkQPSManager(MagicMock())
+        with pytest.raises(Exception, match="--processes needs"):
+            asyncio.run(manager.run_benchmark(collection="Movies", processes=2))
+
+
+class TestFindMaxQps:
+    def _manager(self, capacity):
+        manager = BenchmarkQPSManager(MagicMock())
+        probed = []
+
+        async def _fake_phase(collection_obj, query_terms, limit, qps, *args, **kw):
+            stats = PhaseHistograms()
+            phase_name = args[1]
+            latency = 5.0 if qps <= capacity else 500.0
+            stats.record(latency, latency, 0.0)
+            if phase_name == "Main Test":
+                probed.append(qps)
+            # Per-request mode stops the phase when one request is too slow.
+            return stats, latency > args[5]
+
+        manager._run_load_phase = _fake_phase
+        return manager, probed
+
+    def _find(self, manager, **kwargs):
+        params = dict(
+            collection_obj=None,
+            query_terms=["action"],
+            limit=10,
+            max_duration=100000,
+            fixed_qps=None,
+            show_certainty=False,
+            csv_writer=None,
+            query_type="hybrid",
+            warmup_duration=1,
+            test_duration=1,
+            latency_threshold=100,
+        )
+        params.update(kwargs)
+        return asyncio.run(manager._find_max_qps(**params))
+
+    def test_exponential_then_binary_search(self):
+        manager, probed = self._manager(capacity=3000)
+        result = self._find(manager, search_strategy="exponential", search_precision=25)
+
+        assert 3000 - 25 <= result <= 3000
+        assert len(probed) < 25
+        assert probed[:4] == [10, 20, 40, 80]
+
+    def test_linear_steps_by_ten(self):
+        manager, probed = self._manager(capacity=35)
+        assert self._find(manager) == 30
+        assert probed == [10, 20, 30, 40]
+
+    def test_confirm_runs_repeat_each_rate(self):
+        manager, probed = self._manager(capacity=15)
+        self._find(manager, confirm_runs=2)
+        assert probed == [10, 10, 20]
+
+    def test_percentile_threshold(self):
+        manager, probed = self._manager(capacity=20)
+        result = self._find(manager, threshold_percentile=99.0)
+        assert result == 20
+
+    def test_percentile_threshold_applies_at_fixed_qps(self, capsys):
+        manager, probed = self._manager(capacity=20)
+        assert self._find(manager, fixed_qps=40, threshold_percentile=99.0) == 40
+        assert probed == [40]
+        assert "P99 latency 500.00 ms exceeded at 40 QPS" in capsys.readouterr().out
+
+        self._find(manager, fixed_qps=20, threshold_percentile=99.0)
+        assert "within the 100 ms threshold at 20 QPS" in capsys.readouterr().out
+
+    def test_duration_budget_returns_last_passing_rate(self):
+        manager, probed = self._manager(capacity=10**6)
+        result = self._find(manager, search_strategy="exponential", max_duration=6)
+        assert probed == [10, 20, 40]
+        assert result == 40
+
+
+def _interval(latencies_ms, errors=0):
+    interval = PhaseHistograms()
+    for ms in latencies_ms:
+        interval.record(ms, ms, 0, [])
+    interval.errors = errors
+    return interval
+
+
+class TestSlo:
+    def test_parse_rules(self):
+        rule = SloRule("p95<50")
+        assert (rule.percentile, rule.limit) == (95.0, 50.0)
+        assert SloRule("error_rate < 0.1%").limit == pytest.approx(0.001)
+        assert SloRule("p99.9<120ms").percentile == 99.9
+        for bad in ("p95>50", "latency<10", "error_rate<5ms", "p99<1%"):
+            with pytest.raises(ValueError, match="Invalid SLO rule"):
+                SloRule(bad)
+
+    def test_window_and_grace(self):
+        policy = SloPolicy([SloRule("p90<50")], window=3, grace=2, action="abort")
+        monitor = policy.monitor()
+        # A slow first second is inside the grace period.
+        assert monitor.observe(_interval([500] * 10), 1.0) is None
+        # Once evaluated, the window still holds the slow second.
+        assert monitor.observe(_interval([10] * 10), 2.0)["rule"] == "p90<50"
+
+        monitor = policy.monitor()
+        for second in range(1, 4):
+            monitor.observe(_interval([500] * 10), second)
+        monitor = policy.monitor()
+        for second in range(1, 6):
+            violation = monitor.observe(_interval([10] * 10), second)
+        assert violation is None
+        # One slow second in three is below the p90.
+        assert monitor.observe(_interval([10] * 10 + [500]), 6.0) is None
+
+    def test_error_rate(self):
+        policy = SloPolicy(
+            [SloRule("error_rate<1%")], window=2, grace=0, action="continue"
+        )
+        monitor = policy.monitor()
+        assert monitor.observe(_interval([10] * 99, errors=0), 1.0) is None
+        violation = monitor.observe(_interval([10] * 90, errors=10), 2.0)
+        assert violation["observed"] == "5.025%"
+        assert violation["window_s"] == 2
+
+    def test_breach_aborts_phase(self, capsys):
+        manager = BenchmarkQPSManager(MagicMock())
+
+        async def _slow_query(*args, **kwargs):
+            await asyncio.sleep(0.06)
+            return 60, []
+
+        manager._run_query_and_collect_latency = _slow_query
+        policy = SloPolicy([SloRule("p50<50")], window=1, grace=0, action="abort")
+        started = time.monotonic()
+        _, exceeded = asyncio.run(
+            manager._run_phase(
+                MagicMock(),
+                ["action"],
+                10,
+                qps=20,
+                duration=5,
+                phase_name="Main Test",
+                show_certainty=False,
+                csv_writer=None,
+                query_type="hybrid",
+                latency_threshold=float("inf"),
+                concurrency=2,
+                slo=policy,
+            )
+        )
+
+        assert exceeded
+        assert time.monotonic() - started < 3
+        assert manager.slo_violations[0]["rule"] == "p50<50"
+        assert manager.slo_violations[0]["qps"] == 20
+        assert "SLO 'p50<50' violated at 20 QPS" in capsys.readouterr().out
+
+
+class TestClosedLoop:
+    def _manager(self, service_s):
+        manager = BenchmarkThroughputManager(MagicMock())
+        manager._open_collection = AsyncMock(return_value=(MagicMock(), None))
+        manager.async_client.close = AsyncMock()
+
+        async def _query(*args, **kwargs):
+            await asyncio.sleep(service_s)
+            return service_s * 1000, []
+
+        manager._run_query_and_collect_latency = _query
+        return manager
+
+    def test_concurrency_levels(self):
+        assert _concurrency_levels(1) == [1]
+        assert _concurrency_levels(8) == [1, 2, 4, 8]
+        assert _concurrency_levels(12) == [1, 2, 4, 8, 12]
+
+    def test_throughput_scales_with_users_and_think_time(self):
+        manager = self._manager(0.01)
+
+        async def run(users, think_time):
+            stats, elapsed = await manager._run_closed_loop(
+                MagicMock(), ["a"], 10, users, 0.5, "hybrid", think_time, "metadata"
+            )
+            return stats.latency.total / elapsed
+
+        one, four = asyncio.run(run(1, 0)), asyncio.run(run(4, 0))
+        assert four > 3 * one
+        # 10 ms service + 10 ms think time halves each user's rate.
+        assert asyncio.run(run(1, 10)) < 0.7 * one
+
+    def test_sweep_reports_peak(self, capsys):
+        manager = self._manager(0.005)
+        asyncio.run(
+            manager.run_benchmark(
+                collection="Movies",
+                max_concurrency=4,
+                level_duration=0.3,
+                warmup_duration=0,
+                json_output=True,
+            )
+        )
+
+        out = capsys.readouterr().out
+        result = json.loads(out[out.index("{") :])
+        assert [r["concurrency"] for r in result["results"]] == [1, 2, 4]
+        assert result["peak_concurrency"] == 4
+        assert result["results"][0]["p50"] == pytest.approx(5, rel=0.05)
+
+
+def test_latency_benchmark_per_query_type(capsys):
+    manager = BenchmarkLatencyManager(MagicMock())
+    manager._open_collection = AsyncMock(return_value=(MagicMock(), None))
+    manager.async_client.close = AsyncMock()
+    calls = []
+
+    async def _query(collection, term, limit, filters, query_type, **kwargs):
+        calls.append(query_type)
+        return (
+            (None, None)
+            if len(calls) == 5
+            else ({"bm25": 2, "hybrid": 8}[query_type], [])
+        )
+
+    manager._run_query_and_collect_latency = _query
+    asyncio.run(
+        manager.run_benchmark(
+            collection="Movies",
+            query_types=("bm25", "hybrid"),
+            queries=5,
+            warmup=2,
+            json_output=True,
+        )
+    )
+
+    assert calls == ["bm25"] * 7 + ["hybrid"] * 7
+    out = capsys.readouterr().out
+    results = json.loads(out[out.index("{") :])["results"]
+    assert [(r["query_type"], r["queries"], r["errors"]) for r in results] == [
+        ("bm25", 4, 1),
+        ("hybrid", 5, 0),
+    ]
+    assert results[0]["p50"] == pytest.approx(2, rel=0.01)
+    assert results[1]["max"] == pytest.approx(8, rel=0.01)
+
+
+def test_latency_benchmark_reports_a_query_type_with_no_successes(capsys):
+    manager = BenchmarkLatencyManager(MagicMock())
+    manager._open_collection = AsyncMock(return_value=(MagicMock(), None))
+    manager.async_client.close = AsyncMock()
+
+    async def _query(collection, term, limit, filters, query_type, **kwargs):
+        return (None, None) if query_type == "near_text" else (3, [])
+
+    manager._run_query_and_collect_latency = _query
+    asyncio.run(
+        manager.run_benchmark(
+            collection="Movies",
+            query_types=("near_text", "bm25"),
+            queries=3,
+            warmup=0,
+            json_output=True,
+        )
+    )
+
+    out = capsys.readouterr().out
+    results = json.loads(out[out.index("{") :])["results"]
+    assert results[0]["queries"] == 0 and results[0]["errors"] == 3
+    assert [results[0][k] for k in ("min", "p50", "max", "mean")] == [0.0] * 4
+    assert results[1]["max"] == pytest.approx(3, rel=0.01)
+
+
+def _take_until(offsets, end):
+    result = []
+    for t in offsets:
+        if t >= end:
+            return result
+        result.append(t)
+
+
+class TestArrivalProcess:
+    def test_parse(self, tmp_path):
+        assert ArrivalProcess.parse("poisson").kind == "poisson"
+        bursts = ArrivalProcess.parse("bursts:2/8")
+        assert (bursts.on_s, bursts.off_s, bursts.name) == (2.0, 8.0, "bursts:2/8")
+        trace = tmp_path / "trace.txt"
+        trace.write_text("10.0\n10.5\n\n12.0\n")
+        assert ArrivalProcess.parse(f"replay:{trace}").gaps == [0.5, 1.5]
+        for bad in ("uniform", "bursts:0/1", "bursts:1"):
+            with pytest.raises(ValueError, match="Invalid arrival"):
+                ArrivalProcess.parse(bad)
+
+    def test_constant_and_poisson_mean_rate(self):
+        constant = _take_until(ArrivalProcess("constant").offsets(10), 1)
+        assert constant == pytest.approx([i / 10 for i in range(10)])
+
+        poisson = _take_until(ArrivalProcess("poisson", seed=1).offsets(100), 100)
+        assert len(poisson) == pytest.approx(10000, rel=0.03)
+        gaps = np.diff(poisson)
+        # Exponential gaps: the standard deviation equals the mean.
+        assert gaps.std() == pytest.approx(gaps.mean(), rel=0.05)
+        # Independent streams for several load generators.
+        other = _take_until(ArrivalProcess("poisson", seed=1).offsets(100, 1), 1)
+        assert other != poisson[: len(other)]
+
+    def test_bursts_only_send_during_on_windows(self):
+        offsets = _take_until(ArrivalProcess("bursts", 3, 1, 4).offsets(20), 500)
+        assert len(offsets) == pytest.approx(20 * 500, rel=0.05)
+        assert all(t % 5 < 1 for t in offsets)
+
+    def test_replay_is_scaled_to_mean_rate_and_looped(self):
+        replay = ArrivalProcess("replay", gaps=[1.0, 3.0])
+        # Mean gap of 2 s scaled to 10 QPS (0.1 s).
+        assert _take_until(replay.offsets(10), 0.6) == pytest.approx(
+            [0.05, 0.2, 0.25, 0.4, 0.45]
+        )
+
+    def test_phase_reports_generated_and_achieved_schedule(self, capsys):
+        manager = BenchmarkQPSManager(MagicMock())
+        manager.arrival = ArrivalProcess("bursts", 1, 1, 1)
+
+        async def _query(*args, **kwargs):
+            await asyncio.sleep(0.001)
+            return 1, []
+
+        manager._run_query_and_collect_latency = _query
+        asyncio.run(
+            manager._run_phase(
+                MagicMock(),
+                ["action"],
+                10,
+                qps=50,
+                duration=4,
+                phase_name="Main Test",
+                show_certainty=False,
+                csv_writer=None,
+                query_type="hybrid",
+                latency_threshold=100000,
+                concurrency=4,
+            )
+        )
+
+        summary = manager.main_phase_schedules[50]
+        generated = [manager.last_schedule.generated[i] for i in range(4)]
+        # Seconds 1 and 3 are OFF windows.
+        assert generated[1] == generated[3] == 0
+        assert summary["generated"]["peak_qps"] > 50
+        assert summary["achieved"]["total"] == summary["generated"]["total"]
+        assert "Arrival schedule (bursts:1/1)" in capsys.readouterr().out
+
+    def _run_slow_phase(self, concurrency, qps, duration):
+        manager = BenchmarkQPSManager(MagicMock())
+
+        async def _query(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return 50, []
+
+        manager._run_query_and_collect_latency = _query
+        asyncio.run(
+            manager._run_phase(
+                MagicMock(),
+                ["action"],
+                10,
+                qps=qps,
+                duration=duration,
+                phase_name="Main Test",
+                show_certainty=False,
+                csv_writer=None,
+                query_type="hybrid",
+                latency_threshold=100000,
+                concurrency=concurrency,
+            )
+        )
+        return manager.main_phase_schedules[qps]["workers"]
+
+    def test_auto_concurrency_resizes_the_pool(self, capsys):
+        workers = self._run_slow_phase(None, 400, 3)
+        # Little's law: 400 QPS * 50 ms * 1.3 = 26 workers, from 8 at the start.
+        assert workers["min_pool"] == 8
+        assert workers["max_pool"] == 26
+        assert workers["peak_in_flight"] > 8
+        out = capsys.readouterr().out
+        assert "Workers   pool 8-26" in out
+        assert "workers)" in out
+
+    def test_load_generator_monitors_itself(self, capsys, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        manager = BenchmarkQPSManager(MagicMock())
+
+        async def _busy_query(*args, **kwargs):
+            # Burn the client's CPU and block its event loop.
+            deadline = time.perf_counter() + 0.012
+            while time.perf_counter() < deadline:
+                pass
+            return 12, []
+
+        manager._run_query_and_collect_latency = _busy_query
+        csv_writer, csv_file, csv_filename = manager._setup_csv_output(
+            "csv", False, None
+        )
+        stats, _ = asyncio.run(
+            manager._run_phase(
+                MagicMock(),
+                ["action"],
+                10,
+                qps=100,
+                duration=2,
+                phase_name="Main Test",
+                show_certainty=False,
+                csv_writer=csv_writer,
+                query_type="hybrid",
+                latency_threshold=100000,
+                concurrency=4,
+            )
+        )
+        csv_file.close()
+
+        cpu, loop_lag, queue_depth = stats.client_load()
+        assert cpu > 80
+        assert loop_lag > 5
+        assert queue_depth >= 1
+        assert "the load generator itself is saturated" in capsys.readouterr().out
+        with open(csv_filename) as f:
+            rows = list(csv.DictReader(f))
+        assert float(rows[-1]["client_cpu_percent"]) == pytest.approx(cpu, abs=0.1)
+        assert rows[0]["p99_loop_lag"] and rows[0]["queue_depth"]
+
+        restored = PhaseHistograms.from_dict(json.loads(json.dumps(stats.to_dict())))
+        assert restored.client_load() == stats.client_load()
+        idle = PhaseHistograms()
+        idle.merge(restored)
+        assert idle.cpu == restored.cpu and not PhaseHistograms().client_saturated()
+
+    def test_fixed_concurrency_warns_when_saturated(self, capsys):
+        workers = self._run_slow_phase(2, 60, 2)
+        assert workers["min_pool"] == workers["max_pool"] == 2
+        assert workers["saturated_s"] >= 2
+        assert workers["peak_backlog"] > 0
+        assert "queries waited for a free worker" in capsys.readouterr().out
+
+
+class _FakeAggregateCollection:
+    """Evaluates the workload's equal / less_than / any_of filters in memory."""
+
+    def __init__(self, rows, data_types):
+        self.rows = rows
+        self.config = SimpleNamespace(
+            get=AsyncMock(
+                return_value=SimpleNamespace(
+                    properties=[
+                        SimpleNamespace(name=n, data_type=SimpleNamespace(value=t))
+                        for n, t in data_types.items()
+                    ]
+                )
+            )
+        )
+        self.aggregate = SimpleNamespace(over_all=self._over_all)
+
+    def _matches(self, row, f):
+        if hasattr(f, "filters"):
+            return any(self._matches(row, sub) for sub in f.filters)
+        value = row[f.target]
+        if f.operator.value == "Equal":
+            return value == f.value
+        if hasattr(f.value, "timestamp"):
+            return value < f.value.timestamp()
+        return value < f.value
+
+    async def _over_all(self, filters=None, group_by=None, total_count=True, **kw):
+        rows = [r for r in self.rows if filters is None or self._matches(r, filters)]
+        if group_by is not None:
+            counts = {}
+            for r in rows:
+                counts[r[group_by.prop]] = counts.get(r[group_by.prop], 0) + 1
+            groups = [
+                SimpleNamespace(grouped_by=SimpleNamespace(value=v), total_count=c)
+                for v, c in counts.items()
+            ]
+            return SimpleNamespace(groups=groups)
+        if "return_metrics" in kw:
+            prop = kw["return_metrics"].property_name
+            values = [r[prop] for r in rows]
+            lo, hi = min(values), max(values)
+            if prop == "releaseDate":
+                # RFC3339, as Weaviate returns dates.
+                lo, hi = (
+                    datetime.fromtimestamp(v, tz=timezone.utc)
+                    .isoformat()
+                    .replace("+00:00", "Z")
+                    for v in (lo, hi)
+                )
+            agg = SimpleNamespace(minimum=lo, maximum=hi)
+            return SimpleNamespace(properties={prop: agg})
+        return SimpleNamespace(total_count=len(rows))
+
+
+class TestFilterWorkload:
+    def _collection(self):
+        rng = np.random.default_rng(3)
+        languages = ["en"] * 700 + ["fr"] * 200 + ["de"] * 90 + ["it"] * 10
+        rows = [
+            {
+                "originalLanguage": lang,
+                "budget": float(rng.lognormal(15, 2)),
+                "releaseDate": float(rng.uniform(0, 1.6e9)),
+            }
+            for lang in languages
+        ]
+        return _FakeAggregateCollection(
+            rows,
+            {"originalLanguage": "text", "budget": "number", "releaseDate": "date"},
+        )
+
+    def test_selectivity_targets(self, capsys):
+        manager = BenchmarkQPSManager(MagicMock())
+        cases = asyncio.run(
+            manager._build_filter_workload(
+                self._collection(),
+                ["originalLanguage", "budget", "releaseDate"],
+                [1, 10, 30],
+            )
+        )
+
+        by_tag = {c.tag: c.selectivity for c in cases}
+        assert by_tag["eq:originalLanguage@1%"] == 0.01
+        assert by_tag["eq:originalLanguage@10%"] == 0.1  # de + it
+        # fr + de + it is the closest sum to 30%.
+        assert by_tag["eq:originalLanguage@30%"] == 0.3
+        for prop in ("budget", "releaseDate"):
+            for target in (1, 10, 30):
+                assert by_tag[f"range:{prop}@{target}%"] == pytest.approx(
+                    target / 100, rel=0.05
+                )
+        assert "Filter range:budget@10%: estimated selectivity" in (
+            capsys.readouterr().out
+        )
+
+    def test_unsupported_property(self):
+        collection = _FakeAggregateCollection([{"x": 1}], {"x": "blob"})
+        manager = BenchmarkQPSManager(MagicMock())
+        with pytest.raises(Exception, match="cannot be filtered on"):
+            asyncio.run(manager._build_filter_workload(collection, ["x"], [10]))
+
+    def test_phase_cycles_filters_and_tags_latency(self, capsys):
+        manager = BenchmarkQPSManager(MagicMock())
+        manager.filter_cases = [
+            FilterCase("eq", "status", 0.01, 0.012, "narrow"),
+            FilterCase("range", "budget", 0.5, 0.49, "wide"),
+        ]
+        seen = []
+
+        async def _query(collection, term, limit, filters, *args, **kwargs):
+            seen.append(filters)
+            await asyncio.sleep(0.001 if filters == ["narrow"] else 0.02)
+            return 1, []
+
+        manager._run_query_and_collect_latency = _query
+        stats, _ = asyncio.run(
+            manager._run_phase(
+                MagicMock(),
+                ["action"],
+                10,
+                qps=40,
+                duration=1,
+                phase_name="Main Test",
+                show_certainty=False,
+                csv_writer=None,
+                query_type="hybrid",
+                latency_threshold=100000,
+                concurrency=4,
+            )
+        )
+
+        assert seen[:4] == [["narrow"], ["wide"], ["narrow"], ["wide"]]
+        narrow, wide = manager._filter_summaries(stats)
+        assert narrow["tag"] == "eq:status@1%" and wide["tag"] == "range:budget@50%"
+        assert narrow["queries"] + wide["queries"] == stats.latency.total
+        assert narrow["p50"] < wide["p50"]
+        restored = PhaseHistograms.from_dict(json.loads(json.dumps(stats.to_dict())))
+        assert restored.tags["eq:status@1%"].total == narrow["queries"]
+        assert "Filter range:budget@50% (selectivity 49.00%)" in capsys.readouterr().out
+
+
+def _brute_force(base, queries, k, metric):
+    if metric == "cosine":
+        base = base / np.linalg.norm(base, axis=1, keepdims=True)
+        queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    if metric == "l2-squared":
+        scores = -((queries[:, None, :] - base[None, :, :]) ** 2).sum(-1)
+    else:
+        scores = queries @ base.T
+    return np.argsort(-scores, axis=1, kind="stable")[:, :k]
+
+
+class TestExactTopK:
+    @pytest.mark.parametrize("metric", ["cosine", "dot", "l2-squared"])
+    def test_blocked_matches_brute_force(self, metric, tmp_path):
+        rng = np.random.default_rng(5)
+        base = rng.normal(size=(103, 8)).astype(np.float32)
+        queries = rng.normal(size=(11, 8)).astype(np.float32)
+        np.save(tmp_path / "base.npy", base)
+        mapped = np.load(tmp_path / "base.npy", mmap_mode="r")
+
+        result = exact_top_k(mapped, queries, 5, metric, base_chunk=7, query_block=3)
+
+        np.testing.assert_array_equal(result, _brute_force(base, queries, 5, metric))
+
+    def test_rows_without_vector_never_match(self):
+        base = np.array([[1, 0], [np.nan, np.nan], [0, 1]], dtype=np.float32)
+        result = exact_top_k(base, np.array([[1, 1]], dtype=np.float32), 3, "dot")
+        assert list(result[0][:2]) == [0, 2]
+        assert result[0][2] == 1
+
+
+def test_recall_probe_summary():
+    probe = RecallProbe([{"a", "b"}] * 10, k=2)
+    objects = lambda *ids: [SimpleNamespace(uuid=i) for i in ids]
+    for _ in range(8):
+        probe.record(0, objects("a", "b"))
+    probe.record(0, objects("a", "x"))
+    probe.record(0, objects("y", "x"))
+    assert probe.summary() == {"queries": 10, "mean": 0.85, "p1": 0.0, "p10": 0.0}
+    probe.reset()
+    assert probe.summary()["queries"] == 0
+
+
+class _FakeVectorCollection:
+    """near_vector returns the exact top-k with the last hit replaced."""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.uuids = [f"00000000-0000-0000-0000-{i:012d}" for i in range(len(vectors))]
+        self.config = SimpleNamespace(
+            get=AsyncMock(
+                return_value=SimpleNamespace(
+                    vector_config={
+                        "default": SimpleNamespace(
+                            vector_index_config=SimpleNamespace(
+                                distance_metric=SimpleNamespace(value="l2-squared")
+                            )
+                        )
+                    }
+                )
+            )
+        )
+        self.query = SimpleNamespace(near_vector=self._near_vector)
+
+    def iterator(self, include_vector, return_properties):
+        async def objects():
+            for uuid, vector in zip(self.uuids, self.vectors):
+                yield SimpleNamespace(uuid=uuid, vector={"default": vector.tolist()})
+
+        return objects()
+
+    async def _near_vector(self, near_vector, limit, target_vector, **kwargs):
+        top = _brute_force(self.vectors, np.array([near_vector]), limit, "l2-squared")
+        ids = [self.uuids[i] for i in top[0][:-1]] + ["not-a-neighbour"]
+        return SimpleNamespace(objects=[SimpleNamespace(uuid=i) for i in ids])
+
+
+def test_recall_benchmark_exports_and_caches_ground_truth(tmp_path, capsys):
+    vectors = np.random.default_rng(9).normal(size=(300, 4)).astype(np.float32)
+    collection = _FakeVectorCollection(vectors)
+
+    def run():
+        manager = BenchmarkRecallManager(MagicMock())
+        manager._open_collection = AsyncMock(return_value=(collection, None))
+        manager.async_client.close = AsyncMock()
+        asyncio.run(
+            manager.run_benchmark(
+                collection="Movies",
+                limit=5,
+                qps_levels=(50,),
+                test_duration=1,
+                warmup_duration=0,
+                num_queries=20,
+                cache_dir=str(tmp_path),
+                json_output=True,
+            )
+        )
+        out = capsys.readouterr().out
+        return out, json.loads(out[out.index("{") :])
+
+    out, result = run()
+    assert "Exporting vectors" in out and "Computing exact top-5" in out
+    assert result["distance"] == "l2-squared"
+    assert result["results"][0]["recall_mean"] == 0.8
+    np.testing.assert_array_equal(np.load(tmp_path / "Movies" / "default.npy"), vectors)
+
+    out, result = run()
+    assert "Using cached vectors" in out and "Using cached ground truth" in out
+    assert result["results"][0]["recall_mean"] == 0.8
+
+
+class TestSweep:
+    def _matrix(self, tmp_path, spec):
+        path = tmp_path / "matrix.json"
+        path.write_text(json.dumps(spec))
+        return str(path)
+
+    def test_matrix_is_cartesian_product_over_base(self, tmp_path):
+        cells = _load_sweep_matrix(
+            self._matrix(
+                tmp_path,
+                {
+                    "base": {"replication_factor": 1},
+                    "matrix": {
+                        "vector_index": ["hnsw", "hnsw_pq"],
+                        "rescore_limit": [100, 400],
+                    },
+                },
+            )
+        )
+        assert [label for label, _ in cells] == [
+            "vector_index=hnsw,rescore_limit=100",
+            "vector_index=hnsw,rescore_limit=400",
+            "vector_index=hnsw_pq,rescore_limit=100",
+            "vector_index=hnsw_pq,rescore_limit=400",
+        ]
+        assert cells[3][1] == {
+            "replication_factor": 1,
+            "vector_index": "hnsw_pq",
+            "rescore_limit": 400,
+        }
+
+    def test_explicit_cells_and_unknown_settings(self, tmp_path):
+        cells = _load_sweep_matrix(
+            self._matrix(tmp_path, {"cells": [{}, {"vector_index": "flat"}]})
+        )
+        assert [label for label, _ in cells] == ["base", "vector_index=flat"]
+        with pytest.raises(Exception, match="Unknown collection settings.*ef"):
+            _load_sweep_matrix(self._matrix(tmp_path, {"matrix": {"ef": [64]}}))
+
+    def test_failed_cell_is_reported_and_collections_cleaned_up(self, tmp_path, capsys):
+        matrix = self._matrix(tmp_path, {"matrix": {"vector_index": ["hnsw", "bq"]}})
+        client = MagicMock()
+        # Neither exists up front; both do once their cell has run.
+        client.collections.exists.side_effect = [False, False, True, True]
+        manager = BenchmarkSweepManager(MagicMock(), client)
+        manager.async_client.connect = AsyncMock()
+        manager.async_client.close = AsyncMock()
+        row = {"recall": 0.9, "p99_ms": 4.0, "max_qps": 800, "import_s": 1.5}
+        manager._run_cell = AsyncMock(
+            side_effect=[{**row, "heap_mb": None}, Exception("boom")]
+        )
+        asyncio.run(
+            manager.run_benchmark(
+                matrix=matrix, cache_dir=str(tmp_path), json_output=True
+            )
+        )
+        out = capsys.readouterr().out
+        results = json.loads(out[out.index('{\n  "status"') :])["results"]
+        assert results[0] == {
+            "cell": "vector_index=hnsw",
+            "collection": "Sweep0",
+            **row,
+            "heap_mb": None,
+        }
+        assert results[1]["error"] == "boom"
+        assert [c.args[0] for c in client.collections.delete.call_args_list] == [
+            "Sweep0",
+            "Sweep1",
+        ]
+        manager.async_client.close.assert_awaited_once()
+
+    def test_refuses_to_reuse_existing_collections(self, tmp_path):
+        matrix = self._matrix(tmp_path, {"matrix": {"vector_index": ["hnsw", "bq"]}})
+        client = MagicMock()
+        client.collections.exists.side_effect = lambda name: name == "Sweep1"
+        manager = BenchmarkSweepManager(MagicMock(), client)
+        manager._run_cell = AsyncMock()
+        with pytest.raises(Exception, match="Collections Sweep1 already exist"):
+            asyncio.run(manager.run_benchmark(matrix=matrix, cache_dir=str(tmp_path)))
+        manager._run_cell.assert_not_called()
+        client.collections.delete.assert_not_called()
+
+
+class TestEfSweep:
+    def test_steps_are_combinations_or_default_ef(self):
+        assert _search_param_steps(ef=(), rescore_limit=()) == [
+            {"ef": ef} for ef in (16, 32, 64, 128, 256, 512)
+        ]
+        assert _search_param_steps(ef=(-1,), dynamic_ef_max=(200, 500)) == [
+            {"ef": -1, "dynamic_ef_max": 200},
+            {"ef": -1, "dynamic_ef_max": 500},
+        ]
+
+    def test_best_operating_point(self):
+        results = [
+            {"step": "ef=32", "recall_mean": 0.90, "p99_ms": 2.0},
+            {"step": "ef=64", "recall_mean": 0.96, "p99_ms": 3.0},
+            {"step": "ef=128", "recall_mean": 0.96, "p99_ms": 5.0},
+        ]
+        assert _best_operating_point(results, None)["step"] == "ef=64"
+        assert _best_operating_point(results, 0.95)["step"] == "ef=64"
+        assert _best_operating_point(results, 0.89)["step"] == "ef=32"
+        assert _best_operating_point(results, 0.99) is None
+
+    def test_updates_each_step_and_restores(self, tmp_path, capsys, monkeypatch):
+        vectors = np.random.default_rng(3).normal(size=(200, 4)).astype(np.float32)
+        collection = _FakeVectorCollection(vectors)
+        client = MagicMock()
+        client.collections.get.return_value.config.get.return_value = SimpleNamespace(
+            vector_config={
+                "default": SimpleNamespace(
+                    vector_index_config=SimpleNamespace(
+                        ef=-1, quantizer=SimpleNamespace(rescore_limit=200)
+                    )
+                ),
+                "other": SimpleNamespace(
+                    vector_index_config=SimpleNamespace(
+                        ef=500, quantizer=SimpleNamespace(rescore_limit=50)
+                    )
+                ),
+            }
+        )
+        collection_manager = MagicMock()
+        monkeypatch.setattr(
+            benchmark_manager, "CollectionManager", lambda _: collection_manager
+        )
+        manager = BenchmarkEfSweepManager(MagicMock(), client)
+        manager._open_collection = AsyncMock(return_value=(collection, None))
+        manager.async_client.close = AsyncMock()
+        asyncio.run(
+            manager.run_benchmark(
+                collection="Movies",
+                ef=(32, 64),
+                rescore_limit=(100,),
+                limit=5,
+                test_duration=1,
+                warmup_duration=0,
+                num_queries=10,
+                cache_dir=str(tmp_path),
+                json_output=True,
+            )
+        )
+        out = capsys.readouterr().out
+        result = json.loads(out[out.index('{\n  "status"') :])
+        assert [r["step"] for r in result["results"]] == [
+            "ef=32,rescore_limit=100",
+            "ef=64,rescore_limit=100",
+        ]
+        assert result["results"][0]["recall_mean"] == 0.8
+        # Only the queried vector is stepped and restored to its own values.
+        target = {"collection": "Movies", "target_vector": "default"}
+        assert [c.kwargs for c in collection_manager.update_collection.mock_calls] == [
+            {**target, "ef": 32, "rescore_limit": 100},
+            {**target, "ef": 64, "rescore_limit": 100},
+            {**target, "ef": -1, "rescore_limit": 200},
+        ]
+
+
+class _FakeMixedCollection:
+    """Queries and writes that take a few milliseconds."""
+
+    def __init__(self):
+        self.inserted = []
+        self.updated = []
+        self.deleted = []
+        self.cleaned_up = []
+        self.query = SimpleNamespace(
+            hybrid=self._query,
+            fetch_objects=AsyncMock(
+                return_value=SimpleNamespace(
+                    objects=[SimpleNamespace(vector={"default": [0.1] * 4})]
+                )
+            ),
+        )
+        self.data = SimpleNamespace(
+            insert_many=self._insert_many,
+            update=self._update,
+            delete_by_id=self._delete_by_id,
+            delete_many=self._delete_many,
+        )
+
+    async def _query(self, **kwargs):
+        await asyncio.sleep(0.002)
+        return SimpleNamespace(objects=[])
+
+    async def _insert_many(self, objects):
+        await asyncio.sleep(0.005)
+        assert len(objects[0].vector["default"]) == 4
+        start = len(self.inserted)
+        ids = [f"00000000-0000-0000-0000-{start + i:012d}" for i in range(len(objects))]
+        self.inserted += ids
+        return SimpleNamespace(errors={}, uuids=dict(enumerate(ids)))
+
+    async def _update(self, uuid, properties):
+        self.updated.append(uuid)
+
+    async def _delete_by_id(self, uuid):
+        self.deleted.append(uuid)
+
+    async def _delete_many(self, where):
+        self.cleaned_up += where.value
+
+
+def test_mixed_benchmark_reports_reads_and_writes(capsys):
+    collection = _FakeMixedCollection()
+    manager = BenchmarkMixedManager(MagicMock())
+    manager._open_collection = AsyncMock(return_value=(collection, None))
+    manager.async_client.close = AsyncMock()
+    asyncio.run(
+        manager.run_benchmark(
+            collection="Movies",
+            qps=20,
+            duration=2,
+            insert_rate=200,
+            batch_size=10,
+            update_rate=10,
+            delete_rate=5,
+            json_output=True,
+        )
+    )
+    out = capsys.readouterr().out
+    result = json.loads(out[out.index('{\n  "status"') :])
+
+    summary = {row["operation"]: row for row in result["summary"]}
+    assert set(summary) == {"read", "insert", "update", "delete"}
+    assert summary["read"]["queries"] >= 30
+    assert result["objects_written"] == sum(
+        row["objects_written"] for row in result["timeline"]
+    )
+    assert len(collection.inserted) == pytest.approx(400, abs=20)
+    assert len(result["timeline"]) >= 2
+    assert {"read_p99_ms", "write_p99_ms", "objects_written"} <= set(
+        result["timeline"][0]
+    )
+    assert set(collection.updated) <= set(collection.inserted)
+    assert set(collection.deleted) | set(collection.cleaned_up) == set(
+        collection.inserted
+    )
+    assert not set(collection.deleted) & set(collection.cleaned_up)
+
+
+def test_mixed_benchmark_reports_operations_that_never_ran(capsys):
+    # Without inserts there is nothing to update or delete.
+    collection = _FakeMixedCollection()
+    manager = BenchmarkMixedManager(MagicMock())
+    manager._open_collection = AsyncMock(return_value=(collection, None))
+    manager.async_client.close = AsyncMock()
+    asyncio.run(
+        manager.run_benchmark(
+            collection="Movies",
+            qps=20,
+            duration=1,
+            insert_rate=0,
+            update_rate=10,
+            delete_rate=5,
+            json_output=True,
+        )
+    )
+    out = capsys.readouterr().out
+    result = json.loads(out[out.index('{\n  "status"') :])
+
+    assert "without --insert-rate" in out
+    summary = {row["operation"]: row for row in result["summary"]}
+    assert set(summary) == {"read"}
+    assert summary["read"]["queries"] >= 15
+    assert not collection.updated and not collection.deleted
+
+
+class TestTenantWorkload:
+    def test_tiers_and_zipf_sampling(self):
+        workload = TenantWorkload([f"T-{i}" for i in range(1000)], "zipf", 1.0, 7)
+        assert workload.tier_sizes() == [10, 90, 400, 500]
+        draws = [next(d) for d in [workload.sampler()] for _ in range(50000)]
+        top = sum(1 for tenant, _ in draws if tenant == "T-0") / len(draws)
+        # P(rank 1) = 1 / H(1000) ~ 0.1336
+        assert top == pytest.approx(0.1336, abs=0.01)
+        assert dict(draws)["T-0"] == "tenant:top 1%"
+        assert dict(draws)["T-999"] == "tenant:50-100%"
+        # Separate streams draw differently; the same stream repeats.
+        assert list(itertools.islice(workload.sampler(1), 50)) != list(
+            itertools.islice(workload.sampler(2), 50)
+        )
+        assert list(itertools.islice(workload.sampler(1), 50)) == list(
+            itertools.islice(workload.sampler(1), 50)
+        )
+
+    def test_uniform_sampling(self):
+        workload = TenantWorkload(["a", "b", "c", "d"], "uniform")
+        counts = Counter(t for t, _ in itertools.islice(workload.sampler(), 40000))
+        assert all(c == pytest.approx(10000, rel=0.05) for c in counts.values())
+
+    def test_build_from_suffix_and_list(self):
+        status = SimpleNamespace(activity_status=SimpleNamespace(value="ACTIVE"))
+        cold = SimpleNamespace(activity_status=SimpleNamespace(value="INACTIVE"))
+        names = ["Tenant-10", "Tenant-2", "Tenant-1", "Other"]
+        collection = SimpleNamespace(
+            name="Movies",
+            config=SimpleNamespace(
+                get=AsyncMock(
+                    return_value=SimpleNamespace(
+                        multi_tenancy_config=SimpleNamespace(enabled=True)
+                    )
+                )
+            ),
+            tenants=SimpleNamespace(
+                get=AsyncMock(
+                    return_value={n: cold if n == "Tenant-2" else status for n in names}
+                )
+            ),
+        )
+        manager = BenchmarkQPSManager(MagicMock())
+        build = lambda tenants, suffix: asyncio.run(
+            manager._build_tenant_workload(collection, tenants, suffix, "zipf", 1.2, 42)
+        )
+        assert build(None, "Tenant").tenants == ["Tenant-1", "Tenant-2", "Tenant-10"]
+        assert build("Other, Tenant-1", None).tenants == ["Other", "Tenant-1"]
+        assert sorted(build("all", None).tenants) == sorted(names)
+        with pytest.raises(Exception, match="not found.*Missing"):
+            build("Tenant-1,Missing", None)
+
+    def test_queries_are_routed_per_tenant(self):
+        queried = []
+
+        def with_tenant(name):
+            async def hybrid(**kwargs):
+                queried.append(name)
+                return SimpleNamespace(objects=[])
+
+            return SimpleNamespace(query=SimpleNamespace(hybrid=hybrid))
+
+        manager = BenchmarkQPSManager(MagicMock())
+        manager.tenant_workload = TenantWorkload(
+            [f"T-{i}" for i in range(100)], "zipf", 1.0
+        )
+        stats, _ = asyncio.run(
+            manager._run_phase(
+                SimpleNamespace(with_tenant=with_tenant),
+                ["q"],
+                10,
+                200,
+                1,
+                "Main Test",
+                False,
+                None,
+                "hybrid",
+                float("inf"),
+                report=False,
+            )
+        )
+        assert len(queried) == stats.latency.total
+        assert Counter(queried).most_common(1)[0][0] == "T-0"
+        tiers = manager._tenant_tier_summaries(stats)
+        assert [t["tier"] for t in tiers][0] == "top 1%"
+        assert sum(t["queries"] for t in tiers) == stats.latency.total
+        assert [t["tenants"] for t in tiers] == [1, 9, 40, 50][: len(tiers)]
+
+
+class TestQueryCorpus:
+    def test_from_texts_ranks_words_and_phrases(self):
+        corpus = QueryCorpus.from_texts(
+            [
+                "The space station drifts. Space station crew!",
+                "A crew of 4 in space",
+                "The deep ocean",
+            ],
+            5,
+        )
+        # Most frequent first; ties keep the order they were first seen in.
+        assert corpus.terms == ["space", "station", "crew", "space station", "drifts"]
+
+    def test_zipf_sampling_and_build_from_cursor(self):
+        corpus = QueryCorpus([f"term {i}" for i in range(1000)], "zipf", 1.0, 3)
+        draws = list(itertools.islice(corpus.sampler(), 50000))
+        assert draws.count("term 0") / len(draws) == pytest.approx(0.1336, abs=0.01)
+
+        async def iterator(return_properties):
+            assert return_properties == ["title", "genres"]
+            for i in range(100):
+                yield SimpleNamespace(
+                    properties={"title": f"Movie {i % 3}", "genres": ["drama"]}
+                )
+
+        text = SimpleNamespace(value="text")
+        collection = SimpleNamespace(
+            name="Movies",
+            iterator=iterator,
+            config=SimpleNamespace(
+                get=AsyncMock(
+                    return_value=SimpleNamespace(
+                        properties=[
+                            SimpleNamespace(name="title", data_type=text),
+                            SimpleNamespace(
+                                name="genres", data_type=SimpleNamespace(value="text[]")
+                            ),
+                            SimpleNamespace(
+                                name="budget", data_type=SimpleNamespace(value="int")
+                            ),
+                        ]
+                    )
+                )
+            ),
+        )
+        manager = BenchmarkQPSManager(MagicMock())
+        built = asyncio.run(
+            manager._build_query_corpus(collection, 10, [], 30, "zipf", 1.0, 42)
+        )
+        assert built.terms == ["movie", "drama"]
+        with pytest.raises(Exception, match="Not text properties.*budget"):
+            asyncio.run(
+                manager._build_query_corpus(
+                    collection, 10, ["budget"], 30, "zipf", 1.0, 42
+                )
+            )
+
+    def test_latency_is_attributed_per_term(self):
+        async def hybrid(query, **kwargs):
+            await asyncio.sleep(0.02 if query == "slow" else 0.001)
+            return SimpleNamespace(objects=[])
+
+        manager = BenchmarkQPSManager(MagicMock())
+        manager.query_corpus = QueryCorpus(["fast", "slow", "other"], "zipf", 0.5)
+        manager.slowest_terms = 2
+        stats, _ = asyncio.run(
+            manager._run_phase(
+                SimpleNamespace(query=SimpleNamespace(hybrid=hybrid)),
+                ["fast", "slow", "other"],
+                10,
+                100,
+                1,
+                "Main Test",
+                False,
+                None,
+                "hybrid",
+                float("inf"),
+                report=False,
+            )
+        )
+        assert sum(count for count, _, _ in stats.terms.values()) == stats.latency.total
+        restored = PhaseHistograms.from_dict(json.loads(json.dumps(stats.to_dict())))
+        assert restored.terms == stats.terms
+        slowest = manager._slowest_term_summaries(restored)
+        assert len(slowest) == 2
+        assert slowest[0]["term"] == "slow"
+        assert slowest[0]["mean_ms"] >= 20
+
+
+class _FakeTenantCollection:
+    """Tenants that need `activation_s` per million objects (plus 20ms) to
+    become queryable once activated."""
+
+    name = "Movies"
+
+    def __init__(self, objects, auto_activation=True):
+        self.objects = objects
+        self.status = {t: TenantActivityStatus.ACTIVE for t in objects}
+        self.status["Cold"] = TenantActivityStatus.INACTIVE
+        self.ready_at = {}
+        self.config = SimpleNamespace(
+            get=AsyncMock(
+                return_value=SimpleNamespace(
+                    multi_tenancy_config=SimpleNamespace(
+                        enabled=True, auto_tenant_activation=auto_activation
+                    )
+                )
+            )
+        )
+        self.tenants = SimpleNamespace(
+            get=self._get, get_by_names=self._get_by_names, update=self._update
+        )
+
+    async def _get(self):
+        return {t: Tenant(name=t, activity_status=s) for t, s in self.status.items()}
+
+    async def _get_by_names(self, names):
+        return {t: v for t, v in (await self._get()).items() if t in names}
+
+    async def _update(self, tenants):
+        for tenant in tenants if isinstance(tenants, list) else [tenants]:
+            self._set(tenant.name, tenant.activity_status)
+
+    def _set(self, name, status):
+        self.status[name] = status
+        if status == TenantActivityStatus.ACTIVE:
+            self.ready_at[name] = (
+                time.perf_counter() + 0.02 + self.objects[name] / 1e6 * 0.2
+            )
+
+    def with_tenant(self, name):
+        async def over_all(filters, total_count):
+            return SimpleNamespace(total_count=self.objects[name])
+
+        async def fetch_objects(limit):
+            if self.status[name] != TenantActivityStatus.ACTIVE:
+                if (
+                    not self.config.get.return_value.multi_tenancy_config.auto_tenant_activation
+                ):
+                    raise Exception(f"tenant {name} is not active")
+                self._set(name, TenantActivityStatus.ACTIVE)
+            if time.perf_counter() < self.ready_at.get(name, 0):
+                raise Exception(f"tenant {name} is loading")
+            return SimpleNamespace(objects=[])
+
+        return SimpleNamespace(
+            aggregate=SimpleNamespace(over_all=over_all),
+            query=SimpleNamespace(fetch_objects=fetch_objects),
+        )
+
+
+class TestColdTenants:
+    def _run(self, collection, capsys, **kwargs):
+        manager = BenchmarkColdTenantManager(MagicMock())
+        manager._open_collection = AsyncMock(return_value=(collection, None))
+        manager.async_client.close = AsyncMock()
+        asyncio.run(
+            manager.run_benchmark(
+                collection="Movies", poll_interval=0.005, json_output=True, **kwargs
+            )
+        )
+        out = capsys.readouterr().out
+        return json.loads(out[out.index('{\n  "status"') :])
+
+    @pytest.mark.parametrize("activation", ["auto", "explicit"])
+    def test_time_to_first_query_against_objects(self, capsys, activation):
+        objects = {f"T-{i}": n for i, n in enumerate([10, 1000, 100000, 1000000])}
+        collection = _FakeTenantCollection(objects)
+        result = self._run(
+            collection, capsys, activation=activation, concurrency=2, sample=10
+        )
+
+        # Only the active tenants are sampled, and they end up active again.
+        rows = result["tenants"]
+        assert [r["tenant"] for r in rows] == list(objects)
+        assert [r["objects"] for r in rows] == list(objects.values())
+        assert all(r["error"] is None for r in rows)
+        assert rows[-1]["seconds"] > rows[0]["seconds"] + 0.1
+        assert rows[-1]["attempts"] > 1
+        assert collection.status["Cold"] == TenantActivityStatus.INACTIVE
+        assert all(collection.status[t] == TenantActivityStatus.ACTIVE for t in objects)
+        summary = result["summary"]
+        assert summary["succeeded"] == 4
+        assert [b["objects"] for b in summary["by_objects"]] == [
+            "10-99",
+            "1000-9999",
+            "100000-999999",
+            "1000000-9999999",
+        ]
+        assert summary["seconds_per_million_objects"] == pytest.approx(0.2, abs=0.1)
+
+    def test_sample_and_missing_auto_activation(self, capsys):
+        objects = {f"T-{i}": 100 for i in range(10)}
+        result = self._run(_FakeTenantCollection(objects), capsys, sample=3, seed=1)
+        assert len(result["tenants"]) == 3
+        assert result["summary"]["seconds_per_million_objects"] is None
+
+        with pytest.raises(Exception, match="auto tenant activation"):
+            self._run(_FakeTenantCollection(objects, auto_activation=False), capsys)
+
+    def test_failed_run_reactivates_the_sampled_tenants(self, capsys):
+        objects = {f"T-{i}": 100 for i in range(3)}
+        collection = _FakeTenantCollection(objects)
+        manager = BenchmarkColdTenantManager(MagicMock())
+        manager._open_collection = AsyncMock(return_value=(collection, None))
+        manager.async_client.close = AsyncMock()
+        manager._wait_for_status = AsyncMock(side_effect=Exception("timed out"))
+        with pytest.raises(Exception, match="timed out"):
+            asyncio.run(manager.run_benchmark(collection="Movies"))
+
+        assert all(collection.status[t] == TenantActivityStatus.ACTIVE for t in objects)
+        assert collection.status["Cold"] == TenantActivityStatus.INACTIVE
+        assert "Setting 3 tenants back to ACTIVE" in capsys.readouterr().out
+        manager.async_client.close.assert_awaited_once()
+
+    def test_tenants_that_cannot_be_reactivated_are_reported(self, capsys):
+        objects = {f"T-{i}": 100 for i in range(2)}
+        collection = _FakeTenantCollection(objects)
+        update = collection.tenants.update
+
+        async def _update(tenants):
+            if isinstance(tenants, list) and all(
+                t.activity_status == TenantActivityStatus.ACTIVE for t in tenants
+            ):
+                raise Exception("cluster unavailable")
+            await update(tenants)
+
+        collection.tenants.update = _update
+        manager = BenchmarkColdTenantManager(MagicMock())
+        manager._open_collection = AsyncMock(return_value=(collection, None))
+        manager.async_client.close = AsyncMock()
+        manager._wait_for_status = AsyncMock(side_effect=Exception("timed out"))
+        with pytest.raises(Exception, match="timed out"):
+            asyncio.run(manager.run_benchmark(collection="Movies"))
+
+        assert (
+            "Warning: could not set 2 tenants back to ACTIVE (T-0, T-1): "
+            "cluster unavailable" in capsys.readouterr().out
+        )
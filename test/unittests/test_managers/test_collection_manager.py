@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, patch, PropertyMock
 from weaviate.exceptions import WeaviateConnectionError
+from weaviate.collections.classes.config import _BQConfig
 from weaviate_cli.managers.collection_manager import CollectionManager
 import weaviate.classes.config as wvc
 
@@ -200,6 +201,83 @@ def test_update_collection(mock_client, mock_wvc_object_ttl):
     )
 
 
+def _hnsw_config(quantizer):
+    return MagicMock(
+        replication_config=MagicMock(factor=3),
+        multi_tenancy_config=MagicMock(enabled=False),
+        vector_config={
+            "default": MagicMock(
+                vector_index_config=MagicMock(
+                    vector_index_type=MagicMock(return_value="hnsw"),
+                    quantizer=quantizer,
+                )
+            )
+        },
+    )
+
+
+def test_update_collection_search_params(mock_client):
+    mock_client.collections = MagicMock()
+    mock_client.collections.exists.side_effect = [True, True]
+    mock_collection = MagicMock()
+    mock_client.collections.get.return_value = mock_collection
+    mock_collection.config.get.return_value = _hnsw_config(
+        _BQConfig(cache=False, rescore_limit=200)
+    )
+
+    CollectionManager(mock_client).update_collection(
+        collection="TestCollection", ef=-1, dynamic_ef_max=400, rescore_limit=500
+    )
+
+    (vector_update,) = mock_collection.config.update.call_args.kwargs["vector_config"]
+    assert vector_update.name == "default"
+    index_update = vector_update.vectorIndexConfig
+    assert index_update.ef == -1
+    assert index_update.dynamicEfMax == 400
+    assert index_update.dynamicEfMin is None
+    assert index_update.quantizer.rescoreLimit == 500
+
+
+def test_update_collection_search_params_of_target_vector(mock_client):
+    mock_client.collections = MagicMock()
+    mock_client.collections.exists.return_value = True
+    mock_collection = MagicMock()
+    mock_client.collections.get.return_value = mock_collection
+    config = _hnsw_config(None)
+    config.vector_config["other"] = config.vector_config["default"]
+    mock_collection.config.get.return_value = config
+
+    CollectionManager(mock_client).update_collection(
+        collection="TestCollection", ef=64, target_vector="other"
+    )
+
+    (vector_update,) = mock_collection.config.update.call_args.kwargs["vector_config"]
+    assert vector_update.name == "other"
+    assert vector_update.vectorIndexConfig.ef == 64
+    with pytest.raises(Exception, match="Named vector 'missing' not found"):
+        CollectionManager(mock_client).update_collection(
+            collection="TestCollection", ef=64, target_vector="missing"
+        )
+
+
+def test_update_collection_rescore_limit_needs_quantizer(mock_client):
+    mock_client.collections = MagicMock()
+    mock_client.collections.exists.return_value = True
+    mock_collection = MagicMock()
+    mock_client.collections.get.return_value = mock_collection
+    mock_collection.config.get.return_value = _hnsw_config(None)
+
+    with pytest.raises(Exception, match="no BQ, SQ or RQ quantizer"):
+        CollectionManager(mock_client).update_collection(
+            collection="TestCollection", rescore_limit=500
+        )
+    with pytest.raises(Exception, match="can't be combined with vector_index"):
+        CollectionManager(mock_client).update_collection(
+            collection="TestCollection", vector_index="hnsw", ef=64
+        )
+    mock_collection.config.update.assert_not_called()
+
+
 def test_update_nonexistent_collection(mock_client):
     mock_collections = MagicMock()
     mock_client.collections = mock_collections
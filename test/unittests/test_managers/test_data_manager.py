@@ -1,8 +1,19 @@
+import json
 import threading
+import time
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
 
 import pytest
-from unittest.mock import MagicMock, patch
-from weaviate_cli.managers.data_manager import DataManager
+from unittest.mock import AsyncMock, MagicMock, patch
+import numpy as np
+from weaviate_cli.managers.data_manager import (
+    DataManager,
+    _NpyStreamWriter,
+    _ParquetRowWriter,
+    _WorkScheduler,
+)
 import weaviate.classes.config as wvc
 from weaviate.collections.classes.tenants import TenantActivityStatus
 
@@ -672,6 +683,102 @@ class TestDeleteDataParallel:
         assert len(processed) == 1
 
 
+# ---------------------------------------------------------------------------
+# _WorkScheduler – shared in-flight budget for update/delete
+# ---------------------------------------------------------------------------
+
+
+class TestWorkScheduler:
+    def test_split_spreads_page_over_all_workers(self):
+        with _WorkScheduler(4) as scheduler:
+            units = scheduler.split(list(range(10)))
+        assert len(units) == 4
+        assert [i for unit in units for i in unit] == list(range(10))
+
+    def test_split_empty_page(self):
+        with _WorkScheduler(4) as scheduler:
+            assert scheduler.split([]) == []
+
+    def test_in_flight_budget_shared_by_units_and_requests(self):
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def _work():
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return 1
+
+        with _WorkScheduler(3) as scheduler:
+            futures = [scheduler.submit(_work) for _ in range(12)]
+            with scheduler.request():
+                _work()
+            assert sum(f.result() for f in futures) == 12
+        assert peak <= 3
+
+    def test_seeded_randomized_update_is_deterministic(self, mock_client):
+        """Every object gets the same random properties and vector on every
+        seeded run, however the work units are scheduled. Release dates count
+        back from now, so the clock is frozen across the runs."""
+        objects = [
+            SimpleNamespace(uuid=f"uuid-{i}", properties={}, vector=[0.0] * 4)
+            for i in range(40)
+        ]
+
+        def _run() -> dict:
+            replaced = {}
+            col = MagicMock()
+            col.name = "TestCollection"
+            col.__len__.return_value = len(objects)
+            col.query.fetch_objects.side_effect = (
+                lambda limit, **kwargs: SimpleNamespace(objects=objects[:limit])
+            )
+
+            def _replace(uuid, properties, vector):
+                time.sleep(0.001 * (int(uuid.split("-")[1]) % 3))
+                replaced[uuid] = (properties, vector)
+
+            col.with_consistency_level.return_value.data.replace.side_effect = _replace
+            with _WorkScheduler(4) as scheduler:
+                DataManager(mock_client)._DataManager__update_data(
+                    col, len(objects), None, True, False, scheduler=scheduler
+                )
+            return replaced
+
+        class _FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls(2024, 1, 1, tzinfo=tz)
+
+        with patch("weaviate_cli.managers.data_manager.datetime", _FrozenDatetime):
+            first, second = _run(), _run()
+        assert len(first) == len(objects)
+        assert all(len(vector) == 4 for _, vector in first.values())
+        assert first == second
+
+    def test_non_mt_delete_walks_cursor_and_deletes_in_units(self, mock_client):
+        """A single-tenant delete is split into several concurrent units."""
+        manager = DataManager(mock_client)
+        col = _make_non_mt_col()
+        _setup_mock_client_with_col(mock_client, col)
+        objects = [MagicMock(uuid=str(uuid.uuid4())) for _ in range(8)]
+        col.query.fetch_objects.return_value = MagicMock(objects=objects)
+        cl_col = MagicMock()
+        col.with_consistency_level.return_value = cl_col
+
+        manager.delete_data(collection="TestCollection", limit=8, parallel_workers=4)
+
+        kwargs = col.query.fetch_objects.call_args.kwargs
+        assert kwargs["after"] is None
+        assert kwargs["return_properties"] is False
+        assert cl_col.data.delete_many.call_count == 4
+
+
 # ---------------------------------------------------------------------------
 # create_data – parallel tenant processing
 # ---------------------------------------------------------------------------
@@ -935,3 +1042,436 @@ class TestCreateDataConcurrentRequestsScaling:
 
         # Single tenant: no reduction
         assert captured_concurrent == [8]
+
+
+# ---------------------------------------------------------------------------
+# query_data – async fan-out across tenants
+# ---------------------------------------------------------------------------
+
+
+class TestQueryDataFanOut:
+    def _make_obj(self, score):
+        obj = MagicMock()
+        obj.uuid = str(uuid.uuid4())
+        obj.properties = {"title": f"title-{score}"}
+        obj.metadata.score = score
+        obj.metadata.distance = None
+        obj.metadata.certainty = None
+        return obj
+
+    def _make_async_client(self, responses):
+        async_client = MagicMock()
+        async_client.connect = AsyncMock()
+        async_client.close = AsyncMock()
+        async_col = MagicMock()
+        async_client.collections.get.return_value.with_consistency_level.return_value = (
+            async_col
+        )
+
+        def _with_tenant(name):
+            tenant_col = MagicMock()
+            tenant_col.query.hybrid = AsyncMock(return_value=responses[name])
+            return tenant_col
+
+        async_col.with_tenant.side_effect = _with_tenant
+        return async_client
+
+    def _make_col(self, tenant_names):
+        col = _make_mt_col(tenant_names)
+        col.tenants.get.return_value = {
+            name: MagicMock(activity_status=TenantActivityStatus.ACTIVE)
+            for name in tenant_names
+        }
+        return col
+
+    def test_all_tenants_queried_on_async_client(self, mock_client):
+        tenants = ["Tenant-0", "Tenant-1", "Tenant-2"]
+        responses = {t: MagicMock(objects=[self._make_obj(0.5)]) for t in tenants}
+        async_client = self._make_async_client(responses)
+        col = self._make_col(tenants)
+        _setup_mock_client_with_col(mock_client, col)
+
+        manager = DataManager(mock_client, async_client)
+        manager.query_data(
+            collection="TestCollection", search_type="hybrid", concurrency=2
+        )
+
+        async_col = (
+            async_client.collections.get.return_value.with_consistency_level.return_value
+        )
+        assert (
+            sorted(c.args[0] for c in async_col.with_tenant.call_args_list) == tenants
+        )
+        col.with_tenant.assert_not_called()
+        async_client.close.assert_awaited_once()
+
+    def test_merge_results_returns_global_top_k(self, mock_client, capsys):
+        responses = {
+            "Tenant-0": MagicMock(objects=[self._make_obj(0.9), self._make_obj(0.1)]),
+            "Tenant-1": MagicMock(objects=[self._make_obj(0.7), self._make_obj(0.3)]),
+        }
+        async_client = self._make_async_client(responses)
+        col = self._make_col(list(responses))
+        _setup_mock_client_with_col(mock_client, col)
+
+        manager = DataManager(mock_client, async_client)
+        manager.query_data(
+            collection="TestCollection",
+            search_type="hybrid",
+            limit=2,
+            properties="title",
+            merge_results=True,
+            json_output=True,
+        )
+
+        out = capsys.readouterr().out
+        merged = json.loads(out[: out.index('{\n  "latency_summary"')])
+        assert [o["score"] for o in merged["objects"]] == [0.9, 0.7]
+        assert [o["tenant"] for o in merged["objects"]] == ["Tenant-0", "Tenant-1"]
+
+    def test_merge_results_requires_ranked_search(self, mock_client):
+        col = self._make_col(["Tenant-0", "Tenant-1"])
+        _setup_mock_client_with_col(mock_client, col)
+        manager = DataManager(mock_client, MagicMock())
+        with pytest.raises(Exception, match="--merge_results can only be used"):
+            manager.query_data(
+                collection="TestCollection", search_type="fetch", merge_results=True
+            )
+
+
+class TestQueryDataRepeat:
+    def _make_col(self):
+        col = _make_non_mt_col()
+        col.tenants.get.side_effect = Exception("multi-tenancy is not enabled")
+        response = MagicMock(objects=[])
+        col.with_consistency_level.return_value.query.fetch_objects.return_value = (
+            response
+        )
+        return col
+
+    def test_repeat_runs_warmup_plus_measured_queries(self, mock_client, capsys):
+        col = self._make_col()
+        _setup_mock_client_with_col(mock_client, col)
+        manager = DataManager(mock_client)
+        manager.query_data(
+            collection="TestCollection", repeat=5, warmup=2, concurrency=1
+        )
+
+        fetch = col.with_consistency_level.return_value.query.fetch_objects
+        assert fetch.call_count == 7
+        out = capsys.readouterr().out
+        assert "over 5 runs (2 warmup discarded" in out
+        assert "p99" in out
+
+    def test_repeat_json_reports_latency_stats(self, mock_client, capsys):
+        col = self._make_col()
+        _setup_mock_client_with_col(mock_client, col)
+        manager = DataManager(mock_client)
+        manager.query_data(
+            collection="TestCollection", repeat=4, concurrency=2, json_output=True
+        )
+
+        # One JSON document: the results of the last run plus the latencies.
+        doc = json.loads(capsys.readouterr().out)
+        assert doc["total"] == 0
+        stats = doc["repeat"]
+        assert stats["runs"] == 4
+        assert stats["concurrency"] == 2
+        lat = stats["latency_ms"]
+        assert lat["min"] <= lat["p50"] <= lat["p99"] <= lat["max"]
+
+    def test_repeat_runs_one_query_at_a_time_by_default(self, mock_client, capsys):
+        col = self._make_col()
+        _setup_mock_client_with_col(mock_client, col)
+        with patch("weaviate_cli.managers.data_manager.ThreadPoolExecutor") as executor:
+            DataManager(mock_client).query_data(
+                collection="TestCollection", repeat=4, json_output=True
+            )
+        executor.assert_not_called()
+        assert json.loads(capsys.readouterr().out)["repeat"]["concurrency"] == 1
+
+    def test_repeat_rejects_merge_results(self, mock_client):
+        col = self._make_col()
+        _setup_mock_client_with_col(mock_client, col)
+        manager = DataManager(mock_client, MagicMock())
+        with pytest.raises(Exception, match="cannot be combined with --repeat"):
+            manager.query_data(
+                collection="TestCollection",
+                search_type="hybrid",
+                merge_results=True,
+                repeat=3,
+            )
+
+    def test_only_requested_schema_properties_are_returned(self, mock_client):
+        col = self._make_col()
+        title, keywords = MagicMock(), MagicMock()
+        title.name, keywords.name = "title", "keywords"
+        col.config.get.return_value.properties = [title, keywords]
+        _setup_mock_client_with_col(mock_client, col)
+        DataManager(mock_client).query_data(
+            collection="TestCollection", properties="title, notInSchema"
+        )
+
+        fetch = col.with_consistency_level.return_value.query.fetch_objects
+        assert fetch.call_args.kwargs["return_properties"] == ["title"]
+
+
+class TestQueryDataFromFile:
+    def _make_async_client(self, method, response):
+        async_client = MagicMock()
+        async_client.connect = AsyncMock()
+        async_client.close = AsyncMock()
+        async_col = (
+            async_client.collections.get.return_value.with_consistency_level.return_value
+        )
+        setattr(async_col.query, method, AsyncMock(return_value=response))
+        return async_client, getattr(async_col.query, method)
+
+    def _make_response(self):
+        obj = MagicMock()
+        obj.uuid = str(uuid.uuid4())
+        obj.properties = {"title": "Alien", "keywords": "space"}
+        obj.metadata.score = 0.8
+        obj.metadata.distance = 0.2
+        return MagicMock(objects=[obj])
+
+    def _make_col(self):
+        col = _make_non_mt_col()
+        col.tenants.get.side_effect = Exception("multi-tenancy is not enabled")
+        return col
+
+    def test_text_queries_written_as_jsonl(self, mock_client, tmp_path, capsys):
+        queries_file = tmp_path / "queries.txt"
+        queries_file.write_text("alien invasion\n\nromantic comedy\nheist\n")
+        output = tmp_path / "results.jsonl"
+        async_client, hybrid = self._make_async_client("hybrid", self._make_response())
+        _setup_mock_client_with_col(mock_client, self._make_col())
+
+        manager = DataManager(mock_client, async_client)
+        manager.query_data(
+            collection="TestCollection",
+            search_type="hybrid",
+            properties="title",
+            queries_file=str(queries_file),
+            output=str(output),
+            concurrency=2,
+        )
+
+        assert hybrid.await_count == 3
+        rows = [json.loads(line) for line in output.read_text().splitlines()]
+        assert sorted(r["query"] for r in rows) == [
+            "alien invasion",
+            "heist",
+            "romantic comedy",
+        ]
+        hit = rows[0]["results"][0]
+        assert set(hit) == {"uuid", "score", "distance", "title"}
+        assert hit["score"] == 0.8
+        assert "3 hybrid queries" in capsys.readouterr().out
+        async_client.close.assert_awaited_once()
+
+    def test_npy_queries_run_as_near_vector(self, mock_client, tmp_path, capsys):
+        queries_file = tmp_path / "queries.npy"
+        np.save(queries_file, np.random.rand(5, 4).astype(np.float32))
+        async_client, near_vector = self._make_async_client(
+            "near_vector", self._make_response()
+        )
+        _setup_mock_client_with_col(mock_client, self._make_col())
+
+        manager = DataManager(mock_client, async_client)
+        manager.query_data(
+            collection="TestCollection",
+            queries_file=str(queries_file),
+            json_output=True,
+        )
+
+        assert near_vector.await_count == 5
+        assert len(near_vector.await_args.kwargs["near_vector"]) == 4
+        summary = json.loads(capsys.readouterr().out)
+        assert summary["queries_run"] == 5
+        assert summary["queries_failed"] == 0
+        assert summary["output"] == f"{queries_file}.results.jsonl"
+
+    def test_text_queries_require_ranked_search(self, mock_client, tmp_path):
+        queries_file = tmp_path / "queries.txt"
+        queries_file.write_text("alien\n")
+        _setup_mock_client_with_col(mock_client, self._make_col())
+        manager = DataManager(mock_client, MagicMock())
+        with pytest.raises(Exception, match="can only be used with vector"):
+            manager.query_data(
+                collection="TestCollection",
+                search_type="fetch",
+                queries_file=str(queries_file),
+            )
+
+
+class TestQueryDataNearVector:
+    def _make_col(self, stored_vector):
+        col = _make_non_mt_col()
+        col.tenants.get.side_effect = Exception("multi-tenancy is not enabled")
+        col.query.fetch_objects.return_value = MagicMock(
+            objects=[MagicMock(vector=stored_vector)]
+        )
+        near_vector = col.with_consistency_level.return_value.query.near_vector
+        near_vector.return_value = MagicMock(objects=[])
+        return col, near_vector
+
+    def test_inline_vector(self, mock_client):
+        col, near_vector = self._make_col({"default": [0.0] * 3})
+        _setup_mock_client_with_col(mock_client, col)
+        DataManager(mock_client).query_data(
+            collection="TestCollection",
+            search_type="near_vector",
+            vector="[0.1, 0.2, 0.3]",
+        )
+
+        assert near_vector.call_args.kwargs["near_vector"] == pytest.approx(
+            [0.1, 0.2, 0.3]
+        )
+        col.query.fetch_objects.assert_not_called()
+
+    def test_generated_vectors_use_detected_named_vector_dims(self, mock_client):
+        col, near_vector = self._make_col({"title": [0.0] * 8, "plot": [0.0] * 16})
+        _setup_mock_client_with_col(mock_client, col)
+        DataManager(mock_client).query_data(
+            collection="TestCollection",
+            search_type="near_vector",
+            target_vector="plot",
+            repeat=3,
+            concurrency=1,
+        )
+
+        assert near_vector.call_count == 3
+        sent = [c.kwargs["near_vector"] for c in near_vector.call_args_list]
+        assert all(len(v) == 16 for v in sent)
+        assert sent[0] != sent[1]
+        assert near_vector.call_args.kwargs["target_vector"] == "plot"
+
+    def test_fvecs_file_is_memory_mapped(self, tmp_path):
+        vectors = np.random.rand(3, 5).astype(np.float32)
+        path = tmp_path / "queries.fvecs"
+        with open(path, "wb") as f:
+            for vec in vectors:
+                f.write(np.int32(5).tobytes() + vec.tobytes())
+
+        loaded = DataManager._load_vectors_file(str(path))
+        assert loaded.shape == (3, 5)
+        np.testing.assert_array_equal(loaded, vectors)
+
+    def test_invalid_inline_vector_raises(self, mock_client):
+        col, _ = self._make_col([0.0] * 3)
+        _setup_mock_client_with_col(mock_client, col)
+        with pytest.raises(Exception, match="Invalid --vector"):
+            DataManager(mock_client).query_data(
+                collection="TestCollection", search_type="near_vector", vector="a,b"
+            )
+
+
+# ---------------------------------------------------------------------------
+# export_data – streaming export
+# ---------------------------------------------------------------------------
+
+
+class TestExportData:
+    def test_npy_stream_writer_roundtrip(self, tmp_path):
+        path = str(tmp_path / "vectors.npy")
+        writer = _NpyStreamWriter(path, 3)
+        writer.append(np.ones((2, 3), dtype=np.float32))
+        writer.append_missing(1)
+        writer.append(np.zeros((4, 3), dtype=np.float32))
+        writer.close()
+
+        loaded = np.load(path)
+        assert loaded.shape == (7, 3)
+        assert loaded.dtype == np.float32
+        assert np.isnan(loaded[2]).all()
+        assert (loaded[:2] == 1).all() and (loaded[3:] == 0).all()
+
+    def test_parquet_schema_comes_from_the_collection(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        properties = [
+            SimpleNamespace(name=name, data_type=SimpleNamespace(value=data_type))
+            for name, data_type in [
+                ("title", "text"),
+                ("budget", "int"),
+                ("rating", "number"),
+                ("genres", "text[]"),
+                ("meta", "object"),
+            ]
+        ]
+        path = str(tmp_path / "movies.parquet")
+        writer = _ParquetRowWriter(path, properties)
+        # Page one has no budget at all and a null rating.
+        writer.write([{"uuid": "u0", "title": "t0", "rating": None}])
+        writer.write(
+            [
+                {
+                    "uuid": "u1",
+                    "title": "t1",
+                    "budget": 10,
+                    "rating": 7.5,
+                    "genres": ["Drama"],
+                    "meta": {"a": 1},
+                }
+            ]
+        )
+        writer.close()
+
+        table = pq.read_table(path)
+        assert str(table.schema.field("budget").type) == "int64"
+        assert str(table.schema.field("rating").type) == "double"
+        assert table.column("budget").to_pylist() == [None, 10]
+        assert table.column("rating").to_pylist() == [None, 7.5]
+        assert table.column("genres").to_pylist() == [None, ["Drama"]]
+        assert table.column("meta").to_pylist() == [None, '{"a": 1}']
+
+        writer = _ParquetRowWriter(str(tmp_path / "other.parquet"), properties)
+        with pytest.raises(Exception, match="not in the collection schema: added"):
+            writer.write([{"uuid": "u0", "added": 1}])
+        writer.close()
+
+    def _make_page(self, n, dim=4):
+        return MagicMock(
+            objects=[
+                MagicMock(
+                    uuid=str(uuid.uuid4()),
+                    properties={"title": f"t{i}"},
+                    vector={"default": [float(i)] * dim},
+                )
+                for i in range(n)
+            ]
+        )
+
+    def test_export_streams_all_pages_with_cursor(self, mock_client, tmp_path):
+        col = _make_non_mt_col()
+        _setup_mock_client_with_col(mock_client, col)
+        pages = [self._make_page(2), self._make_page(2), self._make_page(1)]
+        cl_col = MagicMock()
+        cl_col.query.fetch_objects.side_effect = pages
+        col.with_consistency_level.return_value = cl_col
+
+        output = str(tmp_path / "movies.jsonl")
+        manager = DataManager(mock_client)
+        exported = manager.export_data(
+            collection="TestCollection", output=output, page_size=2
+        )
+
+        assert exported == 5
+        with open(output) as f:
+            rows = [json.loads(line) for line in f]
+        assert [r["title"] for r in rows] == ["t0", "t1", "t0", "t1", "t0"]
+        vectors = np.load(str(tmp_path / "movies.default.npy"))
+        assert vectors.shape == (5, 4)
+        afters = [c.kwargs["after"] for c in cl_col.query.fetch_objects.call_args_list]
+        assert afters == [None, pages[0].objects[-1].uuid, pages[1].objects[-1].uuid]
+
+    def test_export_tenants_on_non_mt_collection_raises(self, mock_client, tmp_path):
+        col = _make_non_mt_col()
+        _setup_mock_client_with_col(mock_client, col)
+        manager = DataManager(mock_client)
+        with pytest.raises(Exception, match="Exporting tenants is not possible"):
+            manager.export_data(
+                collection="TestCollection",
+                output=str(tmp_path / "out.jsonl"),
+                tenants="Tenant-0",
+            )
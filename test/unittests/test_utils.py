@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import MagicMock
 from weaviate_cli.utils import (
@@ -386,3 +387,74 @@ def test_parse_permission_invalid():
 
     with pytest.raises(ValueError, match="Invalid permission action: update_nodes"):
         parse_permission("update_nodes")
+
+
+def test_pp_objects_json_matches_single_document(capsys):
+    response = MagicMock()
+    objs = []
+    for i in range(3):
+        obj = MagicMock()
+        obj.uuid = f"uuid-{i}"
+        obj.properties = {"name": f"name-{i}"}
+        obj.metadata.distance = 0.1 * i
+        obj.metadata.certainty = None
+        obj.metadata.score = None
+        objs.append(obj)
+    response.objects = objs
+
+    pp_objects(response, ["name"], json_output=True)
+
+    out = capsys.readouterr().out
+    expected = {
+        "objects": [
+            {
+                "uuid": f"uuid-{i}",
+                "properties": {"name": f"name-{i}"},
+                "distance": 0.1 * i,
+                "certainty": None,
+                "score": None,
+            }
+            for i in range(3)
+        ],
+        "total": 3,
+    }
+    assert out == json.dumps(expected, indent=2) + "\n"
+
+
+def test_pp_objects_jsonl_streams_in_chunks(capsys, monkeypatch):
+    monkeypatch.setattr("weaviate_cli.utils.PP_OBJECTS_CHUNK_SIZE", 2)
+    response = MagicMock()
+    objs = []
+    for i in range(5):
+        obj = MagicMock()
+        obj.uuid = f"uuid-{i}"
+        obj.properties = {"name": f"name-{i}"}
+        obj.metadata = None
+        objs.append(obj)
+    response.objects = objs
+
+    pp_objects(response, ["name"], jsonl=True, tenants=[f"t{i}" for i in range(5)])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["uuid"] for line in lines] == [
+        f"uuid-{i}" for i in range(5)
+    ]
+    assert json.loads(lines[4])["tenant"] == "t4"
+
+
+def test_pp_objects_table_truncates_long_values(capsys):
+    response = MagicMock()
+    obj = MagicMock()
+    obj.uuid = "test-uuid"
+    obj.properties = {"name": "x" * 100}
+    obj.metadata.distance = 0.123456789012345
+    obj.metadata.certainty = None
+    obj.metadata.score = None
+    response.objects = [obj]
+
+    pp_objects(response, ["name"])
+
+    row = capsys.readouterr().out.splitlines()[1]
+    assert row == (
+        f"{'test-uuid':<36} {'x' * 36} {'0.12345678':<10} {'None':<10} {'None':<10}"
+    )
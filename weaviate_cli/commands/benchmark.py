@@ -2,10 +2,28 @@ import asyncio
 import json
 import click
 import sys
-from typing import Optional, List
-from weaviate_cli.utils import get_async_client_from_context
-from weaviate_cli.managers.benchmark_manager import BenchmarkQPSManager
-from weaviate_cli.defaults import CreateBenchmarkDefaults
+from typing import Optional, List, Tuple
+from weaviate_cli.utils import get_client_from_context, get_async_client_from_context
+from weaviate_cli.managers.benchmark_manager import (
+    BenchmarkColdTenantManager,
+    BenchmarkEfSweepManager,
+    BenchmarkLatencyManager,
+    BenchmarkMixedManager,
+    BenchmarkQPSManager,
+    BenchmarkRecallManager,
+    BenchmarkSweepManager,
+    BenchmarkThroughputManager,
+)
+from weaviate_cli.defaults import (
+    BenchmarkColdTenantDefaults,
+    BenchmarkEfSweepDefaults,
+    BenchmarkLatencyDefaults,
+    BenchmarkMixedDefaults,
+    BenchmarkRecallDefaults,
+    BenchmarkSweepDefaults,
+    BenchmarkThroughputDefaults,
+    CreateBenchmarkDefaults,
+)
 
 
 @click.group()
@@ -76,7 +94,7 @@ def benchmark():
 @click.option(
     "--latency-threshold",
     default=CreateBenchmarkDefaults.latency_threshold,
-    help="Latency threshold in milliseconds to stop the test. Default is 10000 milliseconds.",
+    help="Latency threshold in milliseconds to stop the test (per request, or for --threshold-percentile). Default is 10000 milliseconds.",
 )
 @click.option(
     "--fail-on-timeout",
@@ -92,7 +110,7 @@ def benchmark():
 @click.option(
     "--concurrency",
     type=int,
-    help="Concurrency level to run the test with. By default, it will be automatically determined based on the QPS and latency.",
+    help="Concurrency level to run the test with. By default, it will be sized from the QPS and the latency (Little's law) and resized every second of a phase.",
 )
 @click.option(
     "--generate-graph",
@@ -109,6 +127,151 @@ def benchmark():
     default=CreateBenchmarkDefaults.tenant,
     help="Tenant to use to run the benchmark against. Works only on multitenant collections. Default: None",
 )
+@click.option(
+    "--return",
+    "return_mode",
+    default=CreateBenchmarkDefaults.return_mode,
+    type=click.Choice(["ids-only", "metadata", "full"]),
+    help="What each query returns: only object ids, ids plus certainty metadata, or every property as well. Default is metadata.",
+)
+@click.option(
+    "--processes",
+    default=CreateBenchmarkDefaults.processes,
+    type=click.IntRange(min=1),
+    help="Number of load generator processes, each with its own client and an equal share of the target QPS and concurrency. Default is 1 (single event loop).",
+)
+@click.option(
+    "--search-strategy",
+    default=CreateBenchmarkDefaults.search_strategy,
+    type=click.Choice(["linear", "exponential"]),
+    help="How the maximum QPS is searched: +10 QPS steps (linear) or doubling the rate and then binary searching between the last passing and the first failing rate (exponential). Default is linear.",
+)
+@click.option(
+    "--search-precision",
+    default=CreateBenchmarkDefaults.search_precision,
+    type=click.IntRange(min=1),
+    help="Stop the exponential search once the passing and failing rates are this many QPS apart. Default is 10.",
+)
+@click.option(
+    "--confirm-runs",
+    default=CreateBenchmarkDefaults.confirm_runs,
+    type=click.IntRange(min=1),
+    help="Number of consecutive passing test phases required to accept a rate. Default is 1.",
+)
+@click.option(
+    "--threshold-percentile",
+    default=CreateBenchmarkDefaults.threshold_percentile,
+    type=click.FloatRange(min=0, max=100, min_open=True),
+    help="Fail a rate when this latency percentile (e.g. 99) exceeds --latency-threshold, instead of on any single slower request.",
+)
+@click.option(
+    "--slo",
+    multiple=True,
+    help="SLO rule evaluated over a sliding window, e.g. 'p95<50' (ms) or 'error_rate<0.1%'. Can be specified multiple times; replaces --latency-threshold.",
+)
+@click.option(
+    "--slo-window",
+    default=CreateBenchmarkDefaults.slo_window,
+    type=click.IntRange(min=1),
+    help=f"Sliding window in seconds the SLO rules are evaluated over (default: {CreateBenchmarkDefaults.slo_window}).",
+)
+@click.option(
+    "--slo-grace",
+    default=CreateBenchmarkDefaults.slo_grace,
+    type=click.IntRange(min=0),
+    help=f"Seconds at the start of each test phase in which SLOs are not evaluated (default: {CreateBenchmarkDefaults.slo_grace}).",
+)
+@click.option(
+    "--slo-action",
+    default=CreateBenchmarkDefaults.slo_action,
+    type=click.Choice(["abort", "continue"]),
+    help="On an SLO breach, abort the test phase immediately or let it finish before failing it (default: abort).",
+)
+@click.option(
+    "--arrival",
+    default=CreateBenchmarkDefaults.arrival,
+    help="When queries are sent at the target mean QPS: 'constant' (fixed spacing), 'poisson', 'bursts[:ON/OFF]' (Poisson bursts during ON seconds, silence during OFF seconds; default 1/4) or 'replay:PATH' (gaps between the timestamps in seconds, one per line, in PATH, scaled to the target QPS). Default is constant.",
+)
+@click.option(
+    "--arrival-seed",
+    default=CreateBenchmarkDefaults.arrival_seed,
+    type=int,
+    help=f"Random seed for the poisson and bursts arrivals (default: {CreateBenchmarkDefaults.arrival_seed}).",
+)
+@click.option(
+    "--filter-property",
+    "filter_properties",
+    multiple=True,
+    default=CreateBenchmarkDefaults.filter_properties,
+    help="Property to filter the queries on (can specify multiple): equality on text properties (e.g. status, originalLanguage), ranges on number, int and date properties (e.g. budget, releaseDate, popularity). Queries cycle through one filter per property and --filter-selectivity, and latency is reported per filter.",
+)
+@click.option(
+    "--filter-selectivity",
+    "filter_selectivities",
+    multiple=True,
+    type=click.FloatRange(min=0, max=100, min_open=True),
+    default=CreateBenchmarkDefaults.filter_selectivities,
+    help="Target percentage of objects each filter matches, estimated from aggregate counts (can specify multiple). Default is 1, 10 and 50.",
+)
+@click.option(
+    "--tenants",
+    default=CreateBenchmarkDefaults.tenants,
+    help="Spread the queries over these tenants of a multi-tenant collection: 'all', or a comma-separated list, most popular first. Latency is reported per tenant popularity tier.",
+)
+@click.option(
+    "--tenant-suffix",
+    default=CreateBenchmarkDefaults.tenant_suffix,
+    help="Spread the queries over the '<suffix>-<n>' tenants created by 'create tenants', most popular first by n.",
+)
+@click.option(
+    "--tenant-distribution",
+    default=CreateBenchmarkDefaults.tenant_distribution,
+    type=click.Choice(["uniform", "zipf"]),
+    help="How queries pick a tenant from --tenants or --tenant-suffix: uniformly, or by Zipf's law over the popularity rank. Default is uniform.",
+)
+@click.option(
+    "--zipf-exponent",
+    default=CreateBenchmarkDefaults.zipf_exponent,
+    type=click.FloatRange(min=0),
+    help=f"Exponent s of the zipf tenant distribution: rank r gets 1/r^s of the traffic (default: {CreateBenchmarkDefaults.zipf_exponent:g}).",
+)
+@click.option(
+    "--query-corpus",
+    type=click.IntRange(min=1),
+    default=CreateBenchmarkDefaults.query_corpus,
+    help="Query with the N most frequent words and two-word phrases of the collection's own text, read with the cursor API, instead of --query-terms.",
+)
+@click.option(
+    "--corpus-property",
+    "corpus_properties",
+    multiple=True,
+    default=CreateBenchmarkDefaults.corpus_properties,
+    help="Text property to build the --query-corpus from (can specify multiple). Default: every text property.",
+)
+@click.option(
+    "--corpus-objects",
+    default=CreateBenchmarkDefaults.corpus_objects,
+    type=click.IntRange(min=1),
+    help=f"Objects to read for the --query-corpus (default: {CreateBenchmarkDefaults.corpus_objects}).",
+)
+@click.option(
+    "--query-distribution",
+    default=CreateBenchmarkDefaults.query_distribution,
+    type=click.Choice(["uniform", "zipf"]),
+    help="How queries pick a term: uniformly, or by Zipf's law over the term rank (corpus frequency, or the order of --query-terms). Default is uniform.",
+)
+@click.option(
+    "--query-zipf-exponent",
+    default=CreateBenchmarkDefaults.query_zipf_exponent,
+    type=click.FloatRange(min=0),
+    help=f"Exponent s of the zipf query distribution: the term of rank r gets 1/r^s of the queries (default: {CreateBenchmarkDefaults.query_zipf_exponent:g}).",
+)
+@click.option(
+    "--slowest-terms",
+    default=CreateBenchmarkDefaults.slowest_terms,
+    type=click.IntRange(min=0),
+    help=f"Number of query terms with the highest mean service time to report (default: {CreateBenchmarkDefaults.slowest_terms}; 0 disables).",
+)
 @click.option(
     "--json", "json_output", is_flag=True, default=False, help="Output in JSON format."
 )
@@ -132,6 +295,30 @@ def benchmark_qps(
     concurrency: Optional[int],
     file_alias: Optional[str],
     tenant: Optional[str],
+    return_mode: str,
+    processes: int,
+    search_strategy: str,
+    search_precision: int,
+    confirm_runs: int,
+    threshold_percentile: Optional[float],
+    slo: Tuple[str, ...],
+    slo_window: int,
+    slo_grace: int,
+    slo_action: str,
+    arrival: str,
+    arrival_seed: int,
+    filter_properties: Tuple[str, ...],
+    filter_selectivities: Tuple[float, ...],
+    tenants: Optional[str],
+    tenant_suffix: Optional[str],
+    tenant_distribution: str,
+    zipf_exponent: float,
+    query_corpus: Optional[int],
+    corpus_properties: Tuple[str, ...],
+    corpus_objects: int,
+    query_distribution: str,
+    query_zipf_exponent: float,
+    slowest_terms: int,
     json_output: bool,
 ) -> None:
     """Run QPS benchmark on the specified collection."""
@@ -142,7 +329,9 @@ def benchmark_qps(
                 "--generate-graph can only be used when --output=csv"
             )
         async_client = get_async_client_from_context(ctx)
-        manager = BenchmarkQPSManager(async_client)
+        manager = BenchmarkQPSManager(
+            async_client, client_factory=ctx.obj["config"].get_async_client
+        )
 
         # Convert tuple to list for query terms
         query_terms_list = list(query_terms) if query_terms else None
@@ -166,6 +355,30 @@ def benchmark_qps(
                 generate_graph=generate_graph,
                 file_alias=file_alias,
                 tenant=tenant,
+                return_mode=return_mode,
+                processes=processes,
+                search_strategy=search_strategy,
+                search_precision=search_precision,
+                confirm_runs=confirm_runs,
+                threshold_percentile=threshold_percentile,
+                slo=list(slo),
+                slo_window=slo_window,
+                slo_grace=slo_grace,
+                slo_action=slo_action,
+                arrival=arrival,
+                arrival_seed=arrival_seed,
+                filter_properties=list(filter_properties),
+                filter_selectivities=filter_selectivities,
+                tenants=tenants,
+                tenant_suffix=tenant_suffix,
+                tenant_distribution=tenant_distribution,
+                zipf_exponent=zipf_exponent,
+                query_corpus=query_corpus,
+                corpus_properties=corpus_properties,
+                corpus_objects=corpus_objects,
+                query_distribution=query_distribution,
+                query_zipf_exponent=query_zipf_exponent,
+                slowest_terms=slowest_terms,
                 json_output=json_output,
             )
         )
@@ -178,11 +391,1090 @@ def benchmark_qps(
         pass
 
 
-# Future benchmark types can be added here as new commands
-# @benchmark.command("latency", help="Run latency benchmark on a collection.")
-# def benchmark_latency():
-#     pass
+@benchmark.command(
+    "latency",
+    help="Run a single-stream latency benchmark per query type on a collection.",
+)
+@click.option(
+    "--collection",
+    default=BenchmarkLatencyDefaults.collection,
+    help="The name of the collection to benchmark.",
+)
+@click.option(
+    "--query-type",
+    "query_types",
+    multiple=True,
+    default=BenchmarkLatencyDefaults.query_types,
+    type=click.Choice(["hybrid", "bm25", "near_text"]),
+    help="Query type to measure (can specify multiple). Default is hybrid, bm25 and near_text.",
+)
+@click.option(
+    "--queries",
+    default=BenchmarkLatencyDefaults.queries,
+    type=click.IntRange(min=1),
+    help=f"Number of measured queries per query type. Default is {BenchmarkLatencyDefaults.queries}.",
+)
+@click.option(
+    "--warmup",
+    default=BenchmarkLatencyDefaults.warmup,
+    type=click.IntRange(min=0),
+    help=f"Number of unmeasured queries per query type run first. Default is {BenchmarkLatencyDefaults.warmup}.",
+)
+@click.option(
+    "--consistency-level",
+    default=BenchmarkLatencyDefaults.consistency_level,
+    type=click.Choice(["ONE", "QUORUM", "ALL"]),
+    help="The consistency level to use for the benchmark. Default is QUORUM.",
+)
+@click.option(
+    "--limit",
+    default=BenchmarkLatencyDefaults.limit,
+    help="Limit of results per query. Default is 10.",
+)
+@click.option(
+    "--query-terms",
+    multiple=True,
+    help="Custom query terms to use for benchmarking (can specify multiple).",
+)
+@click.option(
+    "--tenant",
+    default=BenchmarkLatencyDefaults.tenant,
+    help="Tenant to use to run the benchmark against. Works only on multitenant collections. Default: None",
+)
+@click.option(
+    "--return",
+    "return_mode",
+    default=BenchmarkLatencyDefaults.return_mode,
+    type=click.Choice(["ids-only", "metadata", "full"]),
+    help="What each query returns: only object ids, ids plus certainty metadata, or every property as well. Default is metadata.",
+)
+@click.option(
+    "--json", "json_output", is_flag=True, default=False, help="Output in JSON format."
+)
+@click.pass_context
+def benchmark_latency(
+    ctx: click.Context,
+    collection: str,
+    query_types: Tuple[str, ...],
+    queries: int,
+    warmup: int,
+    consistency_level: str,
+    limit: int,
+    query_terms: tuple,
+    tenant: Optional[str],
+    return_mode: str,
+    json_output: bool,
+) -> None:
+    """Run a latency benchmark on the specified collection."""
+    try:
+        async_client = get_async_client_from_context(ctx)
+        manager = BenchmarkLatencyManager(async_client)
+        asyncio.run(
+            manager.run_benchmark(
+                collection=collection,
+                query_types=query_types,
+                queries=queries,
+                warmup=warmup,
+                limit=limit,
+                query_terms=list(query_terms) if query_terms else None,
+                consistency_level=consistency_level,
+                tenant=tenant,
+                return_mode=return_mode,
+                json_output=json_output,
+            )
+        )
+    except Exception as e:
+        click.echo(f"Error: {e}")
+        sys.exit(1)
+
+
+@benchmark.command(
+    "throughput",
+    help="Run a closed-loop throughput benchmark on a collection, sweeping the number of concurrent users.",
+)
+@click.option(
+    "--collection",
+    default=BenchmarkThroughputDefaults.collection,
+    help="The name of the collection to benchmark.",
+)
+@click.option(
+    "--query-type",
+    default=BenchmarkThroughputDefaults.query_type,
+    type=click.Choice(["hybrid", "bm25", "near_text"]),
+    help="The type of search query to perform. Default is hybrid.",
+)
+@click.option(
+    "--max-concurrency",
+    default=BenchmarkThroughputDefaults.max_concurrency,
+    type=click.IntRange(min=1),
+    help=f"Highest number of concurrent users; the sweep runs 1, 2, 4 ... up to it. Default is {BenchmarkThroughputDefaults.max_concurrency}.",
+)
+@click.option(
+    "--level-duration",
+    default=BenchmarkThroughputDefaults.level_duration,
+    type=click.IntRange(min=1),
+    help=f"Duration of each concurrency level in seconds. Default is {BenchmarkThroughputDefaults.level_duration} seconds.",
+)
+@click.option(
+    "--warmup-duration",
+    default=BenchmarkThroughputDefaults.warmup_duration,
+    type=click.IntRange(min=0),
+    help=f"Duration of the single-user warmup in seconds. Default is {BenchmarkThroughputDefaults.warmup_duration} seconds.",
+)
+@click.option(
+    "--think-time",
+    default=BenchmarkThroughputDefaults.think_time,
+    type=click.FloatRange(min=0),
+    help="Milliseconds each user waits after a response before sending its next query. Default is 0.",
+)
+@click.option(
+    "--consistency-level",
+    default=BenchmarkThroughputDefaults.consistency_level,
+    type=click.Choice(["ONE", "QUORUM", "ALL"]),
+    help="The consistency level to use for the benchmark. Default is QUORUM.",
+)
+@click.option(
+    "--limit",
+    default=BenchmarkThroughputDefaults.limit,
+    help="Limit of results per query. Default is 10.",
+)
+@click.option(
+    "--query-terms",
+    multiple=True,
+    help="Custom query terms to use for benchmarking (can specify multiple).",
+)
+@click.option(
+    "--tenant",
+    default=BenchmarkThroughputDefaults.tenant,
+    help="Tenant to use to run the benchmark against. Works only on multitenant collections. Default: None",
+)
+@click.option(
+    "--return",
+    "return_mode",
+    default=BenchmarkThroughputDefaults.return_mode,
+    type=click.Choice(["ids-only", "metadata", "full"]),
+    help="What each query returns: only object ids, ids plus certainty metadata, or every property as well. Default is metadata.",
+)
+@click.option(
+    "--json", "json_output", is_flag=True, default=False, help="Output in JSON format."
+)
+@click.pass_context
+def benchmark_throughput(
+    ctx: click.Context,
+    collection: str,
+    query_type: str,
+    max_concurrency: int,
+    level_duration: int,
+    warmup_duration: int,
+    think_time: float,
+    consistency_level: str,
+    limit: int,
+    query_terms: tuple,
+    tenant: Optional[str],
+    return_mode: str,
+    json_output: bool,
+) -> None:
+    """Run a throughput benchmark on the specified collection."""
+    try:
+        async_client = get_async_client_from_context(ctx)
+        manager = BenchmarkThroughputManager(async_client)
+        asyncio.run(
+            manager.run_benchmark(
+                collection=collection,
+                query_type=query_type,
+                limit=limit,
+                query_terms=list(query_terms) if query_terms else None,
+                consistency_level=consistency_level,
+                tenant=tenant,
+                return_mode=return_mode,
+                max_concurrency=max_concurrency,
+                level_duration=level_duration,
+                warmup_duration=warmup_duration,
+                think_time=think_time,
+                json_output=json_output,
+            )
+        )
+    except Exception as e:
+        click.echo(f"Error: {e}")
+        sys.exit(1)
+
 
-# @benchmark.command("throughput", help="Run throughput benchmark on a collection.")
-# def benchmark_throughput():
-#     pass
+@benchmark.command(
+    "recall",
+    help="Measure near_vector recall@k against the exact top-k, next to the latency at each QPS level.",
+)
+@click.option(
+    "--collection",
+    default=BenchmarkRecallDefaults.collection,
+    help="The name of the collection to benchmark.",
+)
+@click.option(
+    "--limit",
+    default=BenchmarkRecallDefaults.limit,
+    type=click.IntRange(min=1),
+    help="k: results per query and size of the exact top-k. Default is 10.",
+)
+@click.option(
+    "--qps",
+    "qps_levels",
+    multiple=True,
+    type=click.IntRange(min=1),
+    default=BenchmarkRecallDefaults.qps_levels,
+    help="QPS level to measure recall and latency at (can specify multiple). Default is 10, 50 and 100.",
+)
+@click.option(
+    "--test-duration",
+    default=BenchmarkRecallDefaults.test_duration,
+    type=click.IntRange(min=1),
+    help="Duration of each QPS level in seconds. Default is 10 seconds.",
+)
+@click.option(
+    "--warmup-duration",
+    default=BenchmarkRecallDefaults.warmup_duration,
+    type=click.IntRange(min=0),
+    help="Duration of the warmup before each QPS level in seconds. Default is 2 seconds.",
+)
+@click.option(
+    "--num-queries",
+    default=BenchmarkRecallDefaults.num_queries,
+    type=click.IntRange(min=1),
+    help="Number of query vectors sampled from the collection's vectors when --queries-file is not given. Default is 1000.",
+)
+@click.option(
+    "--queries-file",
+    default=BenchmarkRecallDefaults.queries_file,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Query vectors as a .npy or .fvecs file.",
+)
+@click.option(
+    "--query-seed",
+    default=BenchmarkRecallDefaults.query_seed,
+    type=int,
+    help=f"Random seed for sampling the query vectors (default: {BenchmarkRecallDefaults.query_seed}).",
+)
+@click.option(
+    "--vectors",
+    default=BenchmarkRecallDefaults.vectors,
+    type=click.Path(exists=True, dir_okay=False),
+    help="The collection's vectors as a .npy or .fvecs file (e.g. from 'export data'), instead of exporting them. Requires --ids.",
+)
+@click.option(
+    "--ids",
+    default=BenchmarkRecallDefaults.ids,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Object uuids matching --vectors row by row: one per line, or the JSONL properties file of 'export data'.",
+)
+@click.option(
+    "--target-vector",
+    default=BenchmarkRecallDefaults.target_vector,
+    help="Named vector to query (default: the 'default' or only vector).",
+)
+@click.option(
+    "--cache-dir",
+    default=BenchmarkRecallDefaults.cache_dir,
+    help=f"Directory for the exported vectors and the cached ground truth (default: {BenchmarkRecallDefaults.cache_dir}).",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    default=BenchmarkRecallDefaults.refresh,
+    help="Export the vectors again instead of using the cached export.",
+)
+@click.option(
+    "--consistency-level",
+    default=BenchmarkRecallDefaults.consistency_level,
+    type=click.Choice(["ONE", "QUORUM", "ALL"]),
+    help="The consistency level to use for the benchmark. Default is QUORUM.",
+)
+@click.option(
+    "--tenant",
+    default=BenchmarkRecallDefaults.tenant,
+    help="Tenant to use to run the benchmark against. Works only on multitenant collections. Default: None",
+)
+@click.option(
+    "--concurrency",
+    type=int,
+    help="Concurrency level to run the test with. By default, it will be automatically determined based on the QPS and latency.",
+)
+@click.option(
+    "--json", "json_output", is_flag=True, default=False, help="Output in JSON format."
+)
+@click.pass_context
+def benchmark_recall(
+    ctx: click.Context,
+    collection: str,
+    limit: int,
+    qps_levels: Tuple[int, ...],
+    test_duration: int,
+    warmup_duration: int,
+    num_queries: int,
+    queries_file: Optional[str],
+    query_seed: int,
+    vectors: Optional[str],
+    ids: Optional[str],
+    target_vector: Optional[str],
+    cache_dir: str,
+    refresh: bool,
+    consistency_level: str,
+    tenant: Optional[str],
+    concurrency: Optional[int],
+    json_output: bool,
+) -> None:
+    """Run a recall benchmark on the specified collection."""
+    try:
+        async_client = get_async_client_from_context(ctx)
+        manager = BenchmarkRecallManager(async_client)
+        asyncio.run(
+            manager.run_benchmark(
+                collection=collection,
+                limit=limit,
+                qps_levels=qps_levels,
+                test_duration=test_duration,
+                warmup_duration=warmup_duration,
+                num_queries=num_queries,
+                queries_file=queries_file,
+                query_seed=query_seed,
+                vectors=vectors,
+                ids=ids,
+                target_vector=target_vector,
+                cache_dir=cache_dir,
+                refresh=refresh,
+                consistency_level=consistency_level,
+                tenant=tenant,
+                concurrency=concurrency,
+                json_output=json_output,
+            )
+        )
+    except Exception as e:
+        click.echo(f"Error: {e}")
+        sys.exit(1)
+
+
+@benchmark.command(
+    "sweep",
+    help="Compare vector index settings: create, fill and benchmark one collection per cell of a settings matrix.",
+)
+@click.option(
+    "--matrix",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help=(
+        "JSON file with the 'create collection' settings to sweep: optional 'base' settings and either a 'matrix' "
+        "of setting to values (every combination is a cell) or a list of 'cells', e.g. "
+        '{"matrix": {"vector_index": ["hnsw", "hnsw_pq"], "rescore_limit": [100, 400]}}.'
+    ),
+)
+@click.option(
+    "--objects",
+    default=BenchmarkSweepDefaults.objects,
+    type=click.IntRange(min=1),
+    help=f"Number of seeded objects ingested into every cell (default: {BenchmarkSweepDefaults.objects}).",
+)
+@click.option(
+    "--vector-dimensions",
+    default=BenchmarkSweepDefaults.vector_dimensions,
+    type=click.IntRange(min=1),
+    help=f"Dimensions of the ingested vectors (default: {BenchmarkSweepDefaults.vector_dimensions}).",
+)
+@click.option(
+    "--collection-prefix",
+    default=BenchmarkSweepDefaults.collection_prefix,
+    help=f"Prefix of the per-cell collection names (default: {BenchmarkSweepDefaults.collection_prefix}).",
+)
+@click.option(
+    "--limit",
+    default=BenchmarkSweepDefaults.limit,
+    type=click.IntRange(min=1),
+    help="k: results per query and size of the exact top-k. Default is 10.",
+)
+@click.option(
+    "--recall-qps",
+    default=BenchmarkSweepDefaults.recall_qps,
+    type=click.IntRange(min=1),
+    help=f"QPS to measure recall and p99 latency at (default: {BenchmarkSweepDefaults.recall_qps}).",
+)
+@click.option(
+    "--num-queries",
+    default=BenchmarkSweepDefaults.num_queries,
+    type=click.IntRange(min=1),
+    help="Number of query vectors sampled from each cell's vectors. Default is 1000.",
+)
+@click.option(
+    "--query-seed",
+    default=BenchmarkSweepDefaults.query_seed,
+    type=int,
+    help=f"Random seed for sampling the query vectors (default: {BenchmarkSweepDefaults.query_seed}).",
+)
+@click.option(
+    "--max-duration",
+    default=BenchmarkSweepDefaults.max_duration,
+    type=click.IntRange(min=1),
+    help="Time budget of the max QPS search per cell in seconds. Default is 120 seconds.",
+)
+@click.option(
+    "--test-duration",
+    default=BenchmarkSweepDefaults.test_duration,
+    type=click.IntRange(min=1),
+    help="Duration of each test phase in seconds. Default is 10 seconds.",
+)
+@click.option(
+    "--warmup-duration",
+    default=BenchmarkSweepDefaults.warmup_duration,
+    type=click.IntRange(min=0),
+    help="Duration of the warmup before each test phase in seconds. Default is 2 seconds.",
+)
+@click.option(
+    "--latency-threshold",
+    default=BenchmarkSweepDefaults.latency_threshold,
+    type=click.IntRange(min=1),
+    help="Latency threshold in milliseconds for the max QPS search. Default is 100 ms.",
+)
+@click.option(
+    "--threshold-percentile",
+    default=BenchmarkSweepDefaults.threshold_percentile,
+    type=click.FloatRange(min=0, max=100, min_open=True),
+    help="Latency percentile held to --latency-threshold in the max QPS search. Default is 99.",
+)
+@click.option(
+    "--search-strategy",
+    default=BenchmarkSweepDefaults.search_strategy,
+    type=click.Choice(["linear", "exponential"]),
+    help="How the max QPS is searched. Default is exponential.",
+)
+@click.option(
+    "--consistency-level",
+    default=BenchmarkSweepDefaults.consistency_level,
+    type=click.Choice(["ONE", "QUORUM", "ALL"]),
+    help="The consistency level to use for the benchmark. Default is QUORUM.",
+)
+@click.option(
+    "--cache-dir",
+    default=BenchmarkSweepDefaults.cache_dir,
+    help=f"Directory for the exported vectors and the ground truth (default: {BenchmarkSweepDefaults.cache_dir}).",
+)
+@click.option(
+    "--metrics-url",
+    default=BenchmarkSweepDefaults.metrics_url,
+    help="Weaviate Prometheus metrics endpoint (e.g. http://localhost:2112/metrics) to report the heap growth of each cell.",
+)
+@click.option(
+    "--keep",
+    is_flag=True,
+    default=BenchmarkSweepDefaults.keep,
+    help="Keep the per-cell collections instead of deleting them.",
+)
+@click.option(
+    "--output",
+    default=BenchmarkSweepDefaults.output,
+    type=click.Choice(["stdout", "csv"]),
+    help="Also write the comparison to a CSV file. Default is stdout.",
+)
+@click.option(
+    "--generate-graph",
+    is_flag=True,
+    default=BenchmarkSweepDefaults.generate_graph,
+    help="Generate a comparison chart. Requires --output csv.",
+)
+@click.option(
+    "--json", "json_output", is_flag=True, default=False, help="Output in JSON format."
+)
+@click.pass_context
+def benchmark_sweep(
+    ctx: click.Context,
+    matrix: str,
+    objects: int,
+    vector_dimensions: int,
+    collection_prefix: str,
+    limit: int,
+    recall_qps: int,
+    num_queries: int,
+    query_seed: int,
+    max_duration: int,
+    test_duration: int,
+    warmup_duration: int,
+    latency_threshold: int,
+    threshold_percentile: float,
+    search_strategy: str,
+    consistency_level: str,
+    cache_dir: str,
+    metrics_url: Optional[str],
+    keep: bool,
+    output: str,
+    generate_graph: bool,
+    json_output: bool,
+) -> None:
+    """Run an index settings sweep."""
+    client = None
+    try:
+        if generate_graph and output != "csv":
+            raise click.BadParameter(
+                "--generate-graph can only be used when --output=csv"
+            )
+        client = get_client_from_context(ctx)
+        async_client = get_async_client_from_context(ctx)
+        manager = BenchmarkSweepManager(async_client, client)
+        asyncio.run(
+            manager.run_benchmark(
+                matrix=matrix,
+                objects=objects,
+                vector_dimensions=vector_dimensions,
+                collection_prefix=collection_prefix,
+                limit=limit,
+                recall_qps=recall_qps,
+                num_queries=num_queries,
+                query_seed=query_seed,
+                max_duration=max_duration,
+                test_duration=test_duration,
+                warmup_duration=warmup_duration,
+                latency_threshold=latency_threshold,
+                threshold_percentile=threshold_percentile,
+                search_strategy=search_strategy,
+                consistency_level=consistency_level,
+                cache_dir=cache_dir,
+                metrics_url=metrics_url,
+                keep=keep,
+                output=output,
+                generate_graph=generate_graph,
+                json_output=json_output,
+            )
+        )
+    except Exception as e:
+        click.echo(f"Error: {e}")
+        if client:
+            client.close()
+        sys.exit(1)
+    finally:
+        if client:
+            client.close()
+
+
+@benchmark.command(
+    "ef-sweep",
+    help="Step an HNSW collection's query-time search parameters and measure the latency/recall curve at a fixed QPS, without re-ingesting.",
+)
+@click.option(
+    "--collection",
+    default=BenchmarkEfSweepDefaults.collection,
+    help="The name of the collection to benchmark.",
+)
+@click.option(
+    "--ef",
+    multiple=True,
+    type=int,
+    default=BenchmarkEfSweepDefaults.ef,
+    help="ef value to step through (can specify multiple); -1 picks ef dynamically. Without any search parameter, ef steps from 16 to 512 in powers of two.",
+)
+@click.option(
+    "--dynamic-ef-min",
+    multiple=True,
+    type=click.IntRange(min=1),
+    default=BenchmarkEfSweepDefaults.dynamic_ef_min,
+    help="Dynamic ef lower bound to step through (can specify multiple).",
+)
+@click.option(
+    "--dynamic-ef-max",
+    multiple=True,
+    type=click.IntRange(min=1),
+    default=BenchmarkEfSweepDefaults.dynamic_ef_max,
+    help="Dynamic ef upper bound to step through (can specify multiple).",
+)
+@click.option(
+    "--dynamic-ef-factor",
+    multiple=True,
+    type=click.IntRange(min=1),
+    default=BenchmarkEfSweepDefaults.dynamic_ef_factor,
+    help="Dynamic ef factor to step through (can specify multiple).",
+)
+@click.option(
+    "--rescore-limit",
+    multiple=True,
+    type=click.IntRange(min=1),
+    default=BenchmarkEfSweepDefaults.rescore_limit,
+    help="Rescore limit of the BQ, SQ or RQ quantizer to step through (can specify multiple). Every combination of the given values is a step.",
+)
+@click.option(
+    "--limit",
+    default=BenchmarkEfSweepDefaults.limit,
+    type=click.IntRange(min=1),
+    help="k: results per query and size of the exact top-k. Default is 10.",
+)
+@click.option(
+    "--qps",
+    default=BenchmarkEfSweepDefaults.qps,
+    type=click.IntRange(min=1),
+    help=f"QPS of the phase run at each step (default: {BenchmarkEfSweepDefaults.qps}).",
+)
+@click.option(
+    "--test-duration",
+    default=BenchmarkEfSweepDefaults.test_duration,
+    type=click.IntRange(min=1),
+    help="Duration of each step in seconds. Default is 10 seconds.",
+)
+@click.option(
+    "--warmup-duration",
+    default=BenchmarkEfSweepDefaults.warmup_duration,
+    type=click.IntRange(min=0),
+    help="Duration of the warmup after each update in seconds. Default is 2 seconds.",
+)
+@click.option(
+    "--target-recall",
+    default=BenchmarkEfSweepDefaults.target_recall,
+    type=click.FloatRange(min=0, max=1),
+    help="Report the lowest-p99 step reaching this recall as the best operating point (default: the highest-recall step).",
+)
+@click.option(
+    "--num-queries",
+    default=BenchmarkEfSweepDefaults.num_queries,
+    type=click.IntRange(min=1),
+    help="Number of query vectors sampled from the collection's vectors when --queries-file is not given. Default is 1000.",
+)
+@click.option(
+    "--queries-file",
+    default=BenchmarkEfSweepDefaults.queries_file,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Query vectors as a .npy or .fvecs file.",
+)
+@click.option(
+    "--query-seed",
+    default=BenchmarkEfSweepDefaults.query_seed,
+    type=int,
+    help=f"Random seed for sampling the query vectors (default: {BenchmarkEfSweepDefaults.query_seed}).",
+)
+@click.option(
+    "--vectors",
+    default=BenchmarkEfSweepDefaults.vectors,
+    type=click.Path(exists=True, dir_okay=False),
+    help="The collection's vectors as a .npy or .fvecs file (e.g. from 'export data'), instead of exporting them. Requires --ids.",
+)
+@click.option(
+    "--ids",
+    default=BenchmarkEfSweepDefaults.ids,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Object uuids matching --vectors row by row: one per line, or the JSONL properties file of 'export data'.",
+)
+@click.option(
+    "--target-vector",
+    default=BenchmarkEfSweepDefaults.target_vector,
+    help="Named vector to query (default: the 'default' or only vector).",
+)
+@click.option(
+    "--cache-dir",
+    default=BenchmarkEfSweepDefaults.cache_dir,
+    help=f"Directory for the exported vectors and the cached ground truth (default: {BenchmarkEfSweepDefaults.cache_dir}).",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    default=BenchmarkEfSweepDefaults.refresh,
+    help="Export the vectors again instead of using the cached export.",
+)
+@click.option(
+    "--consistency-level",
+    default=BenchmarkEfSweepDefaults.consistency_level,
+    type=click.Choice(["ONE", "QUORUM", "ALL"]),
+    help="The consistency level to use for the benchmark. Default is QUORUM.",
+)
+@click.option(
+    "--tenant",
+    default=BenchmarkEfSweepDefaults.tenant,
+    help="Tenant to use to run the benchmark against. Works only on multitenant collections. Default: None",
+)
+@click.option(
+    "--concurrency",
+    type=int,
+    help="Concurrency level to run the test with. By default, it will be automatically determined based on the QPS and latency.",
+)
+@click.option(
+    "--output",
+    default=BenchmarkEfSweepDefaults.output,
+    type=click.Choice(["stdout", "csv"]),
+    help="Also write the results to a CSV file. Default is stdout.",
+)
+@click.option(
+    "--generate-graph",
+    is_flag=True,
+    default=BenchmarkEfSweepDefaults.generate_graph,
+    help="Plot the latency/recall curve. Requires --output csv.",
+)
+@click.option(
+    "--json", "json_output", is_flag=True, default=False, help="Output in JSON format."
+)
+@click.pass_context
+def benchmark_ef_sweep(
+    ctx: click.Context,
+    collection: str,
+    ef: Tuple[int, ...],
+    dynamic_ef_min: Tuple[int, ...],
+    dynamic_ef_max: Tuple[int, ...],
+    dynamic_ef_factor: Tuple[int, ...],
+    rescore_limit: Tuple[int, ...],
+    limit: int,
+    qps: int,
+    test_duration: int,
+    warmup_duration: int,
+    target_recall: Optional[float],
+    num_queries: int,
+    queries_file: Optional[str],
+    query_seed: int,
+    vectors: Optional[str],
+    ids: Optional[str],
+    target_vector: Optional[str],
+    cache_dir: str,
+    refresh: bool,
+    consistency_level: str,
+    tenant: Optional[str],
+    concurrency: Optional[int],
+    output: str,
+    generate_graph: bool,
+    json_output: bool,
+) -> None:
+    """Run a search parameter sweep on the specified collection."""
+    client = None
+    try:
+        if generate_graph and output != "csv":
+            raise click.BadParameter(
+                "--generate-graph can only be used when --output=csv"
+            )
+        client = get_client_from_context(ctx)
+        async_client = get_async_client_from_context(ctx)
+        manager = BenchmarkEfSweepManager(async_client, client)
+        asyncio.run(
+            manager.run_benchmark(
+                collection=collection,
+                ef=ef,
+                dynamic_ef_min=dynamic_ef_min,
+                dynamic_ef_max=dynamic_ef_max,
+                dynamic_ef_factor=dynamic_ef_factor,
+                rescore_limit=rescore_limit,
+                limit=limit,
+                qps=qps,
+                test_duration=test_duration,
+                warmup_duration=warmup_duration,
+                target_recall=target_recall,
+                num_queries=num_queries,
+                queries_file=queries_file,
+                query_seed=query_seed,
+                vectors=vectors,
+                ids=ids,
+                target_vector=target_vector,
+                cache_dir=cache_dir,
+                refresh=refresh,
+                consistency_level=consistency_level,
+                tenant=tenant,
+                concurrency=concurrency,
+                output=output,
+                generate_graph=generate_graph,
+                json_output=json_output,
+            )
+        )
+    except Exception as e:
+        click.echo(f"Error: {e}")
+        if client:
+            client.close()
+        sys.exit(1)
+    finally:
+        if client:
+            client.close()
+
+
+@benchmark.command(
+    "mixed",
+    help="Run queries at a fixed QPS alongside rate-limited inserts (and optionally updates and deletes), reporting read and write latency on one timeline.",
+)
+@click.option(
+    "--collection",
+    default=BenchmarkMixedDefaults.collection,
+    help="The name of the collection to benchmark.",
+)
+@click.option(
+    "--query-type",
+    default=BenchmarkMixedDefaults.query_type,
+    type=click.Choice(["hybrid", "bm25", "near_text"]),
+    help="The type of search query to perform. Default is hybrid.",
+)
+@click.option(
+    "--limit",
+    default=BenchmarkMixedDefaults.limit,
+    help="Limit of results per query. Default is 10.",
+)
+@click.option(
+    "--query-terms",
+    multiple=True,
+    help="Custom query terms to use for benchmarking (can specify multiple).",
+)
+@click.option(
+    "--qps",
+    default=BenchmarkMixedDefaults.qps,
+    type=click.IntRange(min=1),
+    help=f"Query rate, open loop (default: {BenchmarkMixedDefaults.qps}).",
+)
+@click.option(
+    "--duration",
+    default=BenchmarkMixedDefaults.duration,
+    type=click.IntRange(min=1),
+    help=f"Duration of the run in seconds (default: {BenchmarkMixedDefaults.duration}).",
+)
+@click.option(
+    "--insert-rate",
+    default=BenchmarkMixedDefaults.insert_rate,
+    type=click.FloatRange(min=0),
+    help=f"Objects inserted per second, in batches of --batch-size (default: {BenchmarkMixedDefaults.insert_rate:g}). Objects are generated like 'create data --randomize'.",
+)
+@click.option(
+    "--batch-size",
+    default=BenchmarkMixedDefaults.batch_size,
+    type=click.IntRange(min=1),
+    help=f"Objects per insert request (default: {BenchmarkMixedDefaults.batch_size}).",
+)
+@click.option(
+    "--update-rate",
+    default=BenchmarkMixedDefaults.update_rate,
+    type=click.FloatRange(min=0),
+    help="Objects updated per second, one per request (default: 0). Only objects inserted by this run are updated.",
+)
+@click.option(
+    "--delete-rate",
+    default=BenchmarkMixedDefaults.delete_rate,
+    type=click.FloatRange(min=0),
+    help="Objects deleted per second, one per request (default: 0). Only objects inserted by this run are deleted.",
+)
+@click.option(
+    "--write-concurrency",
+    default=BenchmarkMixedDefaults.write_concurrency,
+    type=click.IntRange(min=1),
+    help=f"Write requests of each kind in flight at most (default: {BenchmarkMixedDefaults.write_concurrency}).",
+)
+@click.option(
+    "--keep-objects",
+    is_flag=True,
+    default=BenchmarkMixedDefaults.keep_objects,
+    help="Keep the inserted objects instead of deleting them at the end.",
+)
+@click.option(
+    "--consistency-level",
+    default=BenchmarkMixedDefaults.consistency_level,
+    type=click.Choice(["ONE", "QUORUM", "ALL"]),
+    help="The consistency level to use for the benchmark. Default is QUORUM.",
+)
+@click.option(
+    "--tenant",
+    default=BenchmarkMixedDefaults.tenant,
+    help="Tenant to use to run the benchmark against. Works only on multitenant collections. Default: None",
+)
+@click.option(
+    "--return",
+    "return_mode",
+    default=BenchmarkMixedDefaults.return_mode,
+    type=click.Choice(["ids-only", "metadata", "full"]),
+    help="What each query returns: only object ids, ids plus certainty metadata, or every property as well. Default is metadata.",
+)
+@click.option(
+    "--concurrency",
+    type=int,
+    help="Query concurrency. By default, it will be automatically determined based on the QPS and latency.",
+)
+@click.option(
+    "--output",
+    default=BenchmarkMixedDefaults.output,
+    type=click.Choice(["stdout", "csv"]),
+    help="Also write the per-second timeline to a CSV file. Default is stdout.",
+)
+@click.option(
+    "--generate-graph",
+    is_flag=True,
+    default=BenchmarkMixedDefaults.generate_graph,
+    help="Plot the timeline. Requires --output csv.",
+)
+@click.option(
+    "--json", "json_output", is_flag=True, default=False, help="Output in JSON format."
+)
+@click.pass_context
+def benchmark_mixed(
+    ctx: click.Context,
+    collection: str,
+    query_type: str,
+    limit: int,
+    query_terms: Tuple[str, ...],
+    qps: int,
+    duration: int,
+    insert_rate: float,
+    batch_size: int,
+    update_rate: float,
+    delete_rate: float,
+    write_concurrency: int,
+    keep_objects: bool,
+    consistency_level: str,
+    tenant: Optional[str],
+    return_mode: str,
+    concurrency: Optional[int],
+    output: str,
+    generate_graph: bool,
+    json_output: bool,
+) -> None:
+    """Run a mixed read/write benchmark on the specified collection."""
+    try:
+        if generate_graph and output != "csv":
+            raise click.BadParameter(
+                "--generate-graph can only be used when --output=csv"
+            )
+        async_client = get_async_client_from_context(ctx)
+        manager = BenchmarkMixedManager(async_client)
+        asyncio.run(
+            manager.run_benchmark(
+                collection=collection,
+                query_type=query_type,
+                limit=limit,
+                query_terms=list(query_terms) if query_terms else None,
+                qps=qps,
+                duration=duration,
+                insert_rate=insert_rate,
+                batch_size=batch_size,
+                update_rate=update_rate,
+                delete_rate=delete_rate,
+                write_concurrency=write_concurrency,
+                keep_objects=keep_objects,
+                consistency_level=consistency_level,
+                tenant=tenant,
+                return_mode=return_mode,
+                concurrency=concurrency,
+                output=output,
+                generate_graph=generate_graph,
+                json_output=json_output,
+            )
+        )
+    except Exception as e:
+        click.echo(f"Error: {e}")
+        sys.exit(1)
+
+
+@benchmark.command(
+    "cold-tenants",
+    help="Deactivate or offload a sample of active tenants, then measure how long each takes to serve its first successful query, against its object count.",
+)
+@click.option(
+    "--collection",
+    default=BenchmarkColdTenantDefaults.collection,
+    help="The name of the multi-tenant collection to benchmark.",
+)
+@click.option(
+    "--tenants",
+    default=BenchmarkColdTenantDefaults.tenants,
+    help="Sample from these tenants: 'all', or a comma-separated list. Default: all tenants.",
+)
+@click.option(
+    "--tenant-suffix",
+    default=BenchmarkColdTenantDefaults.tenant_suffix,
+    help="Sample from the '<suffix>-<n>' tenants created by 'create tenants'.",
+)
+@click.option(
+    "--sample",
+    default=BenchmarkColdTenantDefaults.sample,
+    type=click.IntRange(min=1),
+    help=f"Number of active tenants to make cold (default: {BenchmarkColdTenantDefaults.sample}).",
+)
+@click.option(
+    "--seed",
+    default=BenchmarkColdTenantDefaults.seed,
+    help=f"Seed of the tenant sample (default: {BenchmarkColdTenantDefaults.seed}).",
+)
+@click.option(
+    "--state",
+    default=BenchmarkColdTenantDefaults.state,
+    type=click.Choice(["inactive", "offloaded"]),
+    help="State to put the sampled tenants in. Offloading requires an offload module on the cluster. Default is inactive.",
+)
+@click.option(
+    "--activation",
+    default=BenchmarkColdTenantDefaults.activation,
+    type=click.Choice(["auto", "explicit"]),
+    help="Rely on the collection's auto tenant activation, or activate each tenant before querying it. Default is auto.",
+)
+@click.option(
+    "--concurrency",
+    default=BenchmarkColdTenantDefaults.concurrency,
+    type=click.IntRange(min=1),
+    help=f"Tenants activated at the same time (default: {BenchmarkColdTenantDefaults.concurrency}).",
+)
+@click.option(
+    "--timeout",
+    default=BenchmarkColdTenantDefaults.timeout,
+    type=click.FloatRange(min=0, min_open=True),
+    help=f"Seconds to wait for a tenant to change state or become queryable (default: {BenchmarkColdTenantDefaults.timeout:g}).",
+)
+@click.option(
+    "--poll-interval",
+    default=BenchmarkColdTenantDefaults.poll_interval,
+    type=click.FloatRange(min=0),
+    help=f"Seconds between queries to a tenant that is not queryable yet (default: {BenchmarkColdTenantDefaults.poll_interval:g}).",
+)
+@click.option(
+    "--consistency-level",
+    default=BenchmarkColdTenantDefaults.consistency_level,
+    type=click.Choice(["ONE", "QUORUM", "ALL"]),
+    help="The consistency level to use for the benchmark. Default is QUORUM.",
+)
+@click.option(
+    "--output",
+    default=BenchmarkColdTenantDefaults.output,
+    type=click.Choice(["stdout", "csv"]),
+    help="Also write the per-tenant results to a CSV file. Default is stdout.",
+)
+@click.option(
+    "--generate-graph",
+    is_flag=True,
+    default=BenchmarkColdTenantDefaults.generate_graph,
+    help="Plot time to first query against object count. Requires --output csv.",
+)
+@click.option(
+    "--json", "json_output", is_flag=True, default=False, help="Output in JSON format."
+)
+@click.pass_context
+def benchmark_cold_tenants(
+    ctx: click.Context,
+    collection: str,
+    tenants: Optional[str],
+    tenant_suffix: Optional[str],
+    sample: int,
+    seed: int,
+    state: str,
+    activation: str,
+    concurrency: int,
+    timeout: float,
+    poll_interval: float,
+    consistency_level: str,
+    output: str,
+    generate_graph: bool,
+    json_output: bool,
+) -> None:
+    """Run a cold tenant activation benchmark on the specified collection."""
+    if tenants and tenant_suffix:
+        click.echo("Error: --tenants and --tenant-suffix can't be combined.")
+        sys.exit(1)
+    try:
+        if generate_graph and output != "csv":
+            raise click.BadParameter(
+                "--generate-graph can only be used when --output=csv"
+            )
+        async_client = get_async_client_from_context(ctx)
+        manager = BenchmarkColdTenantManager(async_client)
+        asyncio.run(
+            manager.run_benchmark(
+                collection=collection,
+                tenants=tenants,
+                tenant_suffix=tenant_suffix,
+                sample=sample,
+                seed=seed,
+                state=state,
+                activation=activation,
+                concurrency=concurrency,
+                timeout=timeout,
+                poll_interval=poll_interval,
+                consistency_level=consistency_level,
+                output=output,
+                generate_graph=generate_graph,
+                json_output=json_output,
+            )
+        )
+    except Exception as e:
+        click.echo(f"Error: {e}")
+        sys.exit(1)
@@ -163,7 +163,7 @@ def delete_tenants_cli(
     "--parallel_workers",
     default=DeleteDataDefaults.parallel_workers,
     type=click.IntRange(min=1),
-    help=f"Number of tenants to process in parallel (default: {DeleteDataDefaults.parallel_workers}). Set to 1 to disable parallelism.",
+    help=f"Maximum number of concurrent requests, shared across all tenants (default: {DeleteDataDefaults.parallel_workers}). Set to 1 to disable parallelism.",
 )
 @click.option(
     "--json", "json_output", is_flag=True, default=False, help="Output in JSON format."
@@ -0,0 +1,113 @@
+import sys
+import click
+
+from weaviate_cli.completion.complete import collection_name_complete
+from weaviate_cli.utils import get_client_from_context
+from weaviate_cli.managers.data_manager import DataManager
+from weaviate_cli.defaults import ExportDataDefaults
+
+
+# Export Group
+@click.group()
+def export() -> None:
+    """Export resources from Weaviate."""
+    pass
+
+
+@export.command("data")
+@click.option(
+    "--collection",
+    default=ExportDataDefaults.collection,
+    help="The name of the collection to export.",
+    shell_complete=collection_name_complete,
+)
+@click.option(
+    "--output",
+    default=ExportDataDefaults.output,
+    help="Path of the properties file (default: '<collection>.<format>'). Vectors are written next to it as '<output>.<vector name>.npy'.",
+)
+@click.option(
+    "--format",
+    "file_format",
+    default=ExportDataDefaults.file_format,
+    type=click.Choice(["jsonl", "parquet"]),
+    help="Format of the properties file (default: 'jsonl'). Parquet requires pyarrow.",
+)
+@click.option(
+    "--tenants",
+    default=ExportDataDefaults.tenants,
+    help="Comma separated list of tenants to export (default: all active tenants).",
+)
+@click.option(
+    "--skip_vectors",
+    is_flag=True,
+    default=not ExportDataDefaults.include_vectors,
+    help="Do not export vectors (default: False).",
+)
+@click.option(
+    "--consistency_level",
+    default=ExportDataDefaults.consistency_level,
+    type=click.Choice(["quorum", "all", "one"]),
+    help="Consistency level (default: 'quorum').",
+)
+@click.option(
+    "--page_size",
+    default=ExportDataDefaults.page_size,
+    type=click.IntRange(min=1),
+    help=f"Number of objects fetched per cursor page (default: {ExportDataDefaults.page_size}).",
+)
+@click.option(
+    "--prefetch",
+    default=ExportDataDefaults.prefetch,
+    type=click.IntRange(min=1),
+    help=f"Maximum number of fetched pages waiting to be written (default: {ExportDataDefaults.prefetch}).",
+)
+@click.option(
+    "--parallel_workers",
+    default=ExportDataDefaults.parallel_workers,
+    type=click.IntRange(min=1),
+    help=f"Number of tenants fetched in parallel (default: {ExportDataDefaults.parallel_workers}).",
+)
+@click.option(
+    "--json", "json_output", is_flag=True, default=False, help="Output in JSON format."
+)
+@click.pass_context
+def export_data_cli(
+    ctx,
+    collection,
+    output,
+    file_format,
+    tenants,
+    skip_vectors,
+    consistency_level,
+    page_size,
+    prefetch,
+    parallel_workers,
+    json_output,
+):
+    """Export the objects of a collection to JSONL/Parquet and vectors to .npy."""
+
+    client = None
+    try:
+        client = get_client_from_context(ctx)
+        data_manager = DataManager(client)
+        data_manager.export_data(
+            collection=collection,
+            output=output,
+            file_format=file_format,
+            tenants=tenants,
+            include_vectors=not skip_vectors,
+            consistency_level=consistency_level,
+            page_size=page_size,
+            prefetch=prefetch,
+            parallel_workers=parallel_workers,
+            json_output=json_output,
+        )
+    except Exception as e:
+        click.echo(f"Error: {e}")
+        if client:
+            client.close()
+        sys.exit(1)
+    finally:
+        if client:
+            client.close()
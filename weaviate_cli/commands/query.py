@@ -4,11 +4,11 @@ import click
 from typing import Optional
 
 from weaviate_cli.completion.complete import collection_name_complete
-from weaviate_cli.utils import get_client_from_context
+from weaviate_cli.utils import get_async_client_from_context, get_client_from_context
 from weaviate_cli.managers.data_manager import DataManager
 from weaviate_cli.managers.cluster_manager import ClusterManager
 from weaviate.exceptions import WeaviateConnectionError
-from weaviate_cli.defaults import QueryDataDefaults
+from weaviate_cli.defaults import MAX_WORKERS, QueryDataDefaults
 
 
 # Query Group
@@ -28,13 +28,13 @@ def query() -> None:
 @click.option(
     "--search_type",
     default=QueryDataDefaults.search_type,
-    type=click.Choice(["fetch", "vector", "keyword", "hybrid", "uuid"]),
+    type=click.Choice(["fetch", "vector", "near_vector", "keyword", "hybrid", "uuid"]),
     help='Search type (default: "fetch").',
 )
 @click.option(
     "--query",
     default=QueryDataDefaults.query,
-    help="Query string for the search. Only used when search type is vector, keyword or hybrid (default: 'Action movie').",
+    help="Query string for the search. Only used when search type is vector, keyword or hybrid; near_vector search uses --vector (default: 'Action movie').",
 )
 @click.option(
     "--consistency_level",
@@ -62,6 +62,52 @@ def query() -> None:
     default=QueryDataDefaults.target_vector,
     help="Target vector to query (default: 'None').",
 )
+@click.option(
+    "--concurrency",
+    default=QueryDataDefaults.concurrency,
+    type=click.IntRange(min=1),
+    help=f"Maximum number of queries in flight at once, across tenants, --repeat runs or --queries_file entries (default: {MAX_WORKERS}; --repeat runs one query at a time unless this is set).",
+)
+@click.option(
+    "--merge_results",
+    is_flag=True,
+    default=QueryDataDefaults.merge_results,
+    help="Merge the results of all queried tenants into one global top-k, ranked by distance for vector search and by score for keyword and hybrid search (default: False).",
+)
+@click.option(
+    "--repeat",
+    default=QueryDataDefaults.repeat,
+    type=click.IntRange(min=1),
+    help="Run the query this many times and report min/p50/p99/max network latency, excluding rendering (default: 1).",
+)
+@click.option(
+    "--warmup",
+    default=QueryDataDefaults.warmup,
+    type=click.IntRange(min=0),
+    help="Number of discarded runs before the measured --repeat runs (default: 0).",
+)
+@click.option(
+    "--vector",
+    default=QueryDataDefaults.vector,
+    help="Query vector for near_vector search: an inline comma separated list of floats, or a .npy/.fvecs file with one vector per row. Without it, seeded random vectors with the collection's dimensions are used (default: None).",
+)
+@click.option(
+    "--vector_seed",
+    default=QueryDataDefaults.vector_seed,
+    type=int,
+    help=f"Seed for the generated near_vector query vectors (default: {QueryDataDefaults.vector_seed}).",
+)
+@click.option(
+    "--queries_file",
+    default=QueryDataDefaults.queries_file,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Run every query of this file instead of --query: one query string per line, or one query vector per row of a .npy file (default: None).",
+)
+@click.option(
+    "--output",
+    default=QueryDataDefaults.output,
+    help="JSONL file the --queries_file results are written to (default: '<queries_file>.results.jsonl').",
+)
 @click.option(
     "--json",
     "json_output",
@@ -69,6 +115,12 @@ def query() -> None:
     default=False,
     help="Output in JSON format.",
 )
+@click.option(
+    "--jsonl",
+    is_flag=True,
+    default=False,
+    help="Output one JSON object per line, streamed as results are rendered.",
+)
 @click.pass_context
 def query_data_cli(
     ctx,
@@ -80,14 +132,25 @@ def query_data_cli(
     properties,
     tenants,
     target_vector,
+    concurrency,
+    merge_results,
+    repeat,
+    warmup,
+    vector,
+    vector_seed,
+    queries_file,
+    output,
     json_output,
+    jsonl,
 ):
     """Query data in a collection in Weaviate."""
 
     client = None
     try:
         client = get_client_from_context(ctx)
-        data_manager = DataManager(client)
+        # The async client is only connected when several tenants or a
+        # queries file are queried.
+        data_manager = DataManager(client, get_async_client_from_context(ctx))
         # Call the function from query_data.py with general and specific arguments
         data_manager.query_data(
             collection=collection,
@@ -98,7 +161,16 @@ def query_data_cli(
             properties=properties,
             tenants=tenants,
             target_vector=target_vector,
+            concurrency=concurrency,
+            merge_results=merge_results,
+            repeat=repeat,
+            warmup=warmup,
+            vector=vector,
+            vector_seed=vector_seed,
+            queries_file=queries_file,
+            output=output,
             json_output=json_output,
+            jsonl=jsonl,
         )
     except Exception as e:
         click.echo(f"Error: {e}")
@@ -110,6 +110,41 @@ def update() -> None:
     type=str,
     help="Date property name for TTL when object_ttl_type is 'property' (default: 'releaseDate'). Only valid when --object_ttl_type=property.",
 )
+@click.option(
+    "--ef",
+    default=UpdateCollectionDefaults.ef,
+    type=int,
+    help="HNSW query-time ef; -1 picks ef dynamically within the dynamic ef bounds (default: None).",
+)
+@click.option(
+    "--dynamic_ef_min",
+    default=UpdateCollectionDefaults.dynamic_ef_min,
+    type=int,
+    help="Lower bound of the dynamic ef (default: None).",
+)
+@click.option(
+    "--dynamic_ef_max",
+    default=UpdateCollectionDefaults.dynamic_ef_max,
+    type=int,
+    help="Upper bound of the dynamic ef (default: None).",
+)
+@click.option(
+    "--dynamic_ef_factor",
+    default=UpdateCollectionDefaults.dynamic_ef_factor,
+    type=int,
+    help="Dynamic ef as a multiple of the query limit (default: None).",
+)
+@click.option(
+    "--rescore_limit",
+    default=UpdateCollectionDefaults.rescore_limit,
+    type=int,
+    help="Rescore limit of the HNSW index's BQ, SQ or RQ quantizer (default: None).",
+)
+@click.option(
+    "--target_vector",
+    default=UpdateCollectionDefaults.target_vector,
+    help="Named vector whose ef, dynamic ef and rescore_limit to update (default: every named vector).",
+)
 @click.pass_context
 def update_collection_cli(
     ctx: click.Context,
@@ -127,6 +162,12 @@ def update_collection_cli(
     object_ttl_time: Optional[int],
     object_ttl_filter_expired: bool,
     object_ttl_property_name: Optional[str],
+    ef: Optional[int],
+    dynamic_ef_min: Optional[int],
+    dynamic_ef_max: Optional[int],
+    dynamic_ef_factor: Optional[int],
+    rescore_limit: Optional[int],
+    target_vector: Optional[str],
 ) -> None:
     """Update a collection in Weaviate."""
 
@@ -160,6 +201,12 @@ def update_collection_cli(
             object_ttl_time=object_ttl_time,
             object_ttl_filter_expired=object_ttl_filter_expired,
             object_ttl_property_name=object_ttl_property_name,
+            ef=ef,
+            dynamic_ef_min=dynamic_ef_min,
+            dynamic_ef_max=dynamic_ef_max,
+            dynamic_ef_factor=dynamic_ef_factor,
+            rescore_limit=rescore_limit,
+            target_vector=target_vector,
         )
     except Exception as e:
         click.echo(f"Error: {e}")
@@ -317,7 +364,7 @@ def update_shards_cli(
     "--parallel_workers",
     default=UpdateDataDefaults.parallel_workers,
     type=click.IntRange(min=1),
-    help=f"Number of tenants to process in parallel (default: {UpdateDataDefaults.parallel_workers}). Set to 1 to disable parallelism.",
+    help=f"Maximum number of concurrent requests, shared across all tenants (default: {UpdateDataDefaults.parallel_workers}). Set to 1 to disable parallelism.",
 )
 @click.option(
     "--json", "json_output", is_flag=True, default=False, help="Output in JSON format."
@@ -50,6 +50,7 @@ PERMISSION_HELP_STRING = (
 )
 QUERY_MAXIMUM_RESULTS = 10000
 MAX_OBJECTS_PER_BATCH = 5000
+MAX_OBJECTS_PER_WORK_UNIT = 500
 
 try:
     _CPU_COUNT = multiprocessing.cpu_count()
@@ -146,6 +147,166 @@ class CreateBenchmarkDefaults:
     generate_graph: bool = False
     file_alias: Optional[str] = None
     tenant: Optional[str] = None
+    return_mode: str = "metadata"
+    processes: int = 1
+    search_strategy: str = "linear"
+    search_precision: int = 10
+    confirm_runs: int = 1
+    threshold_percentile: Optional[float] = None
+    slo: Optional[List[str]] = None
+    slo_window: int = 10
+    slo_grace: int = 5
+    slo_action: str = "abort"
+    arrival: str = "constant"
+    arrival_seed: int = 42
+    filter_properties: tuple = ()
+    filter_selectivities: tuple = (1.0, 10.0, 50.0)
+    tenants: Optional[str] = None
+    tenant_suffix: Optional[str] = None
+    tenant_distribution: str = "uniform"
+    zipf_exponent: float = 1.0
+    query_corpus: Optional[int] = None
+    corpus_properties: tuple = ()
+    corpus_objects: int = 10000
+    query_distribution: str = "uniform"
+    query_zipf_exponent: float = 1.0
+    slowest_terms: int = 10
+
+
+@dataclass
+class BenchmarkLatencyDefaults:
+    collection: str = "Movies"
+    query_types: tuple = ("hybrid", "bm25", "near_text")
+    queries: int = 200
+    warmup: int = 10
+    limit: int = 10
+    consistency_level: str = "QUORUM"
+    tenant: Optional[str] = None
+    return_mode: str = "metadata"
+
+
+@dataclass
+class BenchmarkThroughputDefaults:
+    collection: str = "Movies"
+    query_type: str = "hybrid"
+    limit: int = 10
+    consistency_level: str = "QUORUM"
+    tenant: Optional[str] = None
+    return_mode: str = "metadata"
+    max_concurrency: int = 512
+    level_duration: int = 10
+    warmup_duration: int = 5
+    think_time: float = 0.0
+
+
+@dataclass
+class BenchmarkRecallDefaults:
+    collection: str = "Movies"
+    limit: int = 10
+    qps_levels: tuple = (10, 50, 100)
+    test_duration: int = 10
+    warmup_duration: int = 2
+    num_queries: int = 1000
+    queries_file: Optional[str] = None
+    query_seed: int = 42
+    vectors: Optional[str] = None
+    ids: Optional[str] = None
+    target_vector: Optional[str] = None
+    cache_dir: str = ".benchmark_cache"
+    refresh: bool = False
+    consistency_level: str = "QUORUM"
+    tenant: Optional[str] = None
+    concurrency: Optional[int] = None
+
+
+@dataclass
+class BenchmarkSweepDefaults:
+    objects: int = 10000
+    vector_dimensions: int = 128
+    collection_prefix: str = "Sweep"
+    limit: int = 10
+    recall_qps: int = 50
+    num_queries: int = 1000
+    query_seed: int = 42
+    max_duration: int = 120
+    test_duration: int = 10
+    warmup_duration: int = 2
+    latency_threshold: int = 100
+    threshold_percentile: float = 99.0
+    search_strategy: str = "exponential"
+    consistency_level: str = "QUORUM"
+    cache_dir: str = ".benchmark_cache"
+    metrics_url: Optional[str] = None
+    keep: bool = False
+    output: str = "stdout"
+    generate_graph: bool = False
+
+
+@dataclass
+class BenchmarkEfSweepDefaults:
+    collection: str = "Movies"
+    ef: tuple = ()
+    default_ef_steps: tuple = (16, 32, 64, 128, 256, 512)
+    dynamic_ef_min: tuple = ()
+    dynamic_ef_max: tuple = ()
+    dynamic_ef_factor: tuple = ()
+    rescore_limit: tuple = ()
+    limit: int = 10
+    qps: int = 50
+    test_duration: int = 10
+    warmup_duration: int = 2
+    target_recall: Optional[float] = None
+    num_queries: int = 1000
+    queries_file: Optional[str] = None
+    query_seed: int = 42
+    vectors: Optional[str] = None
+    ids: Optional[str] = None
+    target_vector: Optional[str] = None
+    cache_dir: str = ".benchmark_cache"
+    refresh: bool = False
+    consistency_level: str = "QUORUM"
+    tenant: Optional[str] = None
+    concurrency: Optional[int] = None
+    output: str = "stdout"
+    generate_graph: bool = False
+
+
+@dataclass
+class BenchmarkMixedDefaults:
+    collection: str = "Movies"
+    query_type: str = "hybrid"
+    limit: int = 10
+    qps: int = 50
+    duration: int = 60
+    insert_rate: float = 500.0
+    batch_size: int = 100
+    update_rate: float = 0.0
+    delete_rate: float = 0.0
+    write_concurrency: int = 4
+    keep_objects: bool = False
+    consistency_level: str = "QUORUM"
+    tenant: Optional[str] = None
+    return_mode: str = "metadata"
+    concurrency: Optional[int] = None
+    output: str = "stdout"
+    generate_graph: bool = False
+
+
+@dataclass
+class BenchmarkColdTenantDefaults:
+    collection: str = "Movies"
+    tenants: Optional[str] = None
+    tenant_suffix: Optional[str] = None
+    sample: int = 20
+    seed: int = 42
+    state: str = "inactive"
+    activation: str = "auto"
+    concurrency: int = 1
+    timeout: float = 300.0
+    poll_interval: float = 0.1
+    consistency_level: str = "QUORUM"
+    output: str = "stdout"
+    generate_graph: bool = False
 
 
 @dataclass
@@ -236,6 +397,28 @@ class QueryDataDefaults:
     properties: str = "title,keywords"
     tenants: Optional[str] = None
     target_vector: Optional[str] = None
+    # None: MAX_WORKERS across tenants and --queries_file entries, 1 for --repeat.
+    concurrency: Optional[int] = None
+    merge_results: bool = False
+    repeat: int = 1
+    warmup: int = 0
+    queries_file: Optional[str] = None
+    output: Optional[str] = None
+    vector: Optional[str] = None
+    vector_seed: int = 42
+
+
+@dataclass
+class ExportDataDefaults:
+    collection: str = "Movies"
+    output: Optional[str] = None
+    file_format: str = "jsonl"
+    tenants: Optional[str] = None
+    include_vectors: bool = True
+    consistency_level: str = "quorum"
+    page_size: int = 1000
+    prefetch: int = 4
+    parallel_workers: int = MAX_WORKERS
 
 
 @dataclass
@@ -263,6 +446,12 @@ class UpdateCollectionDefaults:
     object_ttl_time: Optional[int] = None
     object_ttl_filter_expired: Optional[bool] = None
     object_ttl_property_name: str = "releaseDate"
+    ef: Optional[int] = None
+    dynamic_ef_min: Optional[int] = None
+    dynamic_ef_max: Optional[int] = None
+    dynamic_ef_factor: Optional[int] = None
+    rescore_limit: Optional[int] = None
+    target_vector: Optional[str] = None
 
 
 @dataclass
@@ -1,28 +1,107 @@
 import asyncio
 import csv
+import hashlib
+import inspect
+import itertools
 import json
+import os
+import urllib.request
+import multiprocessing
 from io import TextIOWrapper
 import random
+import re
 import time
+from datetime import datetime, timezone
+from collections import Counter, deque
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Any
+from queue import Empty
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Any
 from pathlib import Path
-from collections import deque
 from pathlib import Path as _Path
 
 import numpy as np
 import click
 from weaviate.collections import CollectionAsync
 from weaviate.collections.classes.filters import _FilterOr
+from weaviate.collections.classes.tenants import Tenant, TenantActivityStatus
 import weaviate.classes as wvc
-from weaviate_cli.defaults import CreateBenchmarkDefaults
+from weaviate_cli.managers.collection_manager import CollectionManager
+from weaviate_cli.managers.data_manager import (
+    DataManager,
+    _NpyStreamWriter,
+    generate_movie_object,
+)
+from weaviate_cli.defaults import (
+    BenchmarkEfSweepDefaults,
+    BenchmarkColdTenantDefaults,
+    BenchmarkLatencyDefaults,
+    BenchmarkMixedDefaults,
+    BenchmarkRecallDefaults,
+    BenchmarkSweepDefaults,
+    BenchmarkThroughputDefaults,
+    CreateBenchmarkDefaults,
+)
 
 # Constants
 PER_REQUEST_TIMEOUT_S = 10.0
-ROLLING_WINDOW = 5000
 CONCURRENCY_SAFETY = 1.3
+# An auto-sized worker pool only shrinks once Little's law asks for less than
+# this share of it, so it does not churn on latency noise.
+POOL_SHRINK_RATIO = 0.75
 LATENCY_EWMA_ALPHA = 0.3
 QPS_EWMA_ALPHA = 0.3
+LOAD_GENERATOR_START_TIMEOUT_S = 60.0
+# A load generator process using this share of a CPU core, or whose event loop
+# wakes up this late (P99, ms), is itself limiting the benchmark.
+CLIENT_CPU_SATURATION = 0.9
+CLIENT_LOOP_LAG_MS = 20.0
+# What each query returns for --return: (return_properties, return_metadata).
+# None keeps the client default of every non-reference property.
+RETURN_MODES = {
+    "ids-only": ([], None),
+    "metadata": ([], wvc.query.MetadataQuery(certainty=True)),
+    "full": (None, wvc.query.MetadataQuery(certainty=True)),
+}
+# Selectivity estimation for --filter-property: at most this many distinct
+# values per equality property, and bisection steps per range threshold.
+FILTER_GROUP_LIMIT = 1000
+FILTER_SEARCH_STEPS = 40
+# Exact top-k for `benchmark recall`: base vectors are read this many rows at
+# a time and scored against this many queries per matrix multiply.
+GROUND_TRUTH_BASE_CHUNK = 65536
+GROUND_TRUTH_QUERY_BLOCK = 1024
+RECALL_EXPORT_BATCH = 10000
+# Objects pre-generated for the writes of `benchmark mixed`, and the ids per
+# delete request when removing them afterwards.
+MIXED_OBJECT_POOL = 1000
+MIXED_DELETE_BATCH = 1000
+# Query corpora built from the collection's text (see QueryCorpus): words
+# shorter than this and these stopwords are not query terms.
+CORPUS_MIN_WORD_LENGTH = 3
+CORPUS_STOPWORDS = frozenset(
+    "and are but can for from had has have her his its not our she that the "
+    "their them then there these they this was were what when where which "
+    "who will with would you your".split()
+)
+# States `benchmark cold-tenants` can put tenants in, and how often it checks
+# that they got there.
+COLD_TENANT_STATES = {
+    "inactive": TenantActivityStatus.INACTIVE,
+    "offloaded": TenantActivityStatus.OFFLOADED,
+}
+COLD_TENANT_STATUS_POLL_S = 0.5
+CONSISTENCY_LEVELS = {
+    "ONE": wvc.ConsistencyLevel.ONE,
+    "QUORUM": wvc.ConsistencyLevel.QUORUM,
+    "ALL": wvc.ConsistencyLevel.ALL,
+}
+
+
+def _combine_filters(filters: Optional[List]) -> Any:
+    """None, the only filter, or all of them OR-ed."""
+    if not filters:
+        return None
+    return filters[0] if len(filters) == 1 else _FilterOr(filters)
 
 
 def _now_ns() -> int:
@@ -33,15 +112,1130 @@ def _ns_to_ms(ns: int) -> float:
     return ns / 1e6
 
 
+class LatencyHistogram:
+    """
+    Fixed-memory, log-bucketed histogram of non-negative integers (HDR style).
+
+    Values below 2**sub_bucket_bits are counted exactly; above that every
+    power-of-two range is split into 2**(sub_bucket_bits - 1) equal buckets,
+    so the relative error of any reported value is below 2**(1 - sub_bucket_bits)
+    (0.8% for the default of 8 bits). Values above `max_value` are clamped.
+
+    Latencies are recorded in microseconds; certainties are recorded in
+    millionths (see CERTAINTY_SCALE). Percentiles walk the buckets once, so
+    they cost O(buckets) regardless of how many values were recorded.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 8, max_value: int = 2**36) -> None:
+        self.sub_bucket_bits = sub_bucket_bits
+        self.max_value = max_value
+        self._sub_count = 1 << sub_bucket_bits
+        self._half = self._sub_count >> 1
+        self.counts = np.zeros(self._index(max_value) + 1, dtype=np.int64)
+        self.total = 0
+        self.sum = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return (
+            self._sub_count + (shift - 1) * self._half + (value >> shift) - self._half
+        )
+
+    def _bucket_upper(self, index: int) -> int:
+        if index < self._sub_count:
+            return index
+        shift = (index - self._sub_count) // self._half + 1
+        mantissa = (index - self._sub_count) % self._half + self._half
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, value: float) -> None:
+        value = min(max(int(value), 0), self.max_value)
+        self.counts[self._index(value)] += 1
+        self.total += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def record_ms(self, ms: float) -> None:
+        """Record a latency given in milliseconds at microsecond resolution."""
+        self.record(round(ms * 1000))
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.sub_bucket_bits != self.sub_bucket_bits or len(other.counts) != len(
+            self.counts
+        ):
+            raise ValueError("Cannot merge histograms with different bucket layouts.")
+        self.counts += other.counts
+        self.total += other.total
+        self.sum += other.sum
+        if other.total:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def reset(self) -> None:
+        self.counts[:] = 0
+        self.total = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+
+    def copy(self) -> "LatencyHistogram":
+        clone = LatencyHistogram(self.sub_bucket_bits, self.max_value)
+        clone.merge(self)
+        return clone
+
+    def percentiles(self, qs: List[float]) -> List[float]:
+        """Values at the given percentiles (0-100), in recorded units."""
+        if self.total == 0:
+            return [0.0 for _ in qs]
+        cumulative = np.cumsum(self.counts)
+        out = []
+        for q in qs:
+            rank = max(1, int(np.ceil(q / 100.0 * self.total)))
+            index = int(np.searchsorted(cumulative, rank))
+            # Report the bucket's highest equivalent value, bounded by the
+            # observed extremes so exact buckets stay exact.
+            out.append(float(min(max(self._bucket_upper(index), self.min), self.max)))
+        return out
+
+    def percentile(self, q: float) -> float:
+        return self.percentiles([q])[0]
+
+    def mean(self) -> float:
+        return self.sum / self.total if self.total else 0.0
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form keeping only the non-empty buckets."""
+        nonzero = np.nonzero(self.counts)[0]
+        return {
+            "sub_bucket_bits": self.sub_bucket_bits,
+            "max_value": self.max_value,
+            "total": self.total,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "buckets": {str(int(i)): int(self.counts[i]) for i in nonzero},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        hist = cls(data["sub_bucket_bits"], data["max_value"])
+        for index, count in data["buckets"].items():
+            hist.counts[int(index)] = count
+        hist.total = data["total"]
+        hist.sum = data["sum"]
+        hist.min = data["min"]
+        hist.max = data["max"]
+        return hist
+
+    def csv_rows(self) -> List[Tuple[int, int, float]]:
+        """(bucket upper value, count, cumulative percentile) per non-empty bucket."""
+        rows = []
+        seen = 0
+        for index in np.nonzero(self.counts)[0]:
+            count = int(self.counts[index])
+            seen += count
+            rows.append(
+                (self._bucket_upper(int(index)), count, 100.0 * seen / self.total)
+            )
+        return rows
+
+
+# Certainties (0..1) are recorded into a LatencyHistogram in millionths.
+CERTAINTY_SCALE = 1_000_000
+
+
+class PhaseHistograms:
+    """The histograms recorded for one benchmark phase (or one interval of it).
+
+    `latency` is measured from each query's intended send time, which includes
+    time spent waiting for a free worker; `service` only covers the request
+    itself and `queue_lag` the wait between intended and actual send time.
+
+    The load generator monitors itself too: `loop_lag` is how late its
+    producer woke up for a scheduled send, `cpu` the peak share of a CPU core
+    its process used in any second and `queue_depth` the most queries queued
+    for a worker. Merged over processes, these describe the busiest one.
+    """
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.service = LatencyHistogram()
+        self.queue_lag = LatencyHistogram()
+        self.certainty = LatencyHistogram()
+        self.loop_lag = LatencyHistogram()
+        self.cpu = 0.0
+        self.queue_depth = 0
+        # Queries that failed or timed out (without failing the phase).
+        self.errors = 0
+        # Latency per workload class, e.g. per filter (see FilterCase).
+        self.tags: Dict[str, LatencyHistogram] = {}
+        # [queries, total and max service time in µs] per query term; too many
+        # terms for a histogram each.
+        self.terms: Dict[str, List[int]] = {}
+
+    def items(self) -> List[Tuple[str, LatencyHistogram]]:
+        return [
+            ("latency", self.latency),
+            ("service", self.service),
+            ("queue_lag", self.queue_lag),
+            ("certainty", self.certainty),
+            ("loop_lag", self.loop_lag),
+        ]
+
+    def record(
+        self,
+        latency_ms: float,
+        service_ms: float,
+        queue_lag_ms: float,
+        certainties: Optional[List[float]] = None,
+    ) -> None:
+        self.latency.record_ms(latency_ms)
+        self.service.record_ms(service_ms)
+        self.queue_lag.record_ms(queue_lag_ms)
+        for c in certainties or []:
+            self.certainty.record(round(c * CERTAINTY_SCALE))
+
+    def record_tag(self, tag: str, latency_ms: float) -> None:
+        if tag not in self.tags:
+            self.tags[tag] = LatencyHistogram()
+        self.tags[tag].record_ms(latency_ms)
+
+    def record_term(self, term: str, service_ms: float) -> None:
+        us = int(round(service_ms * 1000.0))
+        entry = self.terms.get(term)
+        if entry is None:
+            self.terms[term] = [1, us, us]
+        else:
+            entry[0] += 1
+            entry[1] += us
+            entry[2] = max(entry[2], us)
+
+    def merge(self, other: "PhaseHistograms") -> None:
+        for (_, mine), (_, theirs) in zip(self.items(), other.items()):
+            mine.merge(theirs)
+        self.errors += other.errors
+        for tag, hist in other.tags.items():
+            self.tags.setdefault(tag, LatencyHistogram()).merge(hist)
+        for term, (count, total, peak) in other.terms.items():
+            entry = self.terms.setdefault(term, [0, 0, 0])
+            entry[0] += count
+            entry[1] += total
+            entry[2] = max(entry[2], peak)
+        self.cpu = max(self.cpu, other.cpu)
+        self.queue_depth = max(self.queue_depth, other.queue_depth)
+
+    def reset(self) -> None:
+        for _, hist in self.items():
+            hist.reset()
+        self.errors = 0
+        self.cpu = 0.0
+        self.queue_depth = 0
+        self.tags = {}
+        self.terms = {}
+
+    def copy(self) -> "PhaseHistograms":
+        clone = PhaseHistograms()
+        clone.merge(self)
+        return clone
+
+    def error_rate(self) -> float:
+        attempts = self.latency.total + self.errors
+        return self.errors / attempts if attempts else 0.0
+
+    def client_load(self) -> Tuple[float, float, int]:
+        """Load generator peak CPU (% of a core), P99 loop lag (ms) and peak
+        queue depth."""
+        return (
+            self.cpu * 100.0,
+            self.loop_lag.percentiles([99])[0] / 1000.0,
+            self.queue_depth,
+        )
+
+    def client_saturated(self) -> bool:
+        cpu, loop_lag, _ = self.client_load()
+        return cpu >= CLIENT_CPU_SATURATION * 100.0 or loop_lag >= CLIENT_LOOP_LAG_MS
+
+    def to_dict(self) -> dict:
+        data = {name: hist.to_dict() for name, hist in self.items()}
+        data["errors"] = self.errors
+        data["tags"] = {tag: hist.to_dict() for tag, hist in self.tags.items()}
+        data["terms"] = self.terms
+        data["cpu"] = self.cpu
+        data["queue_depth"] = self.queue_depth
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PhaseHistograms":
+        phase = cls()
+        for name, _ in phase.items():
+            setattr(phase, name, LatencyHistogram.from_dict(data[name]))
+        phase.errors = data.get("errors", 0)
+        phase.tags = {
+            tag: LatencyHistogram.from_dict(hist)
+            for tag, hist in data.get("tags", {}).items()
+        }
+        phase.terms = {term: list(v) for term, v in data.get("terms", {}).items()}
+        phase.cpu = data.get("cpu", 0.0)
+        phase.queue_depth = data.get("queue_depth", 0)
+        return phase
+
+
+class FilterCase:
+    """
+    One filter of a filtered-search workload.
+
+    `tag` names its class in the reports, e.g. "eq:status@10%" for equality
+    on `status` aiming at 10% of the objects; `selectivity` is the fraction
+    of objects it matched when the workload was built.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        prop: str,
+        target: float,
+        selectivity: float,
+        filters: Any,
+    ) -> None:
+        self.kind = kind
+        self.prop = prop
+        self.target = target
+        self.selectivity = selectivity
+        self.filters = filters
+
+    @property
+    def tag(self) -> str:
+        return f"{self.kind}:{self.prop}@{self.target * 100:g}%"
+
+
+def _rank_draws(
+    n: int, distribution: str, s: float, rng: np.random.Generator, block: int
+) -> Iterator[np.ndarray]:
+    """Endless blocks of ranks in [0, n): uniform, or rank r (from 1) with
+    probability proportional to 1 / r**s for "zipf"."""
+    cdf = None
+    if distribution == "zipf":
+        cdf = np.cumsum(1.0 / np.arange(1, n + 1) ** s)
+        cdf /= cdf[-1]
+    while True:
+        if cdf is None:
+            yield rng.integers(0, n, block)
+        else:
+            yield np.minimum(np.searchsorted(cdf, rng.random(block)), n - 1)
+
+
+class QueryCorpus:
+    """
+    The query terms an open-loop benchmark draws from.
+
+    `terms` are ordered from most to least frequent. "uniform" picks any of
+    them with equal probability; "zipf" picks the term of rank r with
+    probability proportional to 1 / r**s, so a few terms are hot and a long
+    tail is rarely repeated, as in real query logs.
+    """
+
+    _BLOCK = 4096
+
+    def __init__(
+        self,
+        terms: List[str],
+        distribution: str = "uniform",
+        s: float = 1.0,
+        seed: int = 0,
+    ) -> None:
+        self.terms = terms
+        self.distribution = distribution
+        self.s = s
+        self.seed = seed
+
+    @property
+    def name(self) -> str:
+        return f"zipf(s={self.s:g})" if self.distribution == "zipf" else "uniform"
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str], size: int, **kwargs) -> "QueryCorpus":
+        """The `size` most frequent words and two-word phrases of `texts`,
+        leaving out stopwords and short words."""
+        counts: Counter = Counter()
+        for text in texts:
+            words = [
+                w
+                for w in re.findall(r"[^\W\d_]+", text.lower())
+                if len(w) >= CORPUS_MIN_WORD_LENGTH and w not in CORPUS_STOPWORDS
+            ]
+            counts.update(words)
+            counts.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+        return cls([term for term, _ in counts.most_common(size)], **kwargs)
+
+    def sampler(self, stream: int = 0) -> Iterator[str]:
+        """Endless term draws; `stream` separates the draws of parallel load
+        generators."""
+        rng = np.random.default_rng([self.seed, stream])
+        for ranks in _rank_draws(
+            len(self.terms), self.distribution, self.s, rng, self._BLOCK
+        ):
+            for rank in ranks:
+                yield self.terms[rank]
+
+
+class TenantWorkload:
+    """
+    The tenants a multi-tenant benchmark spreads its queries over.
+
+    `tenants` are ordered from most to least popular. "uniform" picks any of
+    them with equal probability; "zipf" picks the tenant of rank r with
+    probability proportional to 1 / r**s. Latency is reported per popularity
+    tier: the top 1% of the tenants by rank, then 1-10%, 10-50% and 50-100%.
+    """
+
+    TIERS = ((0.01, "top 1%"), (0.10, "1-10%"), (0.50, "10-50%"), (1.0, "50-100%"))
+    _BLOCK = 4096
+
+    def __init__(
+        self,
+        tenants: List[str],
+        distribution: str = "uniform",
+        s: float = 1.0,
+        seed: int = 0,
+    ) -> None:
+        self.tenants = tenants
+        self.distribution = distribution
+        self.s = s
+        self.seed = seed
+
+    @property
+    def name(self) -> str:
+        return f"zipf(s={self.s:g})" if self.distribution == "zipf" else "uniform"
+
+    def tiers(self) -> np.ndarray:
+        """Tier index of every rank; the top tier holds at least one tenant."""
+        n = len(self.tenants)
+        starts = [max(1, int(np.ceil(share * n))) for share, _ in self.TIERS[:-1]]
+        return np.searchsorted(starts, np.arange(n), side="right")
+
+    def tier_sizes(self) -> List[int]:
+        return np.bincount(self.tiers(), minlength=len(self.TIERS)).tolist()
+
+    def sampler(self, stream: int = 0) -> Iterator[Tuple[str, str]]:
+        """Endless (tenant, tier tag) draws; `stream` separates the draws of
+        parallel load generators."""
+        rng = np.random.default_rng([self.seed, stream])
+        tags = [f"tenant:{label}" for _, label in self.TIERS]
+        tiers = self.tiers()
+        for ranks in _rank_draws(
+            len(self.tenants), self.distribution, self.s, rng, self._BLOCK
+        ):
+            for rank in ranks:
+                yield self.tenants[rank], tags[tiers[rank]]
+
+
+class SloRule:
+    """One service level objective, e.g. "p95<50" (ms) or "error_rate<0.1%"."""
+
+    _PATTERN = re.compile(
+        r"^\s*(p\d+(?:\.\d+)?|error_rate)\s*<\s*(\d+(?:\.\d+)?)\s*(ms|%)?\s*$"
+    )
+
+    def __init__(self, text: str) -> None:
+        match = self._PATTERN.match(text)
+        if not match:
+            raise ValueError(
+                f"Invalid SLO rule '{text}'. Use e.g. 'p95<50' (milliseconds) or 'error_rate<0.1%'."
+            )
+        self.text = text.strip()
+        self.metric, limit, unit = match.groups()
+        if self.metric == "error_rate":
+            if unit == "ms":
+                raise ValueError(f"Invalid SLO rule '{text}': error_rate is a ratio.")
+            self.limit = float(limit) / 100.0 if unit == "%" else float(limit)
+        else:
+            if unit == "%":
+                raise ValueError(f"Invalid SLO rule '{text}': {self.metric} is in ms.")
+            self.percentile = float(self.metric[1:])
+            self.limit = float(limit)
+
+    def observe(self, window: "PhaseHistograms") -> float:
+        """The rule's metric over a window (ms, or a 0..1 ratio for error_rate)."""
+        if self.metric == "error_rate":
+            return window.error_rate()
+        return window.latency.percentile(self.percentile) / 1000.0
+
+    def format(self, value: float) -> str:
+        if self.metric == "error_rate":
+            return f"{value * 100:.3f}%"
+        return f"{value:.2f} ms"
+
+
+class SloPolicy:
+    """
+    SLO rules evaluated over a sliding window of one-second intervals.
+
+    Nothing is evaluated during the first `grace` seconds of a phase. On a
+    breach the phase is aborted when `action` is "abort"; with "continue" it
+    runs to the end and only the first breach is reported.
+    """
+
+    def __init__(
+        self, rules: List[SloRule], window: int, grace: int, action: str
+    ) -> None:
+        self.rules = rules
+        self.window = window
+        self.grace = grace
+        self.action = action
+
+    def monitor(self) -> "_SloMonitor":
+        return _SloMonitor(self)
+
+
+class _SloMonitor:
+    def __init__(self, policy: SloPolicy) -> None:
+        self.policy = policy
+        self.intervals: deque = deque(maxlen=max(1, policy.window))
+        self.violation: Optional[dict] = None
+
+    def observe(self, interval: PhaseHistograms, elapsed: float) -> Optional[dict]:
+        """Add one interval; return the first violation once a rule breaks."""
+        self.intervals.append(interval.copy())
+        if self.violation is not None or elapsed < self.policy.grace:
+            return self.violation
+        window = PhaseHistograms()
+        for past in self.intervals:
+            window.merge(past)
+        if window.latency.total + window.errors == 0:
+            return None
+        for rule in self.policy.rules:
+            observed = rule.observe(window)
+            if observed >= rule.limit:
+                self.violation = {
+                    "rule": rule.text,
+                    "observed": rule.format(observed),
+                    "elapsed_s": round(elapsed, 1),
+                    "window_s": len(self.intervals),
+                }
+                return self.violation
+        return None
+
+
+class ArrivalProcess:
+    """
+    When an open-loop producer sends its queries, at a given mean rate.
+
+    Specs: "constant" (fixed 1/qps spacing), "poisson" (exponential gaps),
+    "bursts[:ON/OFF]" (Poisson arrivals during ON seconds, none during OFF
+    seconds; default 1/4) and "replay:PATH" (the gaps between the timestamps
+    in PATH, one per line in seconds, scaled to the mean rate and looped).
+    """
+
+    _BURSTS = re.compile(r"^bursts(?::(\d+(?:\.\d+)?)/(\d+(?:\.\d+)?))?$")
+
+    def __init__(
+        self,
+        kind: str = "constant",
+        seed: int = 0,
+        on_s: float = 1.0,
+        off_s: float = 4.0,
+        gaps: Optional[List[float]] = None,
+    ) -> None:
+        self.kind = kind
+        self.seed = seed
+        self.on_s = on_s
+        self.off_s = off_s
+        self.gaps = gaps
+
+    @classmethod
+    def parse(cls, spec: str, seed: int = 0) -> "ArrivalProcess":
+        spec = spec.strip()
+        if spec in ("constant", "poisson"):
+            return cls(spec, seed)
+        match = cls._BURSTS.match(spec)
+        if match:
+            on_s, off_s = match.groups()
+            if on_s is None:
+                return cls("bursts", seed)
+            if float(on_s) <= 0:
+                raise ValueError(f"Invalid arrival '{spec}': ON must be positive.")
+            return cls("bursts", seed, float(on_s), float(off_s))
+        if spec.startswith("replay:"):
+            path = spec[len("replay:") :]
+            with open(path) as f:
+                stamps = sorted(float(line) for line in f if line.strip())
+            gaps = [b - a for a, b in zip(stamps, stamps[1:])]
+            if not gaps or sum(gaps) <= 0:
+                raise ValueError(
+                    f"Invalid arrival '{spec}': needs at least two distinct timestamps."
+                )
+            return cls("replay", seed, gaps=gaps)
+        raise ValueError(
+            f"Invalid arrival '{spec}'. Use constant, poisson, bursts[:ON/OFF] or replay:PATH."
+        )
+
+    @property
+    def name(self) -> str:
+        if self.kind == "bursts":
+            return f"bursts:{self.on_s:g}/{self.off_s:g}"
+        return self.kind
+
+    def offsets(self, qps: float, stream: int = 0) -> Iterator[float]:
+        """Endless send times in seconds from the phase start; `stream`
+        gives independent sequences to several load generators."""
+        rng = random.Random(self.seed * 1_000_003 + stream)
+        if self.kind == "constant":
+            k = 0
+            while True:
+                yield k / qps
+                k += 1
+        elif self.kind == "poisson":
+            t = 0.0
+            while True:
+                t += rng.expovariate(qps)
+                yield t
+        elif self.kind == "bursts":
+            period = self.on_s + self.off_s
+            on_rate = qps * period / self.on_s
+            t = 0.0
+            while True:
+                t += rng.expovariate(on_rate)
+                window_start = (t // period) * period
+                if t - window_start >= self.on_s:
+                    # Exponential gaps are memoryless: restart at the next burst.
+                    t = window_start + period
+                    continue
+                yield t
+        else:
+            scale = len(self.gaps) / (sum(self.gaps) * qps)
+            t = 0.0
+            while True:
+                for gap in self.gaps:
+                    t += gap * scale
+                    yield t
+
+
+class ArrivalSchedule:
+    """Queries per second of a phase: sent per the arrival process
+    (generated) and completed (achieved). Per second it also keeps the worker
+    pool size, the peak number of queries in flight and the peak backlog:
+    queries left queued while every worker was busy. Merged over processes,
+    these peaks add up."""
+
+    COUNTERS = ("generated", "achieved", "pool", "in_flight", "backlog")
+
+    def __init__(self) -> None:
+        self.generated: Counter = Counter()
+        self.achieved: Counter = Counter()
+        self.pool: Counter = Counter()
+        self.in_flight: Counter = Counter()
+        self.backlog: Counter = Counter()
+
+    def record_in_flight(
+        self, second: int, in_flight: int, pool: int, queued: int
+    ) -> None:
+        self.in_flight[second] = max(self.in_flight[second], in_flight)
+        self.pool[second] = max(self.pool[second], pool)
+        if in_flight >= pool and queued:
+            self.backlog[second] = max(self.backlog[second], queued)
+
+    def merge(self, other: "ArrivalSchedule") -> None:
+        for name in self.COUNTERS:
+            getattr(self, name).update(getattr(other, name))
+
+    def to_dict(self) -> dict:
+        return {name: dict(getattr(self, name)) for name in self.COUNTERS}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ArrivalSchedule":
+        schedule = cls()
+        for name in cls.COUNTERS:
+            getattr(schedule, name).update(
+                {int(k): v for k, v in data.get(name, {}).items()}
+            )
+        return schedule
+
+    def summary(self, duration: float) -> dict:
+        """Total, mean, peak and standard deviation of the per-second rates
+        over the first `duration` seconds."""
+        seconds = max(1, int(np.ceil(duration)))
+        result = {}
+        for name, counts in (
+            ("generated", self.generated),
+            ("achieved", self.achieved),
+        ):
+            rates = np.array([counts.get(i, 0) for i in range(seconds)], dtype=float)
+            result[name] = {
+                "total": int(rates.sum()),
+                "mean_qps": round(float(rates.mean()), 2),
+                "peak_qps": int(rates.max()),
+                "stdev_qps": round(float(rates.std()), 2),
+            }
+        busy = [s for s in range(seconds) if s in self.pool]
+        if busy:
+            pool = np.array([self.pool[s] for s in busy], dtype=float)
+            in_flight = np.array([self.in_flight[s] for s in busy], dtype=float)
+            result["workers"] = {
+                "min_pool": int(pool.min()),
+                "max_pool": int(pool.max()),
+                "mean_in_flight": round(float(in_flight.mean()), 2),
+                "peak_in_flight": int(in_flight.max()),
+                "peak_backlog": max(self.backlog.values(), default=0),
+                # Seconds in which queries waited for a worker rather than
+                # for the server.
+                "saturated_s": sum(1 for s in busy if self.backlog.get(s)),
+            }
+        return result
+
+
+def _similarity(queries: np.ndarray, base: np.ndarray, metric: str) -> np.ndarray:
+    """Scores of every (query, base row) pair, higher is closer. Cosine
+    expects normalized queries."""
+    if metric == "cosine":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            base = base / np.linalg.norm(base, axis=1, keepdims=True)
+        return queries @ base.T
+    if metric == "dot":
+        return queries @ base.T
+    if metric == "l2-squared":
+        return (
+            2 * (queries @ base.T)
+            - np.sum(queries**2, axis=1, keepdims=True)
+            - np.sum(base**2, axis=1)
+        )
+    raise ValueError(
+        f"Unsupported distance metric '{metric}'; recall supports cosine, dot and l2-squared."
+    )
+
+
+def exact_top_k(
+    base: np.ndarray,
+    queries: np.ndarray,
+    k: int,
+    metric: str,
+    base_chunk: int = GROUND_TRUTH_BASE_CHUNK,
+    query_block: int = GROUND_TRUTH_QUERY_BLOCK,
+) -> np.ndarray:
+    """
+    Row indices of the exact `k` nearest base vectors of every query, nearest
+    first.
+
+    `base` may be a memory map: it is read once, `base_chunk` rows at a time,
+    and each chunk is scored against `query_block` queries per matrix
+    multiply, keeping only a running top-k per query. Rows with NaNs (objects
+    without this vector) never match.
+    """
+    k = min(k, base.shape[0])
+    queries = np.asarray(queries, dtype=np.float32)
+    if metric == "cosine":
+        queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    best_scores = np.full((len(queries), 0), -np.inf, dtype=np.float32)
+    best_idx = np.empty((len(queries), 0), dtype=np.int64)
+    for start in range(0, base.shape[0], base_chunk):
+        chunk = np.asarray(base[start : start + base_chunk], dtype=np.float32)
+        chunk_idx = np.arange(start, start + len(chunk), dtype=np.int64)
+        new_scores, new_idx = [], []
+        for qs in range(0, len(queries), query_block):
+            scores = _similarity(queries[qs : qs + query_block], chunk, metric)
+            scores[np.isnan(scores)] = -np.inf
+            scores = np.concatenate([best_scores[qs : qs + query_block], scores], 1)
+            idx = np.concatenate(
+                [
+                    best_idx[qs : qs + query_block],
+                    np.broadcast_to(chunk_idx, (len(scores), len(chunk))),
+                ],
+                1,
+            )
+            if scores.shape[1] > k:
+                top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                scores = np.take_along_axis(scores, top, 1)
+                idx = np.take_along_axis(idx, top, 1)
+            new_scores.append(scores)
+            new_idx.append(idx)
+        best_scores = np.concatenate(new_scores)
+        best_idx = np.concatenate(new_idx)
+    order = np.argsort(-best_scores, axis=1, kind="stable")
+    return np.take_along_axis(best_idx, order, 1)
+
+
+class RecallProbe:
+    """
+    Scores the results of `near_vector` queries against the exact top-k.
+
+    Query `i` of the probe has the ground truth uuids `ground_truth[i]`; the
+    number of true neighbours found per query is counted in a fixed-size
+    histogram (0..k), so memory does not grow with the number of queries.
+    """
+
+    def __init__(self, ground_truth: List[set], k: int) -> None:
+        self.ground_truth = ground_truth
+        self.k = k
+        self.hits = np.zeros(k + 1, dtype=np.int64)
+
+    def record(self, query_index: int, objects: List[Any]) -> None:
+        found = {str(o.uuid) for o in objects[: self.k]}
+        self.hits[len(found & self.ground_truth[query_index])] += 1
+
+    def reset(self) -> None:
+        self.hits[:] = 0
+
+    def summary(self) -> dict:
+        """Mean recall@k and the recall@k of the worst 1% and 10% of queries."""
+        total = int(self.hits.sum())
+        if not total:
+            return {"queries": 0, "mean": 0.0, "p1": 0.0, "p10": 0.0}
+        cumulative = np.cumsum(self.hits)
+
+        def lowest(q: float) -> float:
+            return float(np.searchsorted(cumulative, q / 100 * total)) / self.k
+
+        mean = float(np.dot(self.hits, np.arange(self.k + 1))) / (total * self.k)
+        return {
+            "queries": total,
+            "mean": round(mean, 4),
+            "p1": round(lowest(1), 4),
+            "p10": round(lowest(10), 4),
+        }
+
+
 class BenchmarkManager(ABC):
 
-    def __init__(self, async_client) -> None:
+    def __init__(
+        self,
+        async_client,
+        client_factory: Optional[Callable[[], Any]] = None,
+    ) -> None:
         self.async_client = async_client
+        # Creates a fresh async client in each --processes load generator; it
+        # must be picklable (e.g. ConfigManager.get_async_client).
+        self.client_factory = client_factory
+        self._load_generators: Optional["_LoadGeneratorPool"] = None
+        # Cumulative histograms of every Main Test phase, keyed by target QPS.
+        self.main_phase_stats: Dict[int, PhaseHistograms] = {}
+        # First SLO breach of every failing Main Test phase.
+        self.slo_violations: List[dict] = []
+        # Open-loop send times and the per-second schedule of the last phase.
+        self.arrival = ArrivalProcess()
+        self.arrival_stream = 0
+        self.last_schedule = ArrivalSchedule()
+        # Schedule summary of every Main Test phase, keyed by target QPS.
+        self.main_phase_schedules: Dict[int, dict] = {}
+        # Filters the open-loop producer cycles through (none: unfiltered).
+        self.filter_cases: List[FilterCase] = []
+        # Tenants each open-loop query is routed to (none: `collection_obj`'s).
+        self.tenant_workload: Optional[TenantWorkload] = None
+        # Terms the open-loop producer draws (none: uniformly from the
+        # phase's query terms), and how many of the slowest ones to report.
+        self.query_corpus: Optional[QueryCorpus] = None
+        self.slowest_terms = CreateBenchmarkDefaults.slowest_terms
+        # near_vector queries: the query terms are row indices of
+        # `query_vectors`, and their results are scored by `recall_probe`.
+        self.query_vectors: Optional[np.ndarray] = None
+        self.target_vector: Optional[str] = None
+        self.recall_probe: Optional[RecallProbe] = None
 
     @abstractmethod
     async def run_benchmark(self, **kwargs) -> None:
         pass
 
+    async def _open_collection(
+        self,
+        collection: str,
+        consistency_level: str,
+        tenant: Optional[str],
+        pick_tenant: bool = True,
+    ) -> Tuple[CollectionAsync, Optional[str]]:
+        """Connect and return the collection to benchmark and its tenant.
+
+        Multi-tenant collections use `tenant`, or a random one when it is not
+        given; the tenant is None for single-tenant collections, and when
+        `pick_tenant` is false (the queries pick their own tenant).
+        """
+        await self.async_client.connect()
+        if not await self.async_client.collections.exists(collection):
+            raise Exception(f"Collection '{collection}' does not exist")
+        collection_obj = self.async_client.collections.get(
+            collection
+        ).with_consistency_level(CONSISTENCY_LEVELS[consistency_level])
+        cfg = await collection_obj.config.get()
+        if not cfg.multi_tenancy_config.enabled:
+            return collection_obj, None
+        if not pick_tenant and not tenant:
+            return collection_obj, None
+        if tenant:
+            exists_ok = await collection_obj.tenants.exists(tenant)
+            if not exists_ok:
+                raise Exception(
+                    f"Tenant '{tenant}' does not exist in collection '{collection}'"
+                )
+        else:
+            tenant_dict = await collection_obj.tenants.get()
+            if tenant_dict:
+                tenant = random.choice(list(tenant_dict.keys()))
+            else:
+                raise Exception(f"No tenants found in collection '{collection}'")
+        # apply tenant context for multitenant collections
+        click.echo(f"Using tenant '{tenant}' for benchmark")
+        return collection_obj.with_tenant(tenant), tenant
+
+    async def _build_tenant_workload(
+        self,
+        collection_obj: CollectionAsync,
+        tenants: Optional[str],
+        tenant_suffix: Optional[str],
+        distribution: str,
+        zipf_exponent: float,
+        seed: int,
+    ) -> TenantWorkload:
+        """Resolve the tenant set: "all" (in a seeded random popularity
+        order), a comma-separated list (most popular first), or the
+        "<suffix>-<n>" tenants of `create tenants` (ordered by n)."""
+        cfg = await collection_obj.config.get()
+        if not cfg.multi_tenancy_config.enabled:
+            raise Exception(
+                f"Collection '{collection_obj.name}' is not multi-tenant; --tenants and --tenant-suffix need tenants."
+            )
+        existing = await collection_obj.tenants.get()
+        if tenant_suffix:
+            prefix = f"{tenant_suffix}-"
+            indexed = [
+                (int(name[len(prefix) :]), name)
+                for name in existing
+                if name.startswith(prefix) and name[len(prefix) :].isdigit()
+            ]
+            names = [name for _, name in sorted(indexed)]
+        elif tenants == "all":
+            names = sorted(existing)
+            random.Random(seed).shuffle(names)
+        else:
+            names = [t.strip() for t in tenants.split(",") if t.strip()]
+            missing = [t for t in names if t not in existing]
+            if missing:
+                raise Exception(
+                    f"Tenants not found in collection '{collection_obj.name}': {', '.join(missing[:10])}"
+                )
+        if not names:
+            raise Exception(
+                f"No tenants in collection '{collection_obj.name}' match the tenant set."
+            )
+        inactive = sum(
+            1
+            for name in names
+            if existing[name].activity_status.value.upper() not in ("ACTIVE", "HOT")
+        )
+        workload = TenantWorkload(names, distribution, zipf_exponent, seed)
+        click.echo(
+            f"Spreading queries over {len(names)} tenants ({workload.name})"
+            + (f", {inactive} of them not active" if inactive else "")
+        )
+        return workload
+
+    async def _build_query_corpus(
+        self,
+        collection_obj: CollectionAsync,
+        size: int,
+        properties: List[str],
+        max_objects: int,
+        distribution: str,
+        zipf_exponent: float,
+        seed: int,
+    ) -> QueryCorpus:
+        """Build a query vocabulary from the text of up to `max_objects`
+        objects, read with the cursor API (all text properties by default)."""
+        cfg = await collection_obj.config.get()
+        text_props = [
+            p.name for p in cfg.properties if p.data_type.value in ("text", "text[]")
+        ]
+        if properties:
+            invalid = [p for p in properties if p not in text_props]
+            if invalid:
+                raise Exception(
+                    f"Not text properties of collection '{collection_obj.name}': {', '.join(invalid)}"
+                )
+        else:
+            properties = text_props
+        if not properties:
+            raise Exception(
+                f"Collection '{collection_obj.name}' has no text properties to build a query corpus from."
+            )
+
+        texts: List[str] = []
+        read = 0
+        async for obj in collection_obj.iterator(return_properties=properties):
+            for value in obj.properties.values():
+                if isinstance(value, str):
+                    texts.append(value)
+                elif isinstance(value, list):
+                    texts.extend(v for v in value if isinstance(v, str))
+            read += 1
+            if read >= max_objects:
+                break
+        corpus = QueryCorpus.from_texts(
+            texts, size, distribution=distribution, s=zipf_exponent, seed=seed
+        )
+        if not corpus.terms:
+            raise Exception(
+                f"No query terms found in {', '.join(properties)} of {read} objects."
+            )
+        click.echo(
+            f"Built a query corpus of {len(corpus.terms)} terms ({corpus.name}) "
+            f"from {', '.join(properties)} of {read} objects"
+        )
+        return corpus
+
+    def _slowest_term_summaries(self, stats: PhaseHistograms) -> List[dict]:
+        """The query terms with the highest mean service time in a phase."""
+        if len(stats.terms) < 2 or not self.slowest_terms:
+            return []
+        ranked = sorted(
+            stats.terms.items(), key=lambda item: item[1][1] / item[1][0], reverse=True
+        )
+        return [
+            {
+                "term": term,
+                "queries": count,
+                "mean_ms": round(total / count / 1000.0, 3),
+                "max_ms": round(peak / 1000.0, 3),
+            }
+            for term, (count, total, peak) in ranked[: self.slowest_terms]
+        ]
+
+    async def _build_filter_workload(
+        self,
+        collection_obj: CollectionAsync,
+        properties: List[str],
+        selectivities: List[float],
+    ) -> List[FilterCase]:
+        """Build one filter per property and target selectivity (in %).
+
+        Text properties get equality filters on the values whose counts add
+        up closest to the target; number, int and date properties get
+        `< threshold` filters with the threshold bisected on aggregate counts.
+        """
+        cfg = await collection_obj.config.get()
+        data_types = {p.name: p.data_type.value for p in cfg.properties}
+        total = await self._count(collection_obj)
+        if not total:
+            raise Exception("Cannot estimate filter selectivity: collection is empty.")
+        cases = []
+        for prop in properties:
+            data_type = data_types.get(prop)
+            if data_type is None:
+                raise Exception(f"Property '{prop}' does not exist in the collection.")
+            for percent in selectivities:
+                target = percent / 100.0
+                if data_type == "text":
+                    filters = await self._equality_filter(
+                        collection_obj, prop, target, total
+                    )
+                    kind = "eq"
+                elif data_type in ("number", "int", "date"):
+                    filters = await self._range_filter(
+                        collection_obj, prop, data_type, target, total
+                    )
+                    kind = "range"
+                else:
+                    raise Exception(
+                        f"Property '{prop}' of type '{data_type}' cannot be filtered on; "
+                        "use a text, number, int or date property."
+                    )
+                selectivity = await self._count(collection_obj, filters) / total
+                case = FilterCase(kind, prop, target, selectivity, filters)
+                click.echo(
+                    f"Filter {case.tag}: estimated selectivity {selectivity * 100:.2f}%"
+                )
+                cases.append(case)
+        return cases
+
+    async def _count(self, collection_obj: CollectionAsync, filters=None) -> int:
+        result = await collection_obj.aggregate.over_all(
+            filters=filters, total_count=True
+        )
+        return result.total_count or 0
+
+    async def _equality_filter(
+        self, collection_obj: CollectionAsync, prop: str, target: float, total: int
+    ) -> Any:
+        result = await collection_obj.aggregate.over_all(
+            group_by=wvc.aggregate.GroupByAggregate(
+                prop=prop, limit=FILTER_GROUP_LIMIT
+            ),
+            total_count=True,
+        )
+        groups = [
+            (g.grouped_by.value, g.total_count or 0)
+            for g in result.groups
+            if g.grouped_by.value is not None
+        ]
+        if not groups:
+            raise Exception(f"Property '{prop}' has no values to filter on.")
+        goal = target * total
+        chosen, covered = [], 0
+        # Largest values first, each taken when it brings the sum closer.
+        for value, count in sorted(groups, key=lambda g: -g[1]):
+            if abs(covered + count - goal) < abs(covered - goal):
+                chosen.append(value)
+                covered += count
+        if not chosen:
+            chosen = [min(groups, key=lambda g: g[1])[0]]
+        filters = [wvc.query.Filter.by_property(prop).equal(v) for v in chosen]
+        return filters[0] if len(filters) == 1 else wvc.query.Filter.any_of(filters)
+
+    async def _range_filter(
+        self,
+        collection_obj: CollectionAsync,
+        prop: str,
+        data_type: str,
+        target: float,
+        total: int,
+    ) -> Any:
+        metrics = wvc.query.Metrics(prop)
+        metric = {
+            "number": metrics.number,
+            "int": metrics.integer,
+            "date": metrics.date_,
+        }[data_type](minimum=True, maximum=True)
+        result = await collection_obj.aggregate.over_all(return_metrics=metric)
+        agg = result.properties[prop]
+        if agg.minimum is None or agg.maximum is None:
+            raise Exception(f"Property '{prop}' has no values to filter on.")
+
+        def to_float(v) -> float:
+            if data_type == "date":
+                # Weaviate returns RFC3339 dates, which fromisoformat only
+                # accepts with a "Z" suffix from Python 3.11 on.
+                if not isinstance(v, datetime):
+                    v = datetime.fromisoformat(v.replace("Z", "+00:00"))
+                if v.tzinfo is None:
+                    v = v.replace(tzinfo=timezone.utc)
+                return v.timestamp()
+            return float(v)
+
+        def to_value(x: float):
+            if data_type == "date":
+                return datetime.fromtimestamp(x, tz=timezone.utc)
+            return int(round(x)) if data_type == "int" else x
+
+        def build(x: float):
+            return wvc.query.Filter.by_property(prop).less_than(to_value(x))
+
+        lo, hi = to_float(agg.minimum), to_float(agg.maximum)
+        # count(prop < hi) misses the maximum itself, which is fine for a
+        # selectivity estimate.
+        best, best_error = hi, float("inf")
+        for _ in range(FILTER_SEARCH_STEPS):
+            mid = (lo + hi) / 2
+            fraction = await self._count(collection_obj, build(mid)) / total
+            if abs(fraction - target) < best_error:
+                best, best_error = mid, abs(fraction - target)
+            if best_error <= target * 0.05:
+                break
+            if fraction < target:
+                lo = mid
+            else:
+                hi = mid
+        return build(best)
+
     def _get_default_query_terms(self) -> List[str]:
         queries_file = Path("queries.txt")
         if queries_file.exists():
@@ -240,12 +1434,112 @@ class BenchmarkManager(ABC):
                     "p99_certainty",
                 ]
             header += ["total_queries", "actual_qps"]
+            header += [
+                "p50_service_time",
+                "p99_service_time",
+                "p50_queue_lag",
+                "p99_queue_lag",
+                "client_cpu_percent",
+                "p99_loop_lag",
+                "queue_depth",
+            ]
             csv_writer.writerow(header)
             return csv_writer, csv_file, filename
         except Exception as e:
             click.echo(f"Failed to open or write to CSV file '{filename}': {e}")
             return None, None, None
 
+    def _check_slo(
+        self,
+        monitor: "_SloMonitor",
+        interval: PhaseHistograms,
+        elapsed: float,
+        qps: int,
+    ) -> bool:
+        """Feed one interval to the SLO monitor; True on a (first) breach."""
+        already = monitor.violation is not None
+        violation = monitor.observe(interval, elapsed)
+        if violation is None or already:
+            return False
+        violation["qps"] = qps
+        self.slo_violations.append(violation)
+        click.echo(
+            f"SLO '{violation['rule']}' violated at {qps} QPS after "
+            f"{violation['elapsed_s']} s: observed {violation['observed']} over "
+            f"the last {violation['window_s']} s"
+        )
+        return True
+
+    def _report_schedule(
+        self, schedule: ArrivalSchedule, phase_name: str, qps: int, duration: float
+    ) -> None:
+        """Compare the generated arrival schedule of a Main Test phase with
+        the completions it achieved, per second."""
+        if phase_name != "Main Test":
+            return
+        summary = schedule.summary(duration)
+        summary["arrival"] = self.arrival.name
+        self.main_phase_schedules[qps] = summary
+        click.echo(f"Arrival schedule ({self.arrival.name}):")
+        for name in ("generated", "achieved"):
+            s = summary[name]
+            click.echo(
+                f"  {name.capitalize():<9} {s['total']} queries, mean {s['mean_qps']:.2f} "
+                f"QPS, peak {s['peak_qps']} QPS, stdev {s['stdev_qps']:.2f} QPS"
+            )
+        workers = summary.get("workers")
+        if workers:
+            click.echo(
+                f"  Workers   pool {workers['min_pool']}-{workers['max_pool']}, in flight "
+                f"mean {workers['mean_in_flight']:.2f}, peak {workers['peak_in_flight']}"
+            )
+            if workers["saturated_s"]:
+                click.echo(
+                    f"Warning: queries waited for a free worker in {workers['saturated_s']} of "
+                    f"{max(1, int(np.ceil(duration)))} s (up to {workers['peak_backlog']} "
+                    "queued), so the load generator delayed them (see the queue lag). "
+                    "Raise --concurrency or use --processes."
+                )
+        click.echo("")
+
+    def _report_slo_violations(self) -> None:
+        if not self.slo_violations:
+            click.echo("\nNo SLO violations.")
+            return
+        click.echo("\nSLO violations:")
+        for v in self.slo_violations:
+            click.echo(
+                f"  {v['qps']} QPS: '{v['rule']}' at {v['elapsed_s']} s "
+                f"(observed {v['observed']} over {v['window_s']} s)"
+            )
+
+    def _write_histograms_csv(self, csv_path: str) -> Optional[str]:
+        """Write the bucketed histograms of every Main Test phase next to the CSV."""
+        if not self.main_phase_stats:
+            return None
+        hist_path = str(_Path(csv_path).with_suffix("")) + "_histograms.csv"
+        with open(hist_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["target_qps", "metric", "unit", "value", "count", "percentile"]
+            )
+            for target_qps, stats in sorted(self.main_phase_stats.items()):
+                metrics = [
+                    (metric, "ppm" if metric == "certainty" else "us", hist)
+                    for metric, hist in stats.items()
+                ]
+                metrics += [
+                    (f"latency[{tag}]", "us", hist)
+                    for tag, hist in sorted(stats.tags.items())
+                ]
+                for metric, unit, hist in metrics:
+                    for value, count, pct in hist.csv_rows():
+                        writer.writerow(
+                            [target_qps, metric, unit, value, count, f"{pct:.4f}"]
+                        )
+        click.echo(f"Saved latency histograms to {hist_path}")
+        return hist_path
+
     async def _run_query_and_collect_latency(
         self,
         collection_obj: CollectionAsync,
@@ -254,7 +1548,9 @@ class BenchmarkManager(ABC):
         filters: Optional[List],
         query_type: str,
         fail_on_timeout: bool = CreateBenchmarkDefaults.fail_on_timeout,
-    ) -> Tuple[Optional[int], Optional[List[float]]]:
+        return_mode: str = CreateBenchmarkDefaults.return_mode,
+    ) -> Tuple[Optional[float], Optional[List[float]]]:
+        return_properties, return_metadata = RETURN_MODES[return_mode]
         t0 = _now_ns()
         try:
 
@@ -262,150 +1558,273 @@ class BenchmarkManager(ABC):
                 if query_type == "hybrid":
                     return await collection_obj.query.hybrid(
                         query=query_term,
-                        filters=None if not filters else _FilterOr(filters),
-                        return_metadata=wvc.query.MetadataQuery(certainty=True),
+                        filters=_combine_filters(filters),
+                        return_metadata=return_metadata,
+                        return_properties=return_properties,
                         limit=limit,
                     )
                 elif query_type == "bm25":
                     return await collection_obj.query.bm25(
                         query=query_term,
-                        filters=None if not filters else _FilterOr(filters),
-                        return_metadata=wvc.query.MetadataQuery(certainty=True),
+                        filters=_combine_filters(filters),
+                        return_metadata=return_metadata,
+                        return_properties=return_properties,
                         limit=limit,
                     )
                 elif query_type == "near_text":
                     return await collection_obj.query.near_text(
                         query=query_term,
-                        filters=None if not filters else _FilterOr(filters),
-                        return_metadata=wvc.query.MetadataQuery(certainty=True),
+                        filters=_combine_filters(filters),
+                        return_metadata=return_metadata,
+                        return_properties=return_properties,
+                        limit=limit,
+                    )
+                elif query_type == "near_vector":
+                    return await collection_obj.query.near_vector(
+                        near_vector=self.query_vectors[query_term].tolist(),
+                        target_vector=self.target_vector,
+                        filters=_combine_filters(filters),
+                        return_metadata=return_metadata,
+                        return_properties=return_properties,
                         limit=limit,
                     )
                 else:
                     raise ValueError(f"Unsupported query type: {query_type}")
 
             response = await asyncio.wait_for(_do(), timeout=PER_REQUEST_TIMEOUT_S)
-            took_ms = int(_ns_to_ms(_now_ns() - t0))
+            took_ms = _ns_to_ms(_now_ns() - t0)
+            if self.recall_probe is not None and query_type == "near_vector":
+                self.recall_probe.record(query_term, response.objects)
             certainties = [
                 o.metadata.certainty
                 for o in response.objects
-                if hasattr(o.metadata, "certainty")
+                if getattr(o.metadata, "certainty", None) is not None
             ]
             return took_ms, certainties
 
         except asyncio.TimeoutError:
             click.echo(
-                f"Query '{query_term[:30]}...' timed out after {PER_REQUEST_TIMEOUT_S}s"
+                f"Query '{str(query_term)[:30]}...' timed out after {PER_REQUEST_TIMEOUT_S}s"
             )
             if fail_on_timeout:
                 raise asyncio.TimeoutError(
-                    f"Query '{query_term[:30]}...' timed out after {PER_REQUEST_TIMEOUT_S}s"
+                    f"Query '{str(query_term)[:30]}...' timed out after {PER_REQUEST_TIMEOUT_S}s"
                 )
             return None, None
         except asyncio.CancelledError:
             return None, None
         except Exception as exc:
-            click.echo(f"Query '{query_term[:30]}...' generated an exception: {exc}")
+            click.echo(
+                f"Query '{str(query_term)[:30]}...' generated an exception: {exc}"
+            )
             return None, None
 
+    def _phase_percentiles(
+        self, stats: PhaseHistograms, show_certainty: bool
+    ) -> Tuple[List[float], List[float], List[float], Optional[List[float]]]:
+        """Latency p50/p90/p95/p99, service and queue lag p50/p99 (all in ms)
+        and certainty p50/p90/p95/p99 (None when not shown or not recorded)."""
+        latency = [v / 1000.0 for v in stats.latency.percentiles([50, 90, 95, 99])]
+        service = [v / 1000.0 for v in stats.service.percentiles([50, 99])]
+        queue_lag = [v / 1000.0 for v in stats.queue_lag.percentiles([50, 99])]
+        certainty = None
+        if show_certainty and stats.certainty.total:
+            certainty = [
+                v / CERTAINTY_SCALE
+                for v in stats.certainty.percentiles([50, 90, 95, 99])
+            ]
+        return latency, service, queue_lag, certainty
+
+    def _write_csv_row(
+        self,
+        csv_writer: csv.writer,
+        phase_name: str,
+        latency: List[float],
+        service: List[float],
+        queue_lag: List[float],
+        certainty: Optional[List[float]],
+        show_certainty: bool,
+        total_queries: Optional[int],
+        actual_qps: Optional[float],
+        client_load: Tuple[float, float, int],
+    ) -> None:
+        row = [time.time(), phase_name] + [f"{v:.2f}" for v in latency]
+        if show_certainty:
+            row.extend([f"{v:.2f}" for v in certainty] if certainty else [""] * 4)
+        if total_queries is not None and actual_qps is not None:
+            row.extend([f"{total_queries}", f"{actual_qps:.2f}"])
+        else:
+            row.extend(["", ""])
+        row.extend([f"{v:.3f}" for v in service + queue_lag])
+        cpu, loop_lag, queue_depth = client_load
+        row.extend([f"{cpu:.1f}", f"{loop_lag:.3f}", f"{queue_depth}"])
+        csv_writer.writerow(row)
+
     def _report_percentiles(
         self,
-        response_times: List[int],
-        certainty_values: List[float],
+        stats: PhaseHistograms,
         show_certainty: bool,
         csv_writer: Optional[csv.writer],
         phase_name: str,
         total_queries: Optional[int] = None,
         actual_qps: Optional[float] = None,
     ) -> None:
-        if not response_times:
+        """Report the percentiles of one reporting interval."""
+        if not stats.latency.total:
             return
-        tail = response_times[-ROLLING_WINDOW:]
-        p50 = np.percentile(tail, 50)
-        p90 = np.percentile(tail, 90)
-        p95 = np.percentile(tail, 95)
-        p99 = np.percentile(tail, 99)
-        click.echo(f"Current P50 latency: {p50:.2f} ms")
-        click.echo(f"Current P90 latency: {p90:.2f} ms")
-        click.echo(f"Current P95 latency: {p95:.2f} ms")
-        click.echo(f"Current P99 latency: {p99:.2f} ms")
-        if show_certainty and certainty_values:
-            ctail = certainty_values[-ROLLING_WINDOW:]
-            p50c = np.percentile(ctail, 50)
-            p90c = np.percentile(ctail, 90)
-            p95c = np.percentile(ctail, 95)
-            p99c = np.percentile(ctail, 99)
-            click.echo(f"Current P50 certainty: {p50c:.2f}")
-            click.echo(f"Current P90 certainty: {p90c:.2f}")
-            click.echo(f"Current P95 certainty: {p95c:.2f}")
-            click.echo(f"Current P99 certainty: {p99c:.2f}")
+        latency, service, queue_lag, certainty = self._phase_percentiles(
+            stats, show_certainty
+        )
+        for q, v in zip((50, 90, 95, 99), latency):
+            click.echo(f"Current P{q} latency: {v:.2f} ms")
+        click.echo(
+            f"Current P50/P99 service time: {service[0]:.2f}/{service[1]:.2f} ms"
+        )
+        click.echo(
+            f"Current P50/P99 queue lag: {queue_lag[0]:.2f}/{queue_lag[1]:.2f} ms"
+        )
+        cpu, loop_lag, queue_depth = stats.client_load()
+        click.echo(
+            f"Current client CPU/P99 loop lag/queue depth: {cpu:.0f}%/"
+            f"{loop_lag:.2f} ms/{queue_depth}"
+        )
+        if certainty:
+            for q, v in zip((50, 90, 95, 99), certainty):
+                click.echo(f"Current P{q} certainty: {v:.2f}")
         if csv_writer:
-            row = [
-                time.time(),
+            self._write_csv_row(
+                csv_writer,
                 phase_name,
-                f"{p50:.2f}",
-                f"{p90:.2f}",
-                f"{p95:.2f}",
-                f"{p99:.2f}",
-            ]
-            if show_certainty and certainty_values:
-                row.extend([f"{p50c:.2f}", f"{p90c:.2f}", f"{p95c:.2f}", f"{p99c:.2f}"])
-            if total_queries is not None and actual_qps is not None:
-                row.extend([f"{total_queries}", f"{actual_qps:.2f}"])
-            else:
-                row.extend(["", ""])
-            csv_writer.writerow(row)
+                latency,
+                service,
+                queue_lag,
+                certainty,
+                show_certainty,
+                total_queries,
+                actual_qps,
+                stats.client_load(),
+            )
+
+    def _filter_summaries(self, stats: PhaseHistograms) -> List[dict]:
+        """Per filter class latency of a phase, in workload order."""
+        summaries = []
+        for case in self.filter_cases:
+            hist = stats.tags.get(case.tag)
+            if hist is None or not hist.total:
+                continue
+            p50, p99 = (v / 1000.0 for v in hist.percentiles([50, 99]))
+            summaries.append(
+                {
+                    "tag": case.tag,
+                    "selectivity": round(case.selectivity, 6),
+                    "queries": hist.total,
+                    "p50": round(p50, 3),
+                    "p99": round(p99, 3),
+                }
+            )
+        return summaries
+
+    def _tenant_tier_summaries(self, stats: PhaseHistograms) -> List[dict]:
+        """Per tenant popularity tier latency of a phase, hottest tier first."""
+        if self.tenant_workload is None:
+            return []
+        summaries = []
+        for (_, label), size in zip(
+            TenantWorkload.TIERS, self.tenant_workload.tier_sizes()
+        ):
+            hist = stats.tags.get(f"tenant:{label}")
+            if hist is None or not hist.total:
+                continue
+            p50, p99 = (v / 1000.0 for v in hist.percentiles([50, 99]))
+            summaries.append(
+                {
+                    "tier": label,
+                    "tenants": size,
+                    "queries": hist.total,
+                    "p50": round(p50, 3),
+                    "p99": round(p99, 3),
+                }
+            )
+        return summaries
 
     def _report_final_results(
         self,
-        response_times: List[int],
-        certainty_values: List[float],
+        stats: PhaseHistograms,
         show_certainty: bool,
         csv_writer: Optional[csv.writer],
         phase_name: str,
         actual_duration: float,
     ) -> None:
+        """Report the cumulative percentiles of a Main Test phase."""
         if phase_name != "Main Test":
             return
-        if not response_times:
+        if not stats.latency.total:
             click.echo("No successful queries were completed in Main Test.")
             return
-        p50 = np.percentile(response_times, 50)
-        p90 = np.percentile(response_times, 90)
-        p95 = np.percentile(response_times, 95)
-        p99 = np.percentile(response_times, 99)
-        total_queries = len(response_times)
+        latency, service, queue_lag, certainty = self._phase_percentiles(
+            stats, show_certainty
+        )
+        total_queries = stats.latency.total
         actual_qps = total_queries / max(actual_duration, 1e-9)
         click.echo(f"\n-------------------------------\n")
         click.echo(f"Total queries: {total_queries}")
         click.echo(f"Actual QPS: {actual_qps:.2f}")
-        click.echo(f"P50 latency: {p50:.2f} ms")
-        click.echo(f"P90 latency: {p90:.2f} ms")
-        click.echo(f"P95 latency: {p95:.2f} ms")
-        click.echo(f"P99 latency: {p99:.2f} ms")
-        max_latency = max(response_times)
-        click.echo(f"Max observed latency: {max_latency:.2f} ms\n")
-        if show_certainty and certainty_values:
-            p50c = np.percentile(certainty_values, 50)
-            p90c = np.percentile(certainty_values, 90)
-            p95c = np.percentile(certainty_values, 95)
-            p99c = np.percentile(certainty_values, 99)
-            click.echo(f"P50 certainty: {p50c:.2f}")
-            click.echo(f"P90 certainty: {p90c:.2f}")
-            click.echo(f"P95 certainty: {p95c:.2f}")
-            click.echo(f"P99 certainty: {p99c:.2f}")
-        if csv_writer:
-            row = [
-                time.time(),
+        for q, v in zip((50, 90, 95, 99), latency):
+            click.echo(f"P{q} latency: {v:.2f} ms")
+        click.echo(f"Max observed latency: {stats.latency.max / 1000.0:.2f} ms")
+        click.echo(f"P50/P99 service time: {service[0]:.2f}/{service[1]:.2f} ms")
+        click.echo(f"P50/P99 queue lag: {queue_lag[0]:.2f}/{queue_lag[1]:.2f} ms")
+        cpu, loop_lag, queue_depth = stats.client_load()
+        click.echo(
+            f"Load generator: peak CPU {cpu:.0f}% of a core, P99 event loop lag "
+            f"{loop_lag:.2f} ms, peak queue depth {queue_depth}"
+        )
+        if stats.client_saturated():
+            click.echo(
+                "Warning: the load generator itself is saturated, so these results "
+                "may be limited by this client rather than by Weaviate. Use "
+                "--processes to spread the load."
+            )
+        click.echo("")
+        for summary in self._filter_summaries(stats):
+            click.echo(
+                f"Filter {summary['tag']} (selectivity {summary['selectivity'] * 100:.2f}%): "
+                f"{summary['queries']} queries, P50/P99 latency "
+                f"{summary['p50']:.2f}/{summary['p99']:.2f} ms"
+            )
+        for summary in self._tenant_tier_summaries(stats):
+            click.echo(
+                f"Tenants {summary['tier']} ({summary['tenants']} tenants): "
+                f"{summary['queries']} queries, P50/P99 latency "
+                f"{summary['p50']:.2f}/{summary['p99']:.2f} ms"
+            )
+        if stats.tags:
+            click.echo("")
+        slowest = self._slowest_term_summaries(stats)
+        if slowest:
+            click.echo("Slowest query terms (mean service time):")
+            for summary in slowest:
+                click.echo(
+                    f"  {summary['term']!r}: {summary['queries']} queries, mean/max "
+                    f"{summary['mean_ms']:.2f}/{summary['max_ms']:.2f} ms"
+                )
+            click.echo("")
+        if certainty:
+            for q, v in zip((50, 90, 95, 99), certainty):
+                click.echo(f"P{q} certainty: {v:.2f}")
+        if csv_writer:
+            self._write_csv_row(
+                csv_writer,
                 phase_name,
-                f"{p50:.2f}",
-                f"{p90:.2f}",
-                f"{p95:.2f}",
-                f"{p99:.2f}",
-            ]
-            if show_certainty and certainty_values:
-                row.extend([f"{p50c:.2f}", f"{p90c:.2f}", f"{p95c:.2f}", f"{p99c:.2f}"])
-            row.extend([f"{total_queries}", f"{actual_qps:.2f}"])
-            csv_writer.writerow(row)
+                latency,
+                service,
+                queue_lag,
+                certainty,
+                show_certainty,
+                total_queries,
+                actual_qps,
+                stats.client_load(),
+            )
 
 
 class BenchmarkQPSManager(BenchmarkManager):
@@ -428,45 +1847,109 @@ class BenchmarkQPSManager(BenchmarkManager):
         fail_on_timeout: bool = CreateBenchmarkDefaults.fail_on_timeout,
         file_alias: Optional[str] = CreateBenchmarkDefaults.file_alias,
         tenant: Optional[str] = CreateBenchmarkDefaults.tenant,
+        return_mode: str = CreateBenchmarkDefaults.return_mode,
+        processes: int = CreateBenchmarkDefaults.processes,
+        search_strategy: str = CreateBenchmarkDefaults.search_strategy,
+        search_precision: int = CreateBenchmarkDefaults.search_precision,
+        confirm_runs: int = CreateBenchmarkDefaults.confirm_runs,
+        threshold_percentile: Optional[
+            float
+        ] = CreateBenchmarkDefaults.threshold_percentile,
+        slo: Optional[List[str]] = CreateBenchmarkDefaults.slo,
+        slo_window: int = CreateBenchmarkDefaults.slo_window,
+        slo_grace: int = CreateBenchmarkDefaults.slo_grace,
+        slo_action: str = CreateBenchmarkDefaults.slo_action,
+        arrival: str = CreateBenchmarkDefaults.arrival,
+        arrival_seed: int = CreateBenchmarkDefaults.arrival_seed,
+        filter_properties: Optional[List[str]] = None,
+        filter_selectivities: Tuple[
+            float, ...
+        ] = CreateBenchmarkDefaults.filter_selectivities,
+        tenants: Optional[str] = CreateBenchmarkDefaults.tenants,
+        tenant_suffix: Optional[str] = CreateBenchmarkDefaults.tenant_suffix,
+        tenant_distribution: str = CreateBenchmarkDefaults.tenant_distribution,
+        zipf_exponent: float = CreateBenchmarkDefaults.zipf_exponent,
+        query_corpus: Optional[int] = CreateBenchmarkDefaults.query_corpus,
+        corpus_properties: Tuple[str, ...] = CreateBenchmarkDefaults.corpus_properties,
+        corpus_objects: int = CreateBenchmarkDefaults.corpus_objects,
+        query_distribution: str = CreateBenchmarkDefaults.query_distribution,
+        query_zipf_exponent: float = CreateBenchmarkDefaults.query_zipf_exponent,
+        slowest_terms: int = CreateBenchmarkDefaults.slowest_terms,
         json_output: bool = False,
     ) -> None:
-        consistency_map = {
-            "ONE": wvc.ConsistencyLevel.ONE,
-            "QUORUM": wvc.ConsistencyLevel.QUORUM,
-            "ALL": wvc.ConsistencyLevel.ALL,
-        }
+        self.arrival = ArrivalProcess.parse(arrival, arrival_seed)
+        self.slowest_terms = slowest_terms
+        spread = bool(tenants or tenant_suffix)
+        if spread and tenant:
+            raise Exception(
+                "--tenant cannot be combined with --tenants or --tenant-suffix."
+            )
+        if tenants and tenant_suffix:
+            raise Exception("--tenants and --tenant-suffix cannot be combined.")
+        if slo and threshold_percentile is not None:
+            raise Exception("--slo and --threshold-percentile cannot be combined.")
+        slo_policy = (
+            SloPolicy(
+                [SloRule(rule) for rule in slo], slo_window, slo_grace, slo_action
+            )
+            if slo
+            else None
+        )
+        if processes > 1 and self.client_factory is None:
+            raise Exception("--processes needs a client factory to connect from.")
+        if certainty and return_mode == "ids-only":
+            raise Exception("--certainty needs --return metadata or --return full.")
+        if query_corpus and query_terms:
+            raise Exception("--query-corpus and --query-terms cannot be combined.")
         if not query_terms:
             query_terms = self._get_default_query_terms()
+        if query_distribution != "uniform":
+            self.query_corpus = QueryCorpus(
+                query_terms, query_distribution, query_zipf_exponent, arrival_seed
+            )
         csv_writer, csv_file, csv_filename = self._setup_csv_output(
             output, certainty, file_alias
         )
         try:
-            await self.async_client.connect()
-            if not await self.async_client.collections.exists(collection):
-                raise Exception(f"Collection '{collection}' does not exist")
-            collection_obj = self.async_client.collections.get(
-                collection
-            ).with_consistency_level(consistency_map[consistency_level])
-            cfg = await collection_obj.config.get()
-            mt_enabled = cfg.multi_tenancy_config.enabled
-            if mt_enabled:
-                if tenant:
-                    exists_ok = await collection_obj.tenants.exists(tenant)
-                    if not exists_ok:
-                        raise Exception(
-                            f"Tenant '{tenant}' does not exist in collection '{collection}'"
-                        )
-                else:
-                    tenant_dict = await collection_obj.tenants.get()
-                    if tenant_dict:
-                        tenant = random.choice(list(tenant_dict.keys()))
-                    else:
-                        raise Exception(
-                            f"No tenants found in collection '{collection}'"
-                        )
-                # apply tenant context for multitenant collections
-                click.echo(f"Using tenant '{tenant}' for benchmark")
-                collection_obj = collection_obj.with_tenant(tenant)
+            collection_obj, tenant = await self._open_collection(
+                collection, consistency_level, tenant, pick_tenant=not spread
+            )
+            if spread:
+                self.tenant_workload = await self._build_tenant_workload(
+                    collection_obj,
+                    tenants,
+                    tenant_suffix,
+                    tenant_distribution,
+                    zipf_exponent,
+                    arrival_seed,
+                )
+            if filter_properties:
+                self.filter_cases = await self._build_filter_workload(
+                    collection_obj, filter_properties, list(filter_selectivities)
+                )
+            if query_corpus:
+                self.query_corpus = await self._build_query_corpus(
+                    collection_obj,
+                    query_corpus,
+                    list(corpus_properties),
+                    corpus_objects,
+                    query_distribution,
+                    query_zipf_exponent,
+                    arrival_seed,
+                )
+                query_terms = self.query_corpus.terms
+            if processes > 1:
+                click.echo(f"Starting {processes} load generator processes")
+                self._load_generators = _LoadGeneratorPool(
+                    processes,
+                    self.client_factory,
+                    collection,
+                    CONSISTENCY_LEVELS[consistency_level],
+                    tenant,
+                )
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._load_generators.start
+                )
             max_qps = await self._find_max_qps(
                 collection_obj=collection_obj,
                 query_terms=query_terms,
@@ -481,26 +1964,55 @@ class BenchmarkQPSManager(BenchmarkManager):
                 latency_threshold=latency_threshold,
                 concurrency=concurrency,
                 fail_on_timeout=fail_on_timeout,
+                return_mode=return_mode,
+                search_strategy=search_strategy,
+                search_precision=search_precision,
+                confirm_runs=confirm_runs,
+                threshold_percentile=threshold_percentile,
+                slo=slo_policy,
             )
             if not qps:
                 if json_output:
-                    click.echo(
-                        json.dumps(
-                            {
-                                "status": "success",
-                                "collection": collection,
-                                "max_qps": max_qps,
-                            },
-                            indent=2,
-                        )
-                    )
+                    result = {
+                        "status": "success",
+                        "collection": collection,
+                        "max_qps": max_qps,
+                    }
+                    stats = self.main_phase_stats.get(max_qps)
+                    if stats is not None:
+                        result["histograms"] = stats.to_dict()
+                        if self.filter_cases:
+                            result["filters"] = self._filter_summaries(stats)
+                        if self.tenant_workload:
+                            result["tenant_tiers"] = self._tenant_tier_summaries(stats)
+                        cpu, loop_lag, queue_depth = stats.client_load()
+                        result["load_generator"] = {
+                            "peak_cpu_percent": round(cpu, 1),
+                            "p99_loop_lag_ms": round(loop_lag, 3),
+                            "peak_queue_depth": queue_depth,
+                            "saturated": stats.client_saturated(),
+                        }
+                        slowest = self._slowest_term_summaries(stats)
+                        if slowest:
+                            result["slowest_terms"] = slowest
+                    if max_qps in self.main_phase_schedules:
+                        result["schedule"] = self.main_phase_schedules[max_qps]
+                    if slo_policy is not None:
+                        result["slo_violations"] = self.slo_violations
+                    click.echo(json.dumps(result, indent=2))
                 else:
                     click.echo(
                         f"\nThe maximum sustainable QPS is approximately {max_qps}."
                     )
+            if slo_policy is not None and not (json_output and not qps):
+                self._report_slo_violations()
         finally:
+            if self._load_generators is not None:
+                self._load_generators.close()
+                self._load_generators = None
             if csv_file:
                 csv_file.close()
+                self._write_histograms_csv(csv_filename)
             await self.async_client.close()
             if generate_graph and output == "csv" and csv_filename:
                 try:
@@ -524,20 +2036,44 @@ class BenchmarkQPSManager(BenchmarkManager):
         latency_threshold: int,
         concurrency: Optional[int] = None,
         fail_on_timeout: bool = CreateBenchmarkDefaults.fail_on_timeout,
-    ) -> Tuple[List[int], bool]:
+        return_mode: str = CreateBenchmarkDefaults.return_mode,
+        report: bool = True,
+        on_interval: Optional[Callable[[PhaseHistograms], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        slo: Optional[SloPolicy] = None,
+    ) -> Tuple[PhaseHistograms, bool]:
+        """Run one fixed-rate phase and return its cumulative histograms.
+
+        Every query carries the time the schedule intended to send it. The
+        recorded latency runs from that intended time to completion, so queries
+        that waited for a busy worker are not under-reported (coordinated
+        omission); service time and queue lag are kept alongside it.
+
+        Load generator processes run it with `report=False`, hand every
+        one-second interval to `on_interval` and stop early once
+        `should_stop()` is true.
+
+        With `slo`, a Main Test fails on the first SLO breach over its sliding
+        window (see SloPolicy) and the breach is kept in `self.slo_violations`.
+        """
         loop = asyncio.get_running_loop()
         start_time = loop.time()
         end_time = start_time + duration
-        interval = 1.0 / qps if qps > 0 else float("inf")
+        schedule = ArrivalSchedule()
+        self.last_schedule = schedule
 
-        response_times: List[int] = []
-        certainty_values: List[float] = []
+        # Workers record into the interval histograms; the reporter folds them
+        # into the phase histograms once per second, so memory stays constant.
+        interval_stats = PhaseHistograms()
+        phase_stats = PhaseHistograms()
         latency_exceeded = False
         goto_finally = False
         phase_error: Optional[BaseException] = None
         phase_done = asyncio.Event()
+        slo_monitor = (
+            slo.monitor() if slo is not None and phase_name == "Main Test" else None
+        )
 
-        recent_latencies = deque(maxlen=ROLLING_WINDOW)
         ewma_latency_ms: Optional[float] = None
 
         completed_total = 0
@@ -554,31 +2090,54 @@ class BenchmarkQPSManager(BenchmarkManager):
             return max(1, min(target, cap))
 
         initial_conc = concurrency if concurrency is not None else auto_concurrency()
-        sem = asyncio.Semaphore(initial_conc)
         queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, initial_conc * 2))
+        # Each worker sends one query at a time. With auto concurrency the
+        # reporter resizes the pool every second (Little's law: the target rate
+        # times the EWMA service time); surplus workers retire between queries.
+        pool_target = initial_conc
+        pool_size = 0
+        in_flight = 0
+        last_cpu = time.process_time()
+        last_cpu_t = start_time
 
-        click.echo(
-            f"Starting {phase_name} phase at {qps} QPS for {duration} seconds "
-            f"with {'auto' if concurrency is None else f'concurrency={concurrency}'}."
-        )
+        if report:
+            click.echo(
+                f"Starting {phase_name} phase at {qps} QPS for {duration} seconds "
+                f"with {'auto' if concurrency is None else f'concurrency={concurrency}'}."
+            )
 
         async def worker():
-            nonlocal latency_exceeded, goto_finally, ewma_latency_ms, completed_total, phase_error
+            nonlocal latency_exceeded, goto_finally, ewma_latency_ms, completed_total, phase_error, pool_size, in_flight
             while not goto_finally:
+                if pool_size > pool_target:
+                    pool_size -= 1
+                    break
                 try:
-                    query_term, _ = await queue.get()
+                    query_term, intended_t, case, tenant = await queue.get()
                 except asyncio.CancelledError:
                     break
+                started_t = intended_t
                 try:
-                    async with sem:
+                    started_t = loop.time()
+                    in_flight += 1
+                    schedule.record_in_flight(
+                        int(started_t - start_time),
+                        in_flight,
+                        pool_size,
+                        queue.qsize(),
+                    )
+                    try:
                         took, certainties = await self._run_query_and_collect_latency(
-                            collection_obj,
+                            tenant_collection(tenant[0]) if tenant else collection_obj,
                             query_term,
                             limit,
-                            [],
+                            [case.filters] if case is not None else [],
                             query_type,
                             fail_on_timeout,
+                            return_mode,
                         )
+                    finally:
+                        in_flight -= 1
                 except asyncio.CancelledError:
                     took, certainties = None, None
                 except asyncio.TimeoutError as te:
@@ -588,9 +2147,21 @@ class BenchmarkQPSManager(BenchmarkManager):
                     phase_done.set()
                     took, certainties = None, None
                 finally:
+                    if took is None and not goto_finally:
+                        interval_stats.errors += 1
                     if took is not None:
-                        response_times.append(took)
-                        recent_latencies.append(took)
+                        latency_ms = (loop.time() - intended_t) * 1000.0
+                        interval_stats.record(
+                            latency_ms,
+                            took,
+                            max(0.0, started_t - intended_t) * 1000.0,
+                            certainties if show_certainty else None,
+                        )
+                        if case is not None:
+                            interval_stats.record_tag(case.tag, latency_ms)
+                        if tenant:
+                            interval_stats.record_tag(tenant[1], latency_ms)
+                        interval_stats.record_term(str(query_term), took)
                         ewma_latency_ms = (
                             float(took)
                             if ewma_latency_ms is None
@@ -598,39 +2169,102 @@ class BenchmarkQPSManager(BenchmarkManager):
                             + (1 - LATENCY_EWMA_ALPHA) * ewma_latency_ms
                         )
                         completed_total += 1
-                        if phase_name == "Main Test" and took > latency_threshold:
+                        schedule.achieved[int(loop.time() - start_time)] += 1
+                        if phase_name == "Main Test" and latency_ms > latency_threshold:
                             latency_exceeded = True
                             goto_finally = True
                             phase_done.set()
-                        if show_certainty and certainties is not None:
-                            certainty_values.extend(certainties)
                     queue.task_done()
                     if latency_exceeded:
                         goto_finally = True
 
-        workers = [asyncio.create_task(worker()) for _ in range(initial_conc)]
+        workers: List[asyncio.Task] = []
+
+        def resize_pool() -> None:
+            nonlocal pool_size
+            while pool_size < pool_target:
+                pool_size += 1
+                workers.append(asyncio.create_task(worker()))
+
+        resize_pool()
+
+        cases = self.filter_cases
+        tenant_draws = (
+            self.tenant_workload.sampler(self.arrival_stream)
+            if self.tenant_workload is not None
+            else None
+        )
+        term_draws = (
+            self.query_corpus.sampler(self.arrival_stream)
+            if self.query_corpus is not None
+            else None
+        )
+        tenant_collections: Dict[str, CollectionAsync] = {}
+
+        def tenant_collection(name: str) -> CollectionAsync:
+            if name not in tenant_collections:
+                tenant_collections[name] = collection_obj.with_tenant(name)
+            return tenant_collections[name]
 
         async def producer():
-            next_t = loop.time()
-            while loop.time() < end_time and not goto_finally:
-                await asyncio.sleep(max(0.0, next_t - loop.time()))
+            if qps <= 0:
+                return
+            for k, offset in enumerate(self.arrival.offsets(qps, self.arrival_stream)):
+                next_t = start_time + offset
+                if next_t >= end_time or goto_finally:
+                    break
+                delay = next_t - loop.time()
+                await asyncio.sleep(max(0.0, delay))
+                if delay > 0:
+                    # How late the event loop woke the producer up.
+                    interval_stats.loop_lag.record_ms((loop.time() - next_t) * 1000.0)
                 if goto_finally:
                     break
-                await queue.put((random.choice(query_terms), loop.time()))
-                next_t += interval
-                now = loop.time()
-                if now - next_t > interval:
-                    missed = int((now - next_t) / interval)
-                    next_t += missed * interval
+                # Enqueue with the scheduled slot time. Slots missed while the
+                # queue was full are still sent (late), never skipped, so their
+                # delay shows up in the latency.
+                case = cases[k % len(cases)] if cases else None
+                tenant = next(tenant_draws) if tenant_draws is not None else None
+                term = (
+                    next(term_draws)
+                    if term_draws is not None
+                    else random.choice(query_terms)
+                )
+                await queue.put((term, next_t, case, tenant))
+                interval_stats.queue_depth = max(
+                    interval_stats.queue_depth, queue.qsize()
+                )
+                schedule.generated[int(offset)] += 1
 
         async def reporter():
-            nonlocal ewma_qps, last_completed_total, last_report_time
+            nonlocal ewma_qps, last_completed_total, last_report_time, goto_finally, latency_exceeded, pool_target, last_cpu, last_cpu_t
             while loop.time() < end_time and not goto_finally:
                 await asyncio.sleep(1.0)
-                if response_times:
+                cpu, cpu_t = time.process_time(), loop.time()
+                interval_stats.cpu = max(
+                    interval_stats.cpu, (cpu - last_cpu) / max(1e-6, cpu_t - last_cpu_t)
+                )
+                last_cpu, last_cpu_t = cpu, cpu_t
+                if concurrency is None:
+                    target = auto_concurrency()
+                    if target > pool_target or target < pool_target * POOL_SHRINK_RATIO:
+                        pool_target = target
+                        resize_pool()
+                if should_stop is not None and should_stop():
+                    goto_finally = True
+                    phase_done.set()
+                if on_interval is not None:
+                    on_interval(interval_stats)
+                if slo_monitor is not None and self._check_slo(
+                    slo_monitor, interval_stats, loop.time() - start_time, qps
+                ):
+                    latency_exceeded = True
+                    if slo.action == "abort":
+                        goto_finally = True
+                        phase_done.set()
+                if completed_total and report:
                     self._report_percentiles(
-                        response_times,
-                        certainty_values,
+                        interval_stats,
                         show_certainty,
                         csv_writer,
                         phase_name,
@@ -646,7 +2280,12 @@ class BenchmarkQPSManager(BenchmarkManager):
                     )
                     last_completed_total = completed_total
                     last_report_time = now
-                    click.echo(f"Current QPS: {ewma_qps:.2f}\n")
+                    click.echo(
+                        f"Current QPS: {ewma_qps:.2f} "
+                        f"({in_flight} in flight, {pool_size} workers)\n"
+                    )
+                phase_stats.merge(interval_stats)
+                interval_stats.reset()
 
         prod_task = asyncio.create_task(producer())
         report_task = asyncio.create_task(reporter())
@@ -668,7 +2307,9 @@ class BenchmarkQPSManager(BenchmarkManager):
             goto_finally = True
             for _ in range(len(workers)):
                 try:
-                    queue.put_nowait((random.choice(query_terms), loop.time()))
+                    queue.put_nowait(
+                        (random.choice(query_terms), loop.time(), None, None)
+                    )
                 except asyncio.QueueFull:
                     break
             report_task.cancel()
@@ -692,23 +2333,164 @@ class BenchmarkQPSManager(BenchmarkManager):
                 pass
 
         actual_duration = loop.time() - start_time
-        if response_times:
+        if on_interval is not None and interval_stats.latency.total:
+            on_interval(interval_stats)
+        phase_stats.merge(interval_stats)
+        if report and phase_stats.latency.total:
             self._report_final_results(
-                response_times,
-                certainty_values,
+                phase_stats,
                 show_certainty,
                 csv_writer,
                 phase_name,
                 actual_duration,
             )
-        else:
+            self._report_schedule(schedule, phase_name, qps, duration)
+        elif report:
             click.echo("No successful queries were completed during the test.")
 
         # If a timeout error occurred and fail_on_timeout was enabled, propagate it
         if phase_error is not None:
             raise phase_error
 
-        return response_times, latency_exceeded
+        return phase_stats, latency_exceeded
+
+    async def _run_load_phase(
+        self, collection_obj: CollectionAsync, *args, **kwargs
+    ) -> Tuple[PhaseHistograms, bool]:
+        """Run a phase in this event loop or spread over the --processes pool."""
+        if self._load_generators is not None:
+            return await self._run_phase_multiprocess(*args, **kwargs)
+        return await self._run_phase(collection_obj, *args, **kwargs)
+
+    async def _run_phase_multiprocess(
+        self,
+        query_terms: List[str],
+        limit: int,
+        qps: int,
+        duration: int,
+        phase_name: str,
+        show_certainty: bool,
+        csv_writer: Optional[csv.writer],
+        query_type: str,
+        latency_threshold: int,
+        concurrency: Optional[int] = None,
+        fail_on_timeout: bool = CreateBenchmarkDefaults.fail_on_timeout,
+        return_mode: str = CreateBenchmarkDefaults.return_mode,
+        slo: Optional[SloPolicy] = None,
+    ) -> Tuple[PhaseHistograms, bool]:
+        """Run one phase on every load generator process, each at its share of
+        `qps` (and `concurrency`), merging their histograms for the reports.
+        SLO rules are evaluated here, on the merged intervals."""
+        pool = self._load_generators
+        n = len(pool.processes)
+
+        def _split(total: int) -> List[int]:
+            return [total // n + (1 if i < total % n else 0) for i in range(n)]
+
+        qps_shares = _split(qps)
+        conc_shares = _split(concurrency) if concurrency is not None else [None] * n
+        click.echo(
+            f"Starting {phase_name} phase at {qps} QPS for {duration} seconds "
+            f"across {n} processes "
+            f"with {'auto' if concurrency is None else f'concurrency={concurrency}'}."
+        )
+        pool.stop.clear()
+        for i in range(n):
+            pool.commands[i].put(
+                {
+                    "query_terms": query_terms,
+                    "limit": limit,
+                    "qps": qps_shares[i],
+                    "duration": duration,
+                    "phase_name": phase_name,
+                    "show_certainty": show_certainty,
+                    "query_type": query_type,
+                    "latency_threshold": latency_threshold,
+                    "concurrency": (
+                        max(1, conc_shares[i]) if conc_shares[i] is not None else None
+                    ),
+                    "fail_on_timeout": fail_on_timeout,
+                    "return_mode": return_mode,
+                    "arrival": self.arrival,
+                    "filter_cases": self.filter_cases,
+                    "tenant_workload": self.tenant_workload,
+                    "query_corpus": self.query_corpus,
+                    "slowest_terms": self.slowest_terms,
+                }
+            )
+
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        last_report_time = start_time
+        interval_stats = PhaseHistograms()
+        phase_stats = PhaseHistograms()
+        latency_exceeded = False
+        errors: List[str] = []
+        pending = n
+        # Queries reported so far; phase_stats only fills up as processes finish.
+        reported_total = 0
+        schedule = ArrivalSchedule()
+        slo_monitor = (
+            slo.monitor() if slo is not None and phase_name == "Main Test" else None
+        )
+        while pending:
+            try:
+                msg = await loop.run_in_executor(None, pool.results.get, True, 0.2)
+            except Empty:
+                msg = None
+            if msg is not None and msg[0] == "interval":
+                interval_stats.merge(PhaseHistograms.from_dict(msg[2]))
+            elif msg is not None and msg[0] == "done":
+                _, index, stats, exceeded, error, process_schedule = msg
+                pending -= 1
+                phase_stats.merge(PhaseHistograms.from_dict(stats))
+                schedule.merge(ArrivalSchedule.from_dict(process_schedule))
+                latency_exceeded = latency_exceeded or exceeded
+                if error:
+                    errors.append(f"process {index}: {error}")
+                if exceeded or error:
+                    # Stop the other processes as a single loop would.
+                    pool.stop.set()
+            now = loop.time()
+            if now - last_report_time < 1.0:
+                continue
+            if slo_monitor is not None and self._check_slo(
+                slo_monitor, interval_stats, now - start_time, qps
+            ):
+                latency_exceeded = True
+                if slo.action == "abort":
+                    pool.stop.set()
+            if interval_stats.latency.total:
+                actual_qps = interval_stats.latency.total / (now - last_report_time)
+                reported_total += interval_stats.latency.total
+                self._report_percentiles(
+                    interval_stats,
+                    show_certainty,
+                    csv_writer,
+                    phase_name,
+                    total_queries=reported_total,
+                    actual_qps=actual_qps,
+                )
+                click.echo(f"Current QPS: {actual_qps:.2f}\n")
+            interval_stats.reset()
+            last_report_time = now
+
+        actual_duration = loop.time() - start_time
+        self.last_schedule = schedule
+        if phase_stats.latency.total:
+            self._report_final_results(
+                phase_stats,
+                show_certainty,
+                csv_writer,
+                phase_name,
+                actual_duration,
+            )
+            self._report_schedule(schedule, phase_name, qps, duration)
+        else:
+            click.echo("No successful queries were completed during the test.")
+        if errors:
+            raise Exception("Load generator failed: " + "; ".join(errors))
+        return phase_stats, latency_exceeded
 
     async def _find_max_qps(
         self,
@@ -725,10 +2507,41 @@ class BenchmarkQPSManager(BenchmarkManager):
         latency_threshold: int,
         concurrency: Optional[int] = None,
         fail_on_timeout: bool = CreateBenchmarkDefaults.fail_on_timeout,
+        return_mode: str = CreateBenchmarkDefaults.return_mode,
+        search_strategy: str = CreateBenchmarkDefaults.search_strategy,
+        search_precision: int = CreateBenchmarkDefaults.search_precision,
+        confirm_runs: int = CreateBenchmarkDefaults.confirm_runs,
+        threshold_percentile: Optional[
+            float
+        ] = CreateBenchmarkDefaults.threshold_percentile,
+        slo: Optional[SloPolicy] = None,
     ) -> int:
+        """Find the highest QPS that stays within the latency threshold.
+
+        "linear" steps up by 10 QPS until a rate fails. "exponential" doubles
+        the rate until one fails, then binary searches between the last passing
+        and the first failing rate until they are `search_precision` apart.
+        A rate passes when `confirm_runs` consecutive Main Test phases pass.
+        With `threshold_percentile` a phase fails when that latency percentile
+        exceeds `latency_threshold`; otherwise any single slower request fails
+        it (and stops it early). With `slo` a phase fails on its first SLO
+        breach instead and the latency threshold is not applied.
+        """
+        # In percentile and SLO mode single slow requests must not abort the phase.
+        per_request_threshold = (
+            latency_threshold
+            if threshold_percentile is None and slo is None
+            else float("inf")
+        )
+
+        def _percentile_check(stats: PhaseHistograms) -> Tuple[bool, str]:
+            observed = stats.latency.percentile(threshold_percentile) / 1000.0
+            exceeded = stats.latency.total == 0 or observed > latency_threshold
+            return exceeded, f"P{threshold_percentile:g} latency {observed:.2f} ms"
+
         if fixed_qps:
             click.echo(f"\nRunning test at fixed QPS of {fixed_qps}")
-            await self._run_phase(
+            stats, _ = await self._run_load_phase(
                 collection_obj,
                 query_terms,
                 limit,
@@ -738,61 +2551,2142 @@ class BenchmarkQPSManager(BenchmarkManager):
                 show_certainty,
                 csv_writer,
                 query_type,
-                latency_threshold,
+                per_request_threshold,
                 concurrency=concurrency,
                 fail_on_timeout=fail_on_timeout,
+                return_mode=return_mode,
+                slo=slo,
             )
+            self.main_phase_stats[fixed_qps] = stats
+            if threshold_percentile is not None and slo is None:
+                exceeded, label = _percentile_check(stats)
+                if exceeded:
+                    click.echo(f"{label} exceeded at {fixed_qps} QPS test phase.")
+                else:
+                    click.echo(
+                        f"{label} within the {latency_threshold} ms threshold "
+                        f"at {fixed_qps} QPS."
+                    )
             return fixed_qps
 
+        remaining = max_duration
+
+        async def _passes(qps: int) -> Optional[bool]:
+            """Probe one rate; None when the duration budget ran out first."""
+            nonlocal remaining
+            for run in range(confirm_runs):
+                if remaining <= 0:
+                    return None
+                suffix = f" (run {run + 1}/{confirm_runs})" if confirm_runs > 1 else ""
+                click.echo(f"\nTesting at {qps} QPS{suffix}")
+                await self._run_load_phase(
+                    collection_obj,
+                    query_terms,
+                    limit,
+                    max(1, qps // 10),
+                    warmup_duration,
+                    "Warmup",
+                    show_certainty,
+                    csv_writer,
+                    query_type,
+                    per_request_threshold,
+                    concurrency=concurrency,
+                    fail_on_timeout=fail_on_timeout,
+                    return_mode=return_mode,
+                )
+                stats, exceeded = await self._run_load_phase(
+                    collection_obj,
+                    query_terms,
+                    limit,
+                    qps,
+                    test_duration,
+                    "Main Test",
+                    show_certainty,
+                    csv_writer,
+                    query_type,
+                    per_request_threshold,
+                    concurrency=concurrency,
+                    fail_on_timeout=fail_on_timeout,
+                    return_mode=return_mode,
+                    slo=slo,
+                )
+                self.main_phase_stats[qps] = stats
+                remaining -= test_duration + warmup_duration
+                if slo is not None:
+                    label = "SLO"
+                elif threshold_percentile is not None:
+                    exceeded, label = _percentile_check(stats)
+                else:
+                    label = "Latency threshold"
+                if exceeded:
+                    click.echo(f"{label} exceeded at {qps} QPS test phase.")
+                    return False
+            return True
+
+        passing, failing = 0, None
         qps = 10
-        max_qps_reached = False
-        latency_exceeded = False
+        while failing is None:
+            result = await _passes(qps)
+            if result is None:
+                click.echo("Maximum test duration reached. Stopping test.")
+                return passing
+            if not result:
+                failing = qps
+                break
+            passing = qps
+            qps = qps * 2 if search_strategy == "exponential" else qps + 10
 
-        while not max_qps_reached:
-            click.echo(f"\nTesting at {qps} QPS")
-            warmup_qps = max(1, qps // 10)
+        if search_strategy == "linear":
+            click.echo("Stopping test.")
+            return passing
 
-            await self._run_phase(
-                collection_obj,
-                query_terms,
-                limit,
-                warmup_qps,
-                warmup_duration,
-                "Warmup",
-                show_certainty,
-                csv_writer,
-                query_type,
-                latency_threshold,
-                concurrency=concurrency,
-                fail_on_timeout=fail_on_timeout,
+        while failing - passing > search_precision:
+            qps = (passing + failing) // 2
+            result = await _passes(qps)
+            if result is None:
+                click.echo("Maximum test duration reached. Stopping test.")
+                break
+            if result:
+                passing = qps
+            else:
+                failing = qps
+        click.echo(
+            f"Maximum QPS is between {passing} (passing) and {failing} (failing)."
+        )
+        return passing
+
+
+class BenchmarkLatencyManager(BenchmarkManager):
+    """Single-stream latency: one query at a time, per query type."""
+
+    async def run_benchmark(
+        self,
+        collection: str,
+        query_types: Tuple[str, ...] = BenchmarkLatencyDefaults.query_types,
+        queries: int = BenchmarkLatencyDefaults.queries,
+        warmup: int = BenchmarkLatencyDefaults.warmup,
+        limit: int = BenchmarkLatencyDefaults.limit,
+        query_terms: Optional[List[str]] = None,
+        consistency_level: str = BenchmarkLatencyDefaults.consistency_level,
+        tenant: Optional[str] = BenchmarkLatencyDefaults.tenant,
+        return_mode: str = BenchmarkLatencyDefaults.return_mode,
+        json_output: bool = False,
+    ) -> None:
+        if not query_terms:
+            query_terms = self._get_default_query_terms()
+        try:
+            collection_obj, _ = await self._open_collection(
+                collection, consistency_level, tenant
+            )
+            results = []
+            for query_type in query_types:
+                click.echo(
+                    f"Running {warmup} warmup and {queries} measured {query_type} queries"
+                )
+                stats = PhaseHistograms()
+                for i in range(warmup + queries):
+                    took, _ = await self._run_query_and_collect_latency(
+                        collection_obj,
+                        query_terms[i % len(query_terms)],
+                        limit,
+                        [],
+                        query_type,
+                        return_mode=return_mode,
+                    )
+                    if i < warmup:
+                        continue
+                    if took is None:
+                        stats.errors += 1
+                    else:
+                        stats.record(took, took, 0, [])
+                results.append(_latency_summary(stats, query_type=query_type))
+        finally:
+            await self.async_client.close()
+
+        if json_output:
+            click.echo(
+                json.dumps(
+                    {"status": "success", "collection": collection, "results": results},
+                    indent=2,
+                )
+            )
+            return
+        _print_summary_table("Query type", "query_type", results)
+
+
+class BenchmarkThroughputManager(BenchmarkManager):
+    """
+    Closed-loop throughput: N virtual users each send their next query as
+    soon as the previous one returned (plus an optional think time), for
+    N = 1, 2, 4 ... up to `max_concurrency`.
+    """
+
+    async def run_benchmark(
+        self,
+        collection: str,
+        query_type: str = BenchmarkThroughputDefaults.query_type,
+        limit: int = BenchmarkThroughputDefaults.limit,
+        query_terms: Optional[List[str]] = None,
+        consistency_level: str = BenchmarkThroughputDefaults.consistency_level,
+        tenant: Optional[str] = BenchmarkThroughputDefaults.tenant,
+        return_mode: str = BenchmarkThroughputDefaults.return_mode,
+        max_concurrency: int = BenchmarkThroughputDefaults.max_concurrency,
+        level_duration: int = BenchmarkThroughputDefaults.level_duration,
+        warmup_duration: int = BenchmarkThroughputDefaults.warmup_duration,
+        think_time: float = BenchmarkThroughputDefaults.think_time,
+        json_output: bool = False,
+    ) -> None:
+        if not query_terms:
+            query_terms = self._get_default_query_terms()
+        try:
+            collection_obj, _ = await self._open_collection(
+                collection, consistency_level, tenant
+            )
+            if warmup_duration:
+                click.echo(f"Warming up for {warmup_duration} seconds")
+                await self._run_closed_loop(
+                    collection_obj,
+                    query_terms,
+                    limit,
+                    1,
+                    warmup_duration,
+                    query_type,
+                    think_time,
+                    return_mode,
+                )
+            results = []
+            for users in _concurrency_levels(max_concurrency):
+                stats, elapsed = await self._run_closed_loop(
+                    collection_obj,
+                    query_terms,
+                    limit,
+                    users,
+                    level_duration,
+                    query_type,
+                    think_time,
+                    return_mode,
+                )
+                summary = _latency_summary(
+                    stats, concurrency=users, throughput=stats.latency.total / elapsed
+                )
+                click.echo(
+                    f"Concurrency {users}: {summary['throughput']:.2f} queries/s, "
+                    f"P50/P99 latency {summary['p50']:.2f}/{summary['p99']:.2f} ms"
+                )
+                results.append(summary)
+        finally:
+            await self.async_client.close()
+
+        peak = max(results, key=lambda r: r["throughput"])
+        if json_output:
+            click.echo(
+                json.dumps(
+                    {
+                        "status": "success",
+                        "collection": collection,
+                        "query_type": query_type,
+                        "think_time_ms": think_time,
+                        "peak_throughput": peak["throughput"],
+                        "peak_concurrency": peak["concurrency"],
+                        "results": results,
+                    },
+                    indent=2,
+                )
             )
+            return
+        click.echo("")
+        _print_summary_table("Concurrency", "concurrency", results, throughput=True)
+        click.echo(
+            f"\nPeak throughput: {peak['throughput']:.2f} queries/s "
+            f"at concurrency {peak['concurrency']}."
+        )
+
+    async def _run_closed_loop(
+        self,
+        collection_obj: CollectionAsync,
+        query_terms: List[str],
+        limit: int,
+        users: int,
+        duration: float,
+        query_type: str,
+        think_time: float,
+        return_mode: str,
+    ) -> Tuple[PhaseHistograms, float]:
+        """Run `users` back-to-back query loops for `duration` seconds.
+
+        Returns the latency histograms and the elapsed time, including the
+        queries still in flight when the duration ended.
+        """
+        loop = asyncio.get_running_loop()
+        stats = PhaseHistograms()
+        start = loop.time()
+        end_time = start + duration
+
+        async def user(index: int) -> None:
+            i = index
+            while loop.time() < end_time:
+                took, _ = await self._run_query_and_collect_latency(
+                    collection_obj,
+                    query_terms[i % len(query_terms)],
+                    limit,
+                    [],
+                    query_type,
+                    return_mode=return_mode,
+                )
+                if took is None:
+                    stats.errors += 1
+                else:
+                    stats.record(took, took, 0, [])
+                i += users
+                if think_time:
+                    await asyncio.sleep(think_time / 1000.0)
+
+        await asyncio.gather(*(user(i) for i in range(users)))
+        return stats, max(loop.time() - start, 1e-9)
+
+
+class BenchmarkRecallManager(BenchmarkQPSManager):
+    """
+    Recall@k of `near_vector` queries against the exact top-k, measured at
+    each of a list of open-loop QPS levels (the qps benchmark's phases) next
+    to the latency.
+    """
 
-            _, latency_exceeded = await self._run_phase(
+    async def run_benchmark(
+        self,
+        collection: str,
+        limit: int = BenchmarkRecallDefaults.limit,
+        qps_levels: Tuple[int, ...] = BenchmarkRecallDefaults.qps_levels,
+        test_duration: int = BenchmarkRecallDefaults.test_duration,
+        warmup_duration: int = BenchmarkRecallDefaults.warmup_duration,
+        num_queries: int = BenchmarkRecallDefaults.num_queries,
+        queries_file: Optional[str] = BenchmarkRecallDefaults.queries_file,
+        query_seed: int = BenchmarkRecallDefaults.query_seed,
+        vectors: Optional[str] = BenchmarkRecallDefaults.vectors,
+        ids: Optional[str] = BenchmarkRecallDefaults.ids,
+        target_vector: Optional[str] = BenchmarkRecallDefaults.target_vector,
+        cache_dir: str = BenchmarkRecallDefaults.cache_dir,
+        refresh: bool = BenchmarkRecallDefaults.refresh,
+        consistency_level: str = BenchmarkRecallDefaults.consistency_level,
+        tenant: Optional[str] = BenchmarkRecallDefaults.tenant,
+        concurrency: Optional[int] = BenchmarkRecallDefaults.concurrency,
+        json_output: bool = False,
+    ) -> None:
+        if bool(vectors) != bool(ids):
+            raise Exception("--vectors and --ids must be given together.")
+        try:
+            collection_obj, tenant = await self._open_collection(
+                collection, consistency_level, tenant
+            )
+            cache = os.path.join(
+                cache_dir, collection if tenant is None else f"{collection}.{tenant}"
+            )
+            metric = await self._prepare_recall(
                 collection_obj,
-                query_terms,
+                cache,
                 limit,
-                qps,
-                test_duration,
-                "Main Test",
-                show_certainty,
-                csv_writer,
-                query_type,
-                latency_threshold,
-                concurrency=concurrency,
-                fail_on_timeout=fail_on_timeout,
+                num_queries,
+                queries_file,
+                query_seed,
+                vectors,
+                ids,
+                target_vector,
+                refresh,
             )
+            results = []
+            for qps in qps_levels:
+                results.append(
+                    await self._measure_recall(
+                        collection_obj,
+                        limit,
+                        qps,
+                        test_duration,
+                        warmup_duration,
+                        concurrency,
+                    )
+                )
+        finally:
+            await self.async_client.close()
 
-            if latency_exceeded:
-                click.echo(
-                    f"Latency threshold exceeded at {qps} QPS test phase. Stopping test."
+        if json_output:
+            click.echo(
+                json.dumps(
+                    {
+                        "status": "success",
+                        "collection": collection,
+                        "k": limit,
+                        "distance": metric,
+                        "queries": len(self.query_vectors),
+                        "results": results,
+                    },
+                    indent=2,
+                )
+            )
+            return
+        click.echo(f"\nRecall@{limit} ({metric}, {len(self.query_vectors)} queries):")
+        header = (
+            f"{'QPS':>8}{'Actual QPS':>12}{'P50 ms':>10}{'P99 ms':>10}"
+            f"{'Recall':>9}{'Worst 10%':>11}{'Worst 1%':>10}"
+        )
+        click.echo(header)
+        click.echo("-" * len(header))
+        for r in results:
+            click.echo(
+                f"{r['qps']:>8}{r['actual_qps']:>12.2f}{r['p50_ms']:>10.2f}"
+                f"{r['p99_ms']:>10.2f}{r['recall_mean']:>9.4f}"
+                f"{r['recall_p10']:>11.4f}{r['recall_p1']:>10.4f}"
+            )
+
+    async def _prepare_recall(
+        self,
+        collection_obj: CollectionAsync,
+        cache: str,
+        limit: int,
+        num_queries: int,
+        queries_file: Optional[str],
+        query_seed: int,
+        vectors: Optional[str],
+        ids: Optional[str],
+        target_vector: Optional[str],
+        refresh: bool,
+    ) -> str:
+        """Load or export the base vectors, pick the queries and set up the
+        recall probe against their (cached) exact top-k. Returns the metric."""
+        metric = await self._distance_metric(collection_obj, target_vector)
+        os.makedirs(cache, exist_ok=True)
+        if vectors:
+            base = DataManager._load_vectors_file(vectors)
+            base_path, uuids = vectors, _read_ids(ids)
+        else:
+            base_path = os.path.join(cache, f"{target_vector or 'default'}.npy")
+            ids_path = base_path[: -len(".npy")] + ".ids.txt"
+            if refresh or not (os.path.exists(base_path) and os.path.exists(ids_path)):
+                await self._export_vectors(
+                    collection_obj, target_vector, base_path, ids_path
                 )
-                max_qps_reached = True
             else:
-                max_duration -= test_duration + warmup_duration
-                if max_duration <= 0:
-                    click.echo("Maximum test duration reached. Stopping test.")
-                    max_qps_reached = True
-                else:
-                    qps += 10
+                click.echo(f"Using cached vectors {base_path} (--refresh to export)")
+            base, uuids = np.load(base_path, mmap_mode="r"), _read_ids(ids_path)
+        if len(uuids) != base.shape[0]:
+            raise Exception(
+                f"{base.shape[0]} vectors but {len(uuids)} ids; they must match row by row."
+            )
+        if queries_file:
+            queries = np.asarray(
+                DataManager._load_vectors_file(queries_file), dtype=np.float32
+            )
+        else:
+            rng = np.random.default_rng(query_seed)
+            rows = rng.choice(
+                base.shape[0], min(num_queries, base.shape[0]), replace=False
+            )
+            queries = np.asarray(base[np.sort(rows)], dtype=np.float32)
+        if queries.shape[1] != base.shape[1]:
+            raise Exception(
+                f"Query vectors have {queries.shape[1]} dimensions, the collection {base.shape[1]}."
+            )
+        truth = self._ground_truth(base, base_path, queries, limit, metric, cache)
+        self.query_vectors = queries
+        self.target_vector = target_vector
+        self.recall_probe = RecallProbe(
+            [{uuids[i] for i in row} for row in truth], limit
+        )
+        return metric
 
-        return qps - 10 if latency_exceeded else qps
+    async def _measure_recall(
+        self,
+        collection_obj: CollectionAsync,
+        limit: int,
+        qps: int,
+        test_duration: int,
+        warmup_duration: int,
+        concurrency: Optional[int],
+    ) -> dict:
+        """Recall and latency of one open-loop phase at `qps`."""
+        terms = list(range(len(self.query_vectors)))
+        click.echo(f"\nTesting at {qps} QPS")
+        if warmup_duration:
+            await self._run_phase(
+                collection_obj,
+                terms,
+                limit,
+                max(1, qps // 10),
+                warmup_duration,
+                "Warmup",
+                False,
+                None,
+                "near_vector",
+                float("inf"),
+                concurrency=concurrency,
+                return_mode="ids-only",
+            )
+        self.recall_probe.reset()
+        stats, _ = await self._run_phase(
+            collection_obj,
+            terms,
+            limit,
+            qps,
+            test_duration,
+            "Main Test",
+            False,
+            None,
+            "near_vector",
+            float("inf"),
+            concurrency=concurrency,
+            return_mode="ids-only",
+        )
+        recall = self.recall_probe.summary()
+        click.echo(
+            f"Recall@{limit}: mean {recall['mean']:.4f}, "
+            f"worst 10% {recall['p10']:.4f}, worst 1% {recall['p1']:.4f}"
+        )
+        p50, p99 = (
+            (v / 1000.0 for v in stats.latency.percentiles([50, 99]))
+            if stats.latency.total
+            else (0.0, 0.0)
+        )
+        return {
+            "qps": qps,
+            "actual_qps": round(stats.latency.total / test_duration, 2),
+            "p50_ms": round(p50, 3),
+            "p99_ms": round(p99, 3),
+            "recall_mean": recall["mean"],
+            "recall_p10": recall["p10"],
+            "recall_p1": recall["p1"],
+            "errors": stats.errors,
+        }
+
+    async def _distance_metric(
+        self, collection_obj: CollectionAsync, target_vector: Optional[str]
+    ) -> str:
+        cfg = await collection_obj.config.get()
+        if cfg.vector_config:
+            name = target_vector or (
+                "default"
+                if "default" in cfg.vector_config
+                else next(iter(cfg.vector_config))
+            )
+            if name not in cfg.vector_config:
+                raise Exception(
+                    f"Target vector '{name}' not found. Available: {', '.join(cfg.vector_config)}"
+                )
+            index_config = cfg.vector_config[name].vector_index_config
+        else:
+            index_config = cfg.vector_index_config
+        metric = getattr(index_config, "distance_metric", None)
+        return metric.value if metric is not None else "cosine"
+
+    async def _export_vectors(
+        self,
+        collection_obj: CollectionAsync,
+        target_vector: Optional[str],
+        vectors_path: str,
+        ids_path: str,
+    ) -> None:
+        """Stream every object's vector to an .npy file and its uuid to a
+        text file, row by row."""
+        click.echo(f"Exporting vectors to {vectors_path}")
+        writer: Optional[_NpyStreamWriter] = None
+        batch: List[List[float]] = []
+        with open(ids_path, "w") as ids_file:
+            async for obj in collection_obj.iterator(
+                include_vector=True, return_properties=[]
+            ):
+                vec = obj.vector
+                if isinstance(vec, dict):
+                    vec = vec.get(target_vector or "default") or (
+                        None if target_vector else next(iter(vec.values()), None)
+                    )
+                if not vec or isinstance(vec[0], list):
+                    raise Exception(
+                        f"Object {obj.uuid} has no single vector to compute recall on."
+                    )
+                if writer is None:
+                    writer = _NpyStreamWriter(vectors_path, len(vec))
+                batch.append(vec)
+                ids_file.write(f"{obj.uuid}\n")
+                if len(batch) == RECALL_EXPORT_BATCH:
+                    writer.append(np.asarray(batch, dtype=np.float32))
+                    batch = []
+                    click.echo(f"Exported {writer.rows} vectors")
+        if writer is None:
+            raise Exception("The collection has no objects to compute recall on.")
+        if batch:
+            writer.append(np.asarray(batch, dtype=np.float32))
+        writer.close()
+        click.echo(f"Exported {writer.rows} vectors")
+
+    def _ground_truth(
+        self,
+        base: np.ndarray,
+        base_path: str,
+        queries: np.ndarray,
+        k: int,
+        metric: str,
+        cache: str,
+    ) -> np.ndarray:
+        """Exact top-k of the queries, cached in `cache` by the base file,
+        queries, k and metric."""
+        stat = os.stat(base_path)
+        key = hashlib.sha1(
+            f"{os.path.abspath(base_path)}:{stat.st_size}:{stat.st_mtime_ns}:{k}:{metric}".encode()
+            + np.ascontiguousarray(queries).tobytes()
+        ).hexdigest()[:16]
+        path = os.path.join(cache, f"ground_truth_{key}.npy")
+        if os.path.exists(path):
+            click.echo(f"Using cached ground truth {path}")
+            return np.load(path)
+        click.echo(
+            f"Computing exact top-{k} of {len(queries)} queries over {base.shape[0]} vectors"
+        )
+        started = time.perf_counter()
+        truth = exact_top_k(base, queries, k, metric)
+        np.save(path, truth)
+        click.echo(
+            f"Saved ground truth to {path} ({time.perf_counter() - started:.1f} s)"
+        )
+        return truth
+
+
+class BenchmarkSweepManager(BenchmarkRecallManager):
+    """
+    Vector index settings sweep. For every cell of a settings matrix it
+    creates a collection, ingests the same seeded dataset, waits for indexing,
+    measures recall and latency at a fixed QPS and searches the maximum QPS,
+    then compares the cells.
+    """
+
+    def __init__(
+        self,
+        async_client,
+        client,
+        client_factory: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        super().__init__(async_client, client_factory)
+        # Sync client for creating, filling and deleting the collections.
+        self.client = client
+
+    async def run_benchmark(
+        self,
+        matrix: str,
+        objects: int = BenchmarkSweepDefaults.objects,
+        vector_dimensions: int = BenchmarkSweepDefaults.vector_dimensions,
+        collection_prefix: str = BenchmarkSweepDefaults.collection_prefix,
+        limit: int = BenchmarkSweepDefaults.limit,
+        recall_qps: int = BenchmarkSweepDefaults.recall_qps,
+        num_queries: int = BenchmarkSweepDefaults.num_queries,
+        query_seed: int = BenchmarkSweepDefaults.query_seed,
+        max_duration: int = BenchmarkSweepDefaults.max_duration,
+        test_duration: int = BenchmarkSweepDefaults.test_duration,
+        warmup_duration: int = BenchmarkSweepDefaults.warmup_duration,
+        latency_threshold: int = BenchmarkSweepDefaults.latency_threshold,
+        threshold_percentile: float = BenchmarkSweepDefaults.threshold_percentile,
+        search_strategy: str = BenchmarkSweepDefaults.search_strategy,
+        consistency_level: str = BenchmarkSweepDefaults.consistency_level,
+        cache_dir: str = BenchmarkSweepDefaults.cache_dir,
+        metrics_url: Optional[str] = BenchmarkSweepDefaults.metrics_url,
+        keep: bool = BenchmarkSweepDefaults.keep,
+        output: str = BenchmarkSweepDefaults.output,
+        generate_graph: bool = BenchmarkSweepDefaults.generate_graph,
+        json_output: bool = False,
+    ) -> None:
+        cells = _load_sweep_matrix(matrix)
+        names = [f"{collection_prefix}{i}" for i in range(len(cells))]
+        # Each cell's collection is deleted after it, so never reuse one.
+        existing = [n for n in names if self.client.collections.exists(n)]
+        if existing:
+            raise Exception(
+                f"Collections {', '.join(existing)} already exist. Delete them "
+                "or pick another --collection-prefix."
+            )
+        results = []
+        try:
+            await self.async_client.connect()
+            for i, ((label, settings), name) in enumerate(zip(cells, names)):
+                click.echo(f"\n=== Cell {i + 1}/{len(cells)}: {label} ({name}) ===")
+                row: Dict[str, Any] = {"cell": label, "collection": name}
+                try:
+                    row.update(
+                        await self._run_cell(
+                            name,
+                            settings,
+                            objects,
+                            vector_dimensions,
+                            limit,
+                            recall_qps,
+                            num_queries,
+                            query_seed,
+                            max_duration,
+                            test_duration,
+                            warmup_duration,
+                            latency_threshold,
+                            threshold_percentile,
+                            search_strategy,
+                            consistency_level,
+                            os.path.join(cache_dir, name),
+                            metrics_url,
+                        )
+                    )
+                except Exception as e:
+                    click.echo(f"Cell '{label}' failed: {e}")
+                    row["error"] = str(e)
+                finally:
+                    if not keep and self.client.collections.exists(name):
+                        self.client.collections.delete(name)
+                results.append(row)
+        finally:
+            await self.async_client.close()
+
+        csv_path = (
+            _write_rows_csv(
+                "sweep_results",
+                [
+                    "cell",
+                    "collection",
+                    "recall",
+                    "p99_ms",
+                    "max_qps",
+                    "import_s",
+                    "heap_mb",
+                    "error",
+                ],
+                results,
+            )
+            if output == "csv"
+            else None
+        )
+        if json_output:
+            click.echo(
+                json.dumps(
+                    {"status": "success", "k": limit, "results": results}, indent=2
+                )
+            )
+        else:
+            self._print_sweep_table(results, limit, recall_qps)
+        if generate_graph and csv_path:
+            try:
+                self._generate_sweep_graph(results, csv_path, limit)
+            except Exception as e:
+                click.echo(f"Failed to generate graph: {e}")
+
+    async def _run_cell(
+        self,
+        name: str,
+        settings: dict,
+        objects: int,
+        vector_dimensions: int,
+        limit: int,
+        recall_qps: int,
+        num_queries: int,
+        query_seed: int,
+        max_duration: int,
+        test_duration: int,
+        warmup_duration: int,
+        latency_threshold: int,
+        threshold_percentile: float,
+        search_strategy: str,
+        consistency_level: str,
+        cache: str,
+        metrics_url: Optional[str],
+    ) -> dict:
+        loop = asyncio.get_running_loop()
+        heap_before = _read_heap_bytes(metrics_url) if metrics_url else None
+        await loop.run_in_executor(
+            None,
+            lambda: CollectionManager(self.client).create_collection(
+                collection=name, **settings
+            ),
+        )
+        started = time.perf_counter()
+        # The same seed (create data's default) gives every cell the same data.
+        await loop.run_in_executor(
+            None,
+            lambda: DataManager(self.client).create_data(
+                collection=name,
+                limit=objects,
+                randomize=True,
+                vector_dimensions=vector_dimensions,
+                wait_for_indexing=True,
+            ),
+        )
+        import_s = time.perf_counter() - started
+        heap_mb = None
+        if heap_before is not None:
+            heap_mb = round((_read_heap_bytes(metrics_url) - heap_before) / 2**20, 1)
+
+        collection_obj, _ = await self._open_collection(name, consistency_level, None)
+        await self._prepare_recall(
+            collection_obj,
+            cache,
+            limit,
+            num_queries,
+            None,
+            query_seed,
+            None,
+            None,
+            None,
+            True,
+        )
+        recall = await self._measure_recall(
+            collection_obj, limit, recall_qps, test_duration, warmup_duration, None
+        )
+        # Recall is measured above; the max QPS search only needs latency.
+        self.recall_probe = None
+        self.main_phase_stats = {}
+        max_qps = await self._find_max_qps(
+            collection_obj,
+            list(range(len(self.query_vectors))),
+            limit,
+            max_duration,
+            None,
+            False,
+            None,
+            "near_vector",
+            warmup_duration,
+            test_duration,
+            latency_threshold,
+            search_strategy=search_strategy,
+            threshold_percentile=threshold_percentile,
+        )
+        return {
+            "recall": recall["recall_mean"],
+            "p99_ms": recall["p99_ms"],
+            "max_qps": max_qps,
+            "import_s": round(import_s, 2),
+            "heap_mb": heap_mb,
+        }
+
+    def _print_sweep_table(
+        self, results: List[dict], limit: int, recall_qps: int
+    ) -> None:
+        width = max([len("Cell")] + [len(r["cell"]) for r in results])
+        header = (
+            f"{'Cell':<{width}}  {f'Recall@{limit}':>10}{f'P99 ms@{recall_qps}':>14}"
+            f"{'Max QPS':>9}{'Import s':>10}{'Heap MB':>9}"
+        )
+        click.echo("\nSweep results:")
+        click.echo(header)
+        click.echo("-" * len(header))
+        for r in results:
+            if "error" in r:
+                click.echo(f"{r['cell']:<{width}}  failed: {r['error']}")
+                continue
+            heap = "n/a" if r["heap_mb"] is None else f"{r['heap_mb']:.1f}"
+            click.echo(
+                f"{r['cell']:<{width}}  {r['recall']:>10.4f}{r['p99_ms']:>14.2f}"
+                f"{r['max_qps']:>9}{r['import_s']:>10.2f}{heap:>9}"
+            )
+
+    def _generate_sweep_graph(
+        self, results: List[dict], csv_path: str, limit: int
+    ) -> str:
+        """Bar charts of every metric per cell, plus recall against max QPS."""
+        try:
+            import matplotlib
+
+            matplotlib.use("Agg")
+            import matplotlib.pyplot as plt
+        except Exception as imp_err:
+            raise RuntimeError(
+                "matplotlib is required for --generate-graph. Install it and retry."
+            ) from imp_err
+
+        rows = [r for r in results if "error" not in r]
+        if not rows:
+            raise RuntimeError("No successful cells to plot.")
+        labels = [r["cell"] for r in rows]
+        fig, axes = plt.subplots(2, 3, figsize=(16, 9))
+        metrics = [
+            ("recall", f"Recall@{limit}"),
+            ("p99_ms", "P99 latency (ms)"),
+            ("max_qps", "Max QPS"),
+            ("import_s", "Import time (s)"),
+            ("heap_mb", "Heap growth (MB)"),
+        ]
+        for ax, (key, title) in zip(axes.flat, metrics):
+            ax.barh(labels, [r[key] or 0 for r in rows], color="#2a9d8f")
+            ax.set_title(title)
+            ax.invert_yaxis()
+            ax.grid(True, axis="x", alpha=0.3)
+        ax = axes.flat[5]
+        ax.scatter([r["max_qps"] for r in rows], [r["recall"] for r in rows])
+        for r in rows:
+            ax.annotate(r["cell"], (r["max_qps"], r["recall"]), fontsize=7)
+        ax.set_xlabel("Max QPS")
+        ax.set_ylabel(f"Recall@{limit}")
+        ax.set_title("Recall vs. max QPS")
+        ax.grid(True, alpha=0.3)
+        fig.tight_layout()
+        png_path = str(_Path(csv_path).with_suffix(".png"))
+        fig.savefig(png_path, dpi=150)
+        plt.close(fig)
+        click.echo(f"Saved sweep graph to {png_path}")
+        return png_path
+
+
+class BenchmarkEfSweepManager(BenchmarkRecallManager):
+    """
+    Query-time search parameter sweep on a loaded HNSW collection. Steps the
+    collection's ef, dynamic ef bounds and rescore limit through the update
+    collection path and measures recall and latency at a fixed QPS after each
+    change, without re-ingesting. The original settings are restored at the end.
+    """
+
+    def __init__(
+        self,
+        async_client,
+        client,
+        client_factory: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        super().__init__(async_client, client_factory)
+        # Sync client for the collection updates.
+        self.client = client
+
+    async def run_benchmark(
+        self,
+        collection: str,
+        ef: Tuple[int, ...] = BenchmarkEfSweepDefaults.ef,
+        dynamic_ef_min: Tuple[int, ...] = BenchmarkEfSweepDefaults.dynamic_ef_min,
+        dynamic_ef_max: Tuple[int, ...] = BenchmarkEfSweepDefaults.dynamic_ef_max,
+        dynamic_ef_factor: Tuple[int, ...] = BenchmarkEfSweepDefaults.dynamic_ef_factor,
+        rescore_limit: Tuple[int, ...] = BenchmarkEfSweepDefaults.rescore_limit,
+        limit: int = BenchmarkEfSweepDefaults.limit,
+        qps: int = BenchmarkEfSweepDefaults.qps,
+        test_duration: int = BenchmarkEfSweepDefaults.test_duration,
+        warmup_duration: int = BenchmarkEfSweepDefaults.warmup_duration,
+        target_recall: Optional[float] = BenchmarkEfSweepDefaults.target_recall,
+        num_queries: int = BenchmarkEfSweepDefaults.num_queries,
+        queries_file: Optional[str] = BenchmarkEfSweepDefaults.queries_file,
+        query_seed: int = BenchmarkEfSweepDefaults.query_seed,
+        vectors: Optional[str] = BenchmarkEfSweepDefaults.vectors,
+        ids: Optional[str] = BenchmarkEfSweepDefaults.ids,
+        target_vector: Optional[str] = BenchmarkEfSweepDefaults.target_vector,
+        cache_dir: str = BenchmarkEfSweepDefaults.cache_dir,
+        refresh: bool = BenchmarkEfSweepDefaults.refresh,
+        consistency_level: str = BenchmarkEfSweepDefaults.consistency_level,
+        tenant: Optional[str] = BenchmarkEfSweepDefaults.tenant,
+        concurrency: Optional[int] = BenchmarkEfSweepDefaults.concurrency,
+        output: str = BenchmarkEfSweepDefaults.output,
+        generate_graph: bool = BenchmarkEfSweepDefaults.generate_graph,
+        json_output: bool = False,
+    ) -> None:
+        if bool(vectors) != bool(ids):
+            raise Exception("--vectors and --ids must be given together.")
+        steps = _search_param_steps(
+            ef=ef,
+            dynamic_ef_min=dynamic_ef_min,
+            dynamic_ef_max=dynamic_ef_max,
+            dynamic_ef_factor=dynamic_ef_factor,
+            rescore_limit=rescore_limit,
+        )
+        loop = asyncio.get_running_loop()
+        manager = CollectionManager(self.client)
+        # Only the queried vector is swept and restored; other named vectors
+        # keep their own settings.
+        vector_name, original = self._search_params(
+            collection, target_vector, dict.fromkeys(k for step in steps for k in step)
+        )
+        results = []
+        updated = False
+        try:
+            collection_obj, tenant = await self._open_collection(
+                collection, consistency_level, tenant
+            )
+            cache = os.path.join(
+                cache_dir, collection if tenant is None else f"{collection}.{tenant}"
+            )
+            metric = await self._prepare_recall(
+                collection_obj,
+                cache,
+                limit,
+                num_queries,
+                queries_file,
+                query_seed,
+                vectors,
+                ids,
+                target_vector,
+                refresh,
+            )
+            for i, params in enumerate(steps):
+                updated = True
+                label = _format_params(params)
+                click.echo(f"\n=== Step {i + 1}/{len(steps)}: {label} ===")
+                await loop.run_in_executor(
+                    None,
+                    lambda: manager.update_collection(
+                        collection=collection, target_vector=vector_name, **params
+                    ),
+                )
+                result = await self._measure_recall(
+                    collection_obj,
+                    limit,
+                    qps,
+                    test_duration,
+                    warmup_duration,
+                    concurrency,
+                )
+                results.append({"step": label, **params, **result})
+        finally:
+            await self.async_client.close()
+            if updated and original:
+                click.echo(f"\nRestoring {_format_params(original)}")
+                await loop.run_in_executor(
+                    None,
+                    lambda: manager.update_collection(
+                        collection=collection, target_vector=vector_name, **original
+                    ),
+                )
+
+        best = _best_operating_point(results, target_recall)
+        csv_path = (
+            _write_rows_csv(
+                "ef_sweep_results",
+                list(results[0]),
+                results,
+            )
+            if output == "csv"
+            else None
+        )
+        if json_output:
+            click.echo(
+                json.dumps(
+                    {
+                        "status": "success",
+                        "collection": collection,
+                        "k": limit,
+                        "distance": metric,
+                        "queries": len(self.query_vectors),
+                        "results": results,
+                        "best": best,
+                    },
+                    indent=2,
+                )
+            )
+        else:
+            self._print_ef_sweep_table(results, limit, qps, target_recall, best)
+        if generate_graph and csv_path:
+            try:
+                self._generate_ef_sweep_graph(results, csv_path, limit, qps)
+            except Exception as e:
+                click.echo(f"Failed to generate graph: {e}")
+
+    def _search_params(
+        self, collection: str, target_vector: Optional[str], keys: Iterable[str]
+    ) -> Tuple[Optional[str], dict]:
+        """The queried named vector (None without named vectors) and its
+        current values of the swept search parameters, to restore them."""
+        cfg = self.client.collections.get(collection).config.get()
+        name = None
+        if cfg.vector_config:
+            name = target_vector or (
+                "default"
+                if "default" in cfg.vector_config
+                else next(iter(cfg.vector_config))
+            )
+            index_config = cfg.vector_config[name].vector_index_config
+        else:
+            index_config = cfg.vector_index_config
+        current = {}
+        for key in keys:
+            if key == "rescore_limit":
+                current[key] = getattr(index_config.quantizer, "rescore_limit", None)
+            else:
+                current[key] = getattr(index_config, key)
+        return name, {k: v for k, v in current.items() if v is not None}
+
+    def _print_ef_sweep_table(
+        self,
+        results: List[dict],
+        limit: int,
+        qps: int,
+        target_recall: Optional[float],
+        best: Optional[dict],
+    ) -> None:
+        width = max([len("Step")] + [len(r["step"]) for r in results])
+        header = (
+            f"{'Step':<{width}}{'Actual QPS':>12}{'P50 ms':>10}{'P99 ms':>10}"
+            f"{f'Recall@{limit}':>11}{'Worst 1%':>10}{'Errors':>8}"
+        )
+        click.echo(f"\nSearch parameter sweep at {qps} QPS:")
+        click.echo(header)
+        click.echo("-" * len(header))
+        for r in results:
+            click.echo(
+                f"{r['step']:<{width}}{r['actual_qps']:>12.2f}{r['p50_ms']:>10.2f}"
+                f"{r['p99_ms']:>10.2f}{r['recall_mean']:>11.4f}"
+                f"{r['recall_p1']:>10.4f}{r['errors']:>8}"
+            )
+        if best:
+            goal = f" with recall >= {target_recall}" if target_recall else ""
+            click.echo(
+                f"\nBest operating point{goal}: {best['step']} "
+                f"(recall {best['recall_mean']:.4f}, p99 {best['p99_ms']:.2f} ms)"
+            )
+        elif target_recall:
+            click.echo(f"\nNo step reached recall {target_recall}.")
+
+    def _generate_ef_sweep_graph(
+        self, results: List[dict], csv_path: str, limit: int, qps: int
+    ) -> str:
+        """The p99 latency / recall curve of the steps, in sweep order."""
+        try:
+            import matplotlib
+
+            matplotlib.use("Agg")
+            import matplotlib.pyplot as plt
+        except Exception as imp_err:
+            raise RuntimeError(
+                "matplotlib is required for --generate-graph. Install it and retry."
+            ) from imp_err
+
+        fig, ax = plt.subplots(figsize=(10, 7))
+        recall = [r["recall_mean"] for r in results]
+        p99 = [r["p99_ms"] for r in results]
+        ax.plot(recall, p99, marker="o", color="#2a9d8f")
+        for r in results:
+            ax.annotate(
+                r["step"],
+                (r["recall_mean"], r["p99_ms"]),
+                textcoords="offset points",
+                xytext=(4, 4),
+                fontsize=7,
+            )
+        ax.set_xlabel(f"Recall@{limit}")
+        ax.set_ylabel("P99 latency (ms)")
+        ax.set_title(f"Latency / recall at {qps} QPS")
+        ax.grid(True, alpha=0.3)
+        fig.tight_layout()
+        png_path = str(_Path(csv_path).with_suffix(".png"))
+        fig.savefig(png_path, dpi=150)
+        plt.close(fig)
+        click.echo(f"Saved sweep graph to {png_path}")
+        return png_path
+
+
+class BenchmarkMixedManager(BenchmarkQPSManager):
+    """
+    Queries at a fixed open-loop QPS alongside rate-limited writes (batch
+    inserts, and optionally single-object updates and deletes) in the same
+    event loop, to see query latency under concurrent ingest. Reads and
+    writes are reported together on a shared one-second timeline.
+
+    Updates and deletes only touch objects this run inserted; those objects
+    are deleted again at the end unless `keep_objects` is set.
+    """
+
+    async def run_benchmark(
+        self,
+        collection: str = BenchmarkMixedDefaults.collection,
+        query_type: str = BenchmarkMixedDefaults.query_type,
+        limit: int = BenchmarkMixedDefaults.limit,
+        query_terms: Optional[List[str]] = None,
+        qps: int = BenchmarkMixedDefaults.qps,
+        duration: int = BenchmarkMixedDefaults.duration,
+        insert_rate: float = BenchmarkMixedDefaults.insert_rate,
+        batch_size: int = BenchmarkMixedDefaults.batch_size,
+        update_rate: float = BenchmarkMixedDefaults.update_rate,
+        delete_rate: float = BenchmarkMixedDefaults.delete_rate,
+        write_concurrency: int = BenchmarkMixedDefaults.write_concurrency,
+        keep_objects: bool = BenchmarkMixedDefaults.keep_objects,
+        consistency_level: str = BenchmarkMixedDefaults.consistency_level,
+        tenant: Optional[str] = BenchmarkMixedDefaults.tenant,
+        return_mode: str = BenchmarkMixedDefaults.return_mode,
+        concurrency: Optional[int] = BenchmarkMixedDefaults.concurrency,
+        output: str = BenchmarkMixedDefaults.output,
+        generate_graph: bool = BenchmarkMixedDefaults.generate_graph,
+        json_output: bool = False,
+    ) -> None:
+        if not query_terms:
+            query_terms = self._get_default_query_terms()
+        rates = {"insert": insert_rate, "update": update_rate, "delete": delete_rate}
+        rates = {op: rate for op, rate in rates.items() if rate > 0}
+        if rates and "insert" not in rates:
+            click.echo(
+                "Warning: updates and deletes only touch objects this run inserts, "
+                "so without --insert-rate they have nothing to write."
+            )
+        self.written_ids: List[str] = []
+        self.write_interval = {op: PhaseHistograms() for op in rates}
+        write_stats = {op: PhaseHistograms() for op in rates}
+        self.objects_interval = 0
+        objects_written = 0
+        timeline: List[dict] = []
+        try:
+            collection_obj, _ = await self._open_collection(
+                collection, consistency_level, tenant
+            )
+            make_vector = await self._vector_factory(collection_obj)
+            # Faker is too slow to run between scheduled writes; writes cycle
+            # through a pre-generated pool of objects instead.
+            pool = [
+                generate_movie_object(seed=42 + i)
+                for i in range(min(MIXED_OBJECT_POOL, max(batch_size, 1)))
+            ]
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+
+            def on_interval(reads: PhaseHistograms) -> None:
+                nonlocal objects_written
+                writes = PhaseHistograms()
+                for op, interval in self.write_interval.items():
+                    writes.merge(interval)
+                    write_stats[op].merge(interval)
+                    interval.reset()
+                row = {"second": len(timeline) + 1}
+                row.update(_interval_row("read", reads))
+                row.update(_interval_row("write", writes))
+                row["objects_written"] = self.objects_interval
+                timeline.append(row)
+                objects_written += self.objects_interval
+                if not json_output:
+                    click.echo(
+                        f"[{row['second']:>4}s] reads {row['read_ops']:>6} "
+                        f"p99 {row['read_p99_ms']:>8.2f} ms | writes "
+                        f"{row['write_ops']:>5} ops, {row['objects_written']:>6} objects, "
+                        f"p99 {row['write_p99_ms']:>8.2f} ms, errors "
+                        f"{row['read_errors'] + row['write_errors']}"
+                    )
+                self.objects_interval = 0
+
+            writes = [
+                self._rate_limited_writes(
+                    op,
+                    rate,
+                    start + duration,
+                    asyncio.Semaphore(write_concurrency),
+                    collection_obj,
+                    pool,
+                    make_vector,
+                    batch_size,
+                )
+                for op, rate in rates.items()
+            ]
+            writes_desc = ", ".join(f"{r:g} {op}s/s" for op, r in rates.items())
+            click.echo(
+                f"Running {qps} QPS of {query_type} queries for {duration} seconds "
+                f"alongside {writes_desc or 'no writes'}"
+                + (f" (batches of {batch_size})" if "insert" in rates else "")
+            )
+            (read_stats, _), *_ = await asyncio.gather(
+                self._run_phase(
+                    collection_obj,
+                    query_terms,
+                    limit,
+                    qps,
+                    duration,
+                    "Main Test",
+                    False,
+                    None,
+                    query_type,
+                    float("inf"),
+                    concurrency=concurrency,
+                    return_mode=return_mode,
+                    report=False,
+                    on_interval=on_interval,
+                ),
+                *writes,
+            )
+            elapsed = loop.time() - start
+            if any(i.latency.total or i.errors for i in self.write_interval.values()):
+                # Writes that finished after the last read interval.
+                on_interval(PhaseHistograms())
+        finally:
+            if self.written_ids and not keep_objects:
+                await self._delete_written(collection_obj)
+            await self.async_client.close()
+
+        # Writes that never ran (updates and deletes with nothing inserted
+        # yet) have no row; reads always do, even if every query failed.
+        summary = [
+            _latency_summary(
+                stats,
+                operation=op,
+                throughput=round(stats.latency.total / elapsed, 2),
+            )
+            for op, stats in [("read", read_stats), *write_stats.items()]
+            if op == "read" or stats.latency.total or stats.errors
+        ]
+        csv_path = (
+            _write_rows_csv("mixed_timeline", list(timeline[0]), timeline)
+            if output == "csv" and timeline
+            else None
+        )
+        if json_output:
+            click.echo(
+                json.dumps(
+                    {
+                        "status": "success",
+                        "collection": collection,
+                        "query_type": query_type,
+                        "qps": qps,
+                        "write_rates": rates,
+                        "objects_written": objects_written,
+                        "objects_per_second": round(objects_written / elapsed, 2),
+                        "summary": summary,
+                        "timeline": timeline,
+                    },
+                    indent=2,
+                )
+            )
+        else:
+            click.echo("")
+            _print_summary_table("Operation", "operation", summary, throughput=True)
+            click.echo(
+                f"\nWrite throughput: {objects_written / elapsed:.2f} objects/s "
+                f"({objects_written} objects inserted, updated or deleted)"
+            )
+        if generate_graph and csv_path:
+            try:
+                self._generate_mixed_graph(timeline, csv_path)
+            except Exception as e:
+                click.echo(f"Failed to generate graph: {e}")
+
+    async def _vector_factory(
+        self, collection_obj: CollectionAsync
+    ) -> Callable[[], Any]:
+        """Random vectors shaped like the collection's stored ones; None
+        (vectorized by Weaviate, or no vectors) when it has no objects yet."""
+        response = await collection_obj.query.fetch_objects(
+            limit=1, include_vector=True
+        )
+        sample = response.objects[0].vector if response.objects else None
+        if not sample:
+            return lambda: None
+
+        def shape(vec):
+            return (len(vec), len(vec[0])) if isinstance(vec[0], list) else len(vec)
+
+        if isinstance(sample, dict):
+            shapes = {name: shape(vec) for name, vec in sample.items()}
+            return lambda: {
+                name: (2 * np.random.rand(*np.atleast_1d(s)) - 1).tolist()
+                for name, s in shapes.items()
+            }
+        dims = shape(sample)
+        return lambda: (2 * np.random.rand(*np.atleast_1d(dims)) - 1).tolist()
+
+    async def _rate_limited_writes(
+        self,
+        op: str,
+        rate: float,
+        deadline: float,
+        sem: asyncio.Semaphore,
+        collection_obj: CollectionAsync,
+        pool: List[dict],
+        make_vector: Callable[[], Any],
+        batch_size: int,
+    ) -> None:
+        """Start one `op` at a time on a fixed schedule until `deadline`.
+
+        `rate` is objects per second; inserts send them in batches. As with
+        reads, latency runs from the scheduled start, so writes that waited for
+        one of the `sem` slots are not under-reported.
+        """
+        loop = asyncio.get_running_loop()
+        interval = (batch_size if op == "insert" else 1) / rate
+        next_t = loop.time()
+        tasks = set()
+        while next_t < deadline:
+            await asyncio.sleep(max(0.0, next_t - loop.time()))
+            await sem.acquire()
+            task = asyncio.create_task(
+                self._timed_write(
+                    op, next_t, sem, collection_obj, pool, make_vector, batch_size
+                )
+            )
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            next_t += interval
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _timed_write(
+        self,
+        op: str,
+        intended_t: float,
+        sem: asyncio.Semaphore,
+        collection_obj: CollectionAsync,
+        pool: List[dict],
+        make_vector: Callable[[], Any],
+        batch_size: int,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        stats = self.write_interval[op]
+        started_t = loop.time()
+        try:
+            if op == "insert":
+                response = await collection_obj.data.insert_many(
+                    [
+                        wvc.data.DataObject(
+                            properties=random.choice(pool), vector=make_vector()
+                        )
+                        for _ in range(batch_size)
+                    ]
+                )
+                stats.errors += len(response.errors)
+                self.written_ids.extend(str(u) for u in response.uuids.values())
+                written = len(response.uuids)
+            elif not self.written_ids:
+                # Nothing inserted yet to update or delete.
+                return
+            elif op == "update":
+                await collection_obj.data.update(
+                    uuid=random.choice(self.written_ids),
+                    properties=random.choice(pool),
+                )
+                written = 1
+            else:
+                ids = self.written_ids
+                i = random.randrange(len(ids))
+                ids[i], ids[-1] = ids[-1], ids[i]
+                await collection_obj.data.delete_by_id(ids.pop())
+                written = 1
+        except Exception:
+            stats.errors += 1
+        else:
+            now = loop.time()
+            stats.record(
+                (now - intended_t) * 1000.0,
+                (now - started_t) * 1000.0,
+                max(0.0, started_t - intended_t) * 1000.0,
+            )
+            self.objects_interval += written
+        finally:
+            sem.release()
+
+    async def _delete_written(self, collection_obj: CollectionAsync) -> None:
+        click.echo(f"Deleting the {len(self.written_ids)} objects written")
+        for i in range(0, len(self.written_ids), MIXED_DELETE_BATCH):
+            await collection_obj.data.delete_many(
+                where=wvc.query.Filter.by_id().contains_any(
+                    self.written_ids[i : i + MIXED_DELETE_BATCH]
+                )
+            )
+
+    def _generate_mixed_graph(self, timeline: List[dict], csv_path: str) -> str:
+        """Read p50/p99 latency and write throughput over the run."""
+        try:
+            import matplotlib
+
+            matplotlib.use("Agg")
+            import matplotlib.pyplot as plt
+        except Exception as imp_err:
+            raise RuntimeError(
+                "matplotlib is required for --generate-graph. Install it and retry."
+            ) from imp_err
+
+        seconds = [row["second"] for row in timeline]
+        fig, ax = plt.subplots(figsize=(12, 6))
+        ax.plot(seconds, [r["read_p50_ms"] for r in timeline], label="Read P50")
+        ax.plot(seconds, [r["read_p99_ms"] for r in timeline], label="Read P99")
+        ax.plot(
+            seconds,
+            [r["write_p99_ms"] for r in timeline],
+            label="Write P99",
+            linestyle="--",
+        )
+        ax.set_xlabel("Time (s)")
+        ax.set_ylabel("Latency (ms)")
+        ax.grid(True, alpha=0.3)
+        ax2 = ax.twinx()
+        ax2.bar(
+            seconds,
+            [r["objects_written"] for r in timeline],
+            alpha=0.2,
+            color="gray",
+            label="Objects written",
+        )
+        ax2.set_ylabel("Objects written per second")
+        lines, labels = ax.get_legend_handles_labels()
+        bars, bar_labels = ax2.get_legend_handles_labels()
+        ax.legend(lines + bars, labels + bar_labels, loc="upper left")
+        ax.set_title("Query latency under concurrent writes")
+        fig.tight_layout()
+        png_path = str(_Path(csv_path).with_suffix(".png"))
+        fig.savefig(png_path, dpi=150)
+        plt.close(fig)
+        click.echo(f"Saved timeline graph to {png_path}")
+        return png_path
+
+
+class BenchmarkColdTenantManager(BenchmarkManager):
+    """
+    Time until a cold tenant serves its first query. Deactivates (or
+    offloads) a sample of active tenants, then queries each one, `concurrency`
+    tenants at a time, until a query succeeds: either relying on the
+    collection's auto tenant activation, or activating the tenant explicitly
+    first. The times are reported against each tenant's object count.
+
+    Sampled tenants still cold at the end, e.g. after a failure or an
+    interrupt, are set back to ACTIVE.
+    """
+
+    async def run_benchmark(
+        self,
+        collection: str = BenchmarkColdTenantDefaults.collection,
+        tenants: Optional[str] = BenchmarkColdTenantDefaults.tenants,
+        tenant_suffix: Optional[str] = BenchmarkColdTenantDefaults.tenant_suffix,
+        sample: int = BenchmarkColdTenantDefaults.sample,
+        seed: int = BenchmarkColdTenantDefaults.seed,
+        state: str = BenchmarkColdTenantDefaults.state,
+        activation: str = BenchmarkColdTenantDefaults.activation,
+        concurrency: int = BenchmarkColdTenantDefaults.concurrency,
+        timeout: float = BenchmarkColdTenantDefaults.timeout,
+        poll_interval: float = BenchmarkColdTenantDefaults.poll_interval,
+        consistency_level: str = BenchmarkColdTenantDefaults.consistency_level,
+        output: str = BenchmarkColdTenantDefaults.output,
+        generate_graph: bool = BenchmarkColdTenantDefaults.generate_graph,
+        json_output: bool = False,
+    ) -> None:
+        target = COLD_TENANT_STATES[state]
+        # Tenants this run may have deactivated or offloaded.
+        cooled: List[str] = []
+        try:
+            collection_obj, _ = await self._open_collection(
+                collection, consistency_level, None, pick_tenant=False
+            )
+            cfg = await collection_obj.config.get()
+            if not cfg.multi_tenancy_config.enabled:
+                raise Exception(f"Collection '{collection}' is not multi-tenant.")
+            if (
+                activation == "auto"
+                and not cfg.multi_tenancy_config.auto_tenant_activation
+            ):
+                raise Exception(
+                    f"Collection '{collection}' does not have auto tenant activation "
+                    "enabled; use --activation explicit or enable it with "
+                    "'update collection --auto_tenant_activation true'."
+                )
+            names = await self._sample_active_tenants(
+                collection_obj, tenants, tenant_suffix, sample, seed
+            )
+            click.echo(f"Counting the objects of {len(names)} tenants")
+            counts = {
+                name: await self._count(collection_obj.with_tenant(name))
+                for name in names
+            }
+            click.echo(f"Setting {len(names)} tenants to {target.value}")
+            cooled = names
+            await collection_obj.tenants.update(
+                [Tenant(name=name, activity_status=target) for name in names]
+            )
+            await self._wait_for_status(collection_obj, names, target, timeout)
+
+            click.echo(
+                f"Querying {len(names)} cold tenants, {concurrency} at a time "
+                f"({activation} activation)"
+            )
+            sem = asyncio.Semaphore(concurrency)
+
+            async def measure(name: str) -> dict:
+                async with sem:
+                    return await self._time_to_first_query(
+                        collection_obj, name, activation, timeout, poll_interval
+                    )
+
+            results = await asyncio.gather(*(measure(name) for name in names))
+        finally:
+            try:
+                if cooled:
+                    await self._restore_tenants(collection_obj, cooled)
+            finally:
+                await self.async_client.close()
+
+        for row in results:
+            row["objects"] = counts[row["tenant"]]
+        results.sort(key=lambda r: r["objects"])
+        summary = _cold_start_summary(results)
+        csv_path = (
+            _write_rows_csv(
+                "cold_tenants",
+                ["tenant", "objects", "seconds", "attempts", "error"],
+                results,
+            )
+            if output == "csv"
+            else None
+        )
+        if json_output:
+            click.echo(
+                json.dumps(
+                    {
+                        "status": "success",
+                        "collection": collection,
+                        "state": target.value,
+                        "activation": activation,
+                        "concurrency": concurrency,
+                        "summary": summary,
+                        "tenants": results,
+                    },
+                    indent=2,
+                )
+            )
+        else:
+            self._print_cold_start(results, summary, target.value, activation)
+        if generate_graph and csv_path:
+            try:
+                self._generate_cold_start_graph(results, csv_path, target.value)
+            except Exception as e:
+                click.echo(f"Failed to generate graph: {e}")
+
+    async def _sample_active_tenants(
+        self,
+        collection_obj: CollectionAsync,
+        tenants: Optional[str],
+        tenant_suffix: Optional[str],
+        sample: int,
+        seed: int,
+    ) -> List[str]:
+        """A seeded sample of the active tenants in the tenant set: a list,
+        the "<suffix>-<n>" tenants, or all of them."""
+        existing = await collection_obj.tenants.get()
+        if tenants and tenants != "all":
+            names = [t.strip() for t in tenants.split(",") if t.strip()]
+            missing = [t for t in names if t not in existing]
+            if missing:
+                raise Exception(
+                    f"Tenants not found in collection '{collection_obj.name}': {', '.join(missing[:10])}"
+                )
+        elif tenant_suffix:
+            names = [n for n in existing if n.startswith(f"{tenant_suffix}-")]
+        else:
+            names = list(existing)
+        active = sorted(
+            n
+            for n in names
+            if existing[n].activity_status
+            in (TenantActivityStatus.ACTIVE, TenantActivityStatus.HOT)
+        )
+        if not active:
+            raise Exception(
+                f"No active tenants to benchmark in collection '{collection_obj.name}'."
+            )
+        if len(active) <= sample:
+            return active
+        return random.Random(seed).sample(active, sample)
+
+    async def _restore_tenants(
+        self, collection_obj: CollectionAsync, names: List[str]
+    ) -> None:
+        """Set the tenants that are not active back to ACTIVE, reporting any
+        that could not be."""
+        cold = names
+        try:
+            current = await collection_obj.tenants.get_by_names(names)
+            cold = [
+                n
+                for n in names
+                if n not in current
+                or current[n].activity_status
+                not in (TenantActivityStatus.ACTIVE, TenantActivityStatus.HOT)
+            ]
+            if cold:
+                click.echo(f"Setting {len(cold)} tenants back to ACTIVE")
+                await collection_obj.tenants.update(
+                    [
+                        Tenant(name=n, activity_status=TenantActivityStatus.ACTIVE)
+                        for n in cold
+                    ]
+                )
+        except Exception as e:
+            click.echo(
+                f"Warning: could not set {len(cold)} tenants back to ACTIVE "
+                f"({', '.join(cold[:10])}): {e}"
+            )
+
+    async def _wait_for_status(
+        self,
+        collection_obj: CollectionAsync,
+        names: List[str],
+        status: TenantActivityStatus,
+        timeout: float,
+    ) -> None:
+        """Wait until every tenant reports `status` (offloading is async)."""
+        deadline = time.monotonic() + timeout
+        while True:
+            current = await collection_obj.tenants.get_by_names(names)
+            pending = [n for n in names if current[n].activity_status != status]
+            if not pending:
+                return
+            if time.monotonic() > deadline:
+                raise Exception(
+                    f"{len(pending)} tenants did not reach {status.value} within "
+                    f"{timeout:g}s, e.g. '{pending[0]}' is "
+                    f"{current[pending[0]].activity_status.value}."
+                )
+            await asyncio.sleep(COLD_TENANT_STATUS_POLL_S)
+
+    async def _time_to_first_query(
+        self,
+        collection_obj: CollectionAsync,
+        name: str,
+        activation: str,
+        timeout: float,
+        poll_interval: float,
+    ) -> dict:
+        """Seconds from the activation request (or the first query) until a
+        query on the tenant succeeds, and the queries it took."""
+        tenant_obj = collection_obj.with_tenant(name)
+        started = time.perf_counter()
+        attempts = 0
+        error = None
+        try:
+            if activation == "explicit":
+                await collection_obj.tenants.update(
+                    Tenant(name=name, activity_status=TenantActivityStatus.ACTIVE)
+                )
+            while time.perf_counter() - started < timeout:
+                attempts += 1
+                try:
+                    await tenant_obj.query.fetch_objects(limit=1)
+                    return {
+                        "tenant": name,
+                        "seconds": round(time.perf_counter() - started, 3),
+                        "attempts": attempts,
+                        "error": None,
+                    }
+                except Exception as e:
+                    error = str(e)
+                await asyncio.sleep(poll_interval)
+        except Exception as e:
+            error = str(e)
+        return {
+            "tenant": name,
+            "seconds": None,
+            "attempts": attempts,
+            "error": error or f"not queryable within {timeout:g}s",
+        }
+
+    def _print_cold_start(
+        self, results: List[dict], summary: dict, state: str, activation: str
+    ) -> None:
+        click.echo(
+            f"\nTime to first successful query ({state}, {activation} activation):"
+        )
+        header = f"{'Tenant':<24}{'Objects':>12}{'Seconds':>10}{'Attempts':>10}"
+        click.echo(header)
+        click.echo("-" * len(header))
+        for r in results:
+            seconds = "failed" if r["seconds"] is None else f"{r['seconds']:.3f}"
+            click.echo(
+                f"{r['tenant']:<24}{r['objects']:>12}{seconds:>10}{r['attempts']:>10}"
+            )
+        click.echo("")
+        if not summary["succeeded"]:
+            click.echo("No tenant became queryable.")
+            return
+        click.echo(
+            f"{summary['succeeded']} of {summary['tenants']} tenants became queryable: "
+            f"P50/P90/P99/max {summary['p50']:.3f}/{summary['p90']:.3f}/"
+            f"{summary['p99']:.3f}/{summary['max']:.3f} s"
+        )
+        for bucket in summary["by_objects"]:
+            click.echo(
+                f"  {bucket['objects']:>20} objects: {bucket['tenants']:>4} tenants, "
+                f"P50/max {bucket['p50']:.3f}/{bucket['max']:.3f} s"
+            )
+        if summary["seconds_per_million_objects"] is not None:
+            click.echo(
+                f"Linear fit: {summary['intercept_s']:.3f} s + "
+                f"{summary['seconds_per_million_objects']:.3f} s per million objects"
+            )
+
+    def _generate_cold_start_graph(
+        self, results: List[dict], csv_path: str, state: str
+    ) -> str:
+        """Time to first query against object count, one point per tenant."""
+        try:
+            import matplotlib
+
+            matplotlib.use("Agg")
+            import matplotlib.pyplot as plt
+        except Exception as imp_err:
+            raise RuntimeError(
+                "matplotlib is required for --generate-graph. Install it and retry."
+            ) from imp_err
+
+        ok = [r for r in results if r["seconds"] is not None]
+        if not ok:
+            raise RuntimeError("No tenant became queryable.")
+        fig, ax = plt.subplots(figsize=(10, 6))
+        ax.scatter([r["objects"] for r in ok], [r["seconds"] for r in ok])
+        ax.set_xscale("symlog")
+        ax.set_xlabel("Objects in tenant")
+        ax.set_ylabel("Time to first successful query (s)")
+        ax.set_title(f"Cold tenant activation ({state})")
+        ax.grid(True, alpha=0.3)
+        fig.tight_layout()
+        png_path = str(_Path(csv_path).with_suffix(".png"))
+        fig.savefig(png_path, dpi=150)
+        plt.close(fig)
+        click.echo(f"Saved cold tenant graph to {png_path}")
+        return png_path
+
+
+def _load_sweep_matrix(path: str) -> List[Tuple[str, dict]]:
+    """
+    Cells of a JSON sweep matrix, as (label, create_collection settings).
+
+    The file has optional "base" settings shared by every cell and either a
+    "matrix" of setting -> list of values (every combination is a cell) or a
+    list of "cells", e.g.
+    {"base": {"replication_factor": 1},
+     "matrix": {"vector_index": ["hnsw", "hnsw_pq"], "rescore_limit": [100, 400]}}
+    """
+    with open(path) as f:
+        spec = json.load(f)
+    base = spec.get("base", {})
+    if "cells" in spec:
+        variants = spec["cells"]
+    elif "matrix" in spec:
+        keys = list(spec["matrix"])
+        variants = [
+            dict(zip(keys, values))
+            for values in itertools.product(*(spec["matrix"][k] for k in keys))
+        ]
+    else:
+        raise Exception(f"Sweep matrix '{path}' needs a 'matrix' or 'cells' entry.")
+    allowed = set(inspect.signature(CollectionManager.create_collection).parameters)
+    allowed -= {"self", "collection", "json_output"}
+    cells = []
+    for variant in variants:
+        settings = {**base, **variant}
+        unknown = sorted(set(settings) - allowed)
+        if unknown:
+            raise Exception(
+                f"Unknown collection settings in '{path}': {', '.join(unknown)}"
+            )
+        label = ",".join(f"{k}={v}" for k, v in variant.items()) or "base"
+        cells.append((label, settings))
+    if not cells:
+        raise Exception(f"Sweep matrix '{path}' has no cells.")
+    return cells
+
+
+def _search_param_steps(**values: Tuple[int, ...]) -> List[dict]:
+    """Every combination of the given search parameter values; the default ef
+    steps when none are given."""
+    values = {k: v for k, v in values.items() if v} or {
+        "ef": BenchmarkEfSweepDefaults.default_ef_steps
+    }
+    return [
+        dict(zip(values, combination))
+        for combination in itertools.product(*values.values())
+    ]
+
+
+def _format_params(params: dict) -> str:
+    return ",".join(f"{k}={v}" for k, v in params.items())
+
+
+def _best_operating_point(
+    results: List[dict], target_recall: Optional[float]
+) -> Optional[dict]:
+    """Lowest-p99 step reaching `target_recall`, or the highest-recall step."""
+    if target_recall is None:
+        return max(results, key=lambda r: (r["recall_mean"], -r["p99_ms"]))
+    passing = [r for r in results if r["recall_mean"] >= target_recall]
+    return min(passing, key=lambda r: r["p99_ms"]) if passing else None
+
+
+def _interval_row(prefix: str, stats: PhaseHistograms) -> dict:
+    """Operations, errors and p50/p99 latency (ms) of one timeline interval."""
+    p50, p99 = (
+        (v / 1000.0 for v in stats.latency.percentiles([50, 99]))
+        if stats.latency.total
+        else (0.0, 0.0)
+    )
+    return {
+        f"{prefix}_ops": stats.latency.total,
+        f"{prefix}_errors": stats.errors,
+        f"{prefix}_p50_ms": round(p50, 3),
+        f"{prefix}_p99_ms": round(p99, 3),
+    }
+
+
+def _cold_start_summary(results: List[dict]) -> dict:
+    """Distribution of the times to first query, overall and per power of ten
+    of the object count, with a linear fit against the object count."""
+    ok = [r for r in results if r["seconds"] is not None]
+    summary: Dict[str, Any] = {"tenants": len(results), "succeeded": len(ok)}
+    if not ok:
+        return summary
+    seconds = np.array([r["seconds"] for r in ok])
+    objects = np.array([r["objects"] for r in ok], dtype=float)
+    for q in (50, 90, 99):
+        summary[f"p{q}"] = round(float(np.percentile(seconds, q)), 3)
+    summary["max"] = round(float(seconds.max()), 3)
+    buckets = []
+    for exponent in sorted({len(str(int(n))) - 1 if n else -1 for n in objects}):
+        low, high = (0, 0) if exponent < 0 else (10**exponent, 10 ** (exponent + 1) - 1)
+        times = seconds[(objects >= low) & (objects <= high)]
+        buckets.append(
+            {
+                "objects": f"{low}-{high}",
+                "tenants": len(times),
+                "p50": round(float(np.percentile(times, 50)), 3),
+                "max": round(float(times.max()), 3),
+            }
+        )
+    summary["by_objects"] = buckets
+    summary["seconds_per_million_objects"] = None
+    if len(set(objects)) > 1:
+        slope, intercept = np.polyfit(objects, seconds, 1)
+        summary["seconds_per_million_objects"] = round(float(slope) * 1e6, 3)
+        summary["intercept_s"] = round(float(intercept), 3)
+    return summary
+
+
+def _write_rows_csv(prefix: str, columns: List[str], rows: List[dict]) -> str:
+    filename = f"{prefix}_{time.strftime('%Y%m%d_%H%M%S')}.csv"
+    with open(filename, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, restval="")
+        writer.writeheader()
+        writer.writerows(rows)
+    click.echo(f"Saved results to {filename}")
+    return filename
+
+
+def _read_heap_bytes(metrics_url: str) -> float:
+    """Go heap in use, from a Weaviate Prometheus metrics endpoint."""
+    with urllib.request.urlopen(metrics_url, timeout=10) as response:
+        for line in response.read().decode().splitlines():
+            if line.startswith("go_memstats_heap_inuse_bytes "):
+                return float(line.split()[1])
+    raise Exception(f"No go_memstats_heap_inuse_bytes in '{metrics_url}'.")
+
+
+def _read_ids(path: str) -> List[str]:
+    """Object uuids, one per line, or the "uuid" of every row of a JSONL
+    file (e.g. from `export data`)."""
+    with open(path) as f:
+        if path.endswith(".jsonl"):
+            return [json.loads(line)["uuid"] for line in f if line.strip()]
+        return [line.strip() for line in f if line.strip()]
+
+
+def _concurrency_levels(max_concurrency: int) -> List[int]:
+    """1, 2, 4 ... up to and including `max_concurrency`."""
+    levels = []
+    level = 1
+    while level < max_concurrency:
+        levels.append(level)
+        level *= 2
+    levels.append(max_concurrency)
+    return levels
+
+
+def _latency_summary(stats: PhaseHistograms, **fields) -> dict:
+    """Latency percentiles of a run in ms, plus the given fields."""
+    summary = dict(fields)
+    summary["queries"] = stats.latency.total
+    summary["errors"] = stats.errors
+    values = stats.latency.percentiles([50, 90, 99]) if stats.latency.total else []
+    for name, v in zip(("p50", "p90", "p99"), values or [0.0] * 3):
+        summary[name] = round(v / 1000.0, 3)
+    # With no successful query there is no min, max or mean to report.
+    recorded = stats.latency.total
+    summary["min"] = round(stats.latency.min / 1000.0, 3) if recorded else 0.0
+    summary["max"] = round(stats.latency.max / 1000.0, 3) if recorded else 0.0
+    summary["mean"] = round(stats.latency.mean() / 1000.0, 3) if recorded else 0.0
+    return summary
+
+
+def _print_summary_table(
+    label: str, key: str, results: List[dict], throughput: bool = False
+) -> None:
+    columns = ["queries", "errors"] + (["throughput"] if throughput else [])
+    columns += ["min", "p50", "p90", "p99", "max", "mean"]
+    header = f"{label:<14}" + "".join(f"{c:>12}" for c in columns)
+    click.echo(header)
+    click.echo("-" * len(header))
+    for row in results:
+        cells = "".join(
+            f"{row[c]:>12}" if isinstance(row[c], int) else f"{row[c]:>12.2f}"
+            for c in columns
+        )
+        click.echo(f"{str(row[key]):<14}{cells}")
+
+
+class _LoadGeneratorPool:
+    """
+    Long-lived `benchmark qps --processes` workers.
+
+    Each process owns an async client and runs the phases it receives on its
+    command queue with `_run_phase`, streaming interval and final histograms
+    back on the shared results queue.
+    """
+
+    def __init__(
+        self,
+        processes: int,
+        client_factory: Callable[[], Any],
+        collection: str,
+        consistency_level: Any,
+        tenant: Optional[str],
+    ) -> None:
+        # spawn: forking a process with a running event loop and gRPC
+        # channels is not safe.
+        ctx = multiprocessing.get_context("spawn")
+        self.results = ctx.Queue()
+        self.stop = ctx.Event()
+        self.commands = [ctx.Queue() for _ in range(processes)]
+        self.processes = [
+            ctx.Process(
+                target=_load_generator_process,
+                args=(
+                    index,
+                    client_factory,
+                    collection,
+                    consistency_level,
+                    tenant,
+                    self.commands[index],
+                    self.results,
+                    self.stop,
+                ),
+                daemon=True,
+            )
+            for index in range(processes)
+        ]
+
+    def start(self) -> None:
+        for proc in self.processes:
+            proc.start()
+        deadline = time.monotonic() + LOAD_GENERATOR_START_TIMEOUT_S
+        ready = 0
+        while ready < len(self.processes):
+            try:
+                msg = self.results.get(timeout=max(0.1, deadline - time.monotonic()))
+            except Empty:
+                raise Exception(
+                    f"Load generator processes did not start within {LOAD_GENERATOR_START_TIMEOUT_S:.0f}s"
+                )
+            if msg[0] == "failed":
+                raise Exception(
+                    f"Load generator process {msg[1]} failed to start: {msg[2]}"
+                )
+            ready += 1
+
+    def close(self) -> None:
+        for commands in self.commands:
+            commands.put(None)
+        for proc in self.processes:
+            proc.join(timeout=10)
+            if proc.is_alive():
+                proc.terminate()
+
+
+def _load_generator_process(
+    index: int,
+    client_factory: Callable[[], Any],
+    collection: str,
+    consistency_level: Any,
+    tenant: Optional[str],
+    commands: Any,
+    results: Any,
+    stop: Any,
+) -> None:
+    asyncio.run(
+        _load_generator_main(
+            index,
+            client_factory,
+            collection,
+            consistency_level,
+            tenant,
+            commands,
+            results,
+            stop,
+        )
+    )
+
+
+async def _load_generator_main(
+    index: int,
+    client_factory: Callable[[], Any],
+    collection: str,
+    consistency_level: Any,
+    tenant: Optional[str],
+    commands: Any,
+    results: Any,
+    stop: Any,
+) -> None:
+    try:
+        client = client_factory()
+        await client.connect()
+    except Exception as e:
+        results.put(("failed", index, str(e)))
+        return
+    try:
+        manager = BenchmarkQPSManager(client)
+        # Each process draws its own arrival sequence.
+        manager.arrival_stream = index
+        collection_obj = client.collections.get(collection).with_consistency_level(
+            consistency_level
+        )
+        if tenant:
+            collection_obj = collection_obj.with_tenant(tenant)
+        results.put(("ready", index))
+        loop = asyncio.get_running_loop()
+        while True:
+            cmd = await loop.run_in_executor(None, commands.get)
+            if cmd is None:
+                break
+            if cmd["qps"] <= 0:
+                results.put(
+                    (
+                        "done",
+                        index,
+                        PhaseHistograms().to_dict(),
+                        False,
+                        None,
+                        ArrivalSchedule().to_dict(),
+                    )
+                )
+                continue
+            manager.arrival = cmd["arrival"]
+            manager.filter_cases = cmd["filter_cases"]
+            manager.tenant_workload = cmd["tenant_workload"]
+            manager.query_corpus = cmd["query_corpus"]
+            manager.slowest_terms = cmd["slowest_terms"]
+            try:
+                stats, exceeded = await manager._run_phase(
+                    collection_obj,
+                    cmd["query_terms"],
+                    cmd["limit"],
+                    cmd["qps"],
+                    cmd["duration"],
+                    cmd["phase_name"],
+                    cmd["show_certainty"],
+                    None,
+                    cmd["query_type"],
+                    cmd["latency_threshold"],
+                    concurrency=cmd["concurrency"],
+                    fail_on_timeout=cmd["fail_on_timeout"],
+                    return_mode=cmd["return_mode"],
+                    report=False,
+                    on_interval=lambda interval: results.put(
+                        ("interval", index, interval.to_dict())
+                    ),
+                    should_stop=stop.is_set,
+                )
+                results.put(
+                    (
+                        "done",
+                        index,
+                        stats.to_dict(),
+                        exceeded,
+                        None,
+                        manager.last_schedule.to_dict(),
+                    )
+                )
+            except Exception as e:
+                results.put(
+                    (
+                        "done",
+                        index,
+                        PhaseHistograms().to_dict(),
+                        False,
+                        str(e),
+                        ArrivalSchedule().to_dict(),
+                    )
+                )
+    finally:
+        await client.close()
@@ -3,7 +3,13 @@ import json
 from typing import Dict, List, Optional
 from weaviate.client import WeaviateClient
 from weaviate.collections import Collection
-from weaviate.collections.classes.config import _CollectionConfigSimple
+from weaviate.collections.classes.config import (
+    _BQConfig,
+    _CollectionConfig,
+    _CollectionConfigSimple,
+    _RQConfig,
+    _SQConfig,
+)
 from weaviate.collections.classes.tenants import TenantActivityStatus
 from weaviate.collections.classes.config_vector_index import VectorFilterStrategy
 from weaviate_cli.defaults import (
@@ -634,8 +640,25 @@ class CollectionManager:
         object_ttl_property_name: Optional[
             str
         ] = UpdateCollectionDefaults.object_ttl_property_name,
+        ef: Optional[int] = UpdateCollectionDefaults.ef,
+        dynamic_ef_min: Optional[int] = UpdateCollectionDefaults.dynamic_ef_min,
+        dynamic_ef_max: Optional[int] = UpdateCollectionDefaults.dynamic_ef_max,
+        dynamic_ef_factor: Optional[int] = UpdateCollectionDefaults.dynamic_ef_factor,
+        rescore_limit: Optional[int] = UpdateCollectionDefaults.rescore_limit,
+        target_vector: Optional[str] = UpdateCollectionDefaults.target_vector,
     ) -> None:
 
+        search_params = {
+            "ef": ef,
+            "dynamic_ef_min": dynamic_ef_min,
+            "dynamic_ef_max": dynamic_ef_max,
+            "dynamic_ef_factor": dynamic_ef_factor,
+        }
+        search_params = {k: v for k, v in search_params.items() if v is not None}
+        if vector_index and (search_params or rescore_limit is not None):
+            raise Exception(
+                "ef, dynamic ef and rescore_limit can't be combined with vector_index."
+            )
         if (
             object_ttl_type not in ("property", "disable")
             and object_ttl_property_name
@@ -693,6 +716,13 @@ class CollectionManager:
         }
 
         col_obj: Collection = self.client.collections.get(collection)
+        index_update = (
+            self.__search_params_update(
+                col_obj.config.get(), search_params, rescore_limit, target_vector
+            )
+            if search_params or rescore_limit is not None
+            else {}
+        )
         rf = (
             replication_factor
             if replication_factor is not None
@@ -744,6 +774,7 @@ class CollectionManager:
                 if object_ttl_time is not None or object_ttl_type == "disable"
                 else None
             ),
+            **index_update,
         )
 
         assert self.client.collections.exists(collection)
@@ -761,6 +792,64 @@ class CollectionManager:
         else:
             click.echo(f"Collection '{collection}' modified successfully in Weaviate.")
 
+    def __search_params_update(
+        self,
+        config: _CollectionConfig,
+        search_params: Dict[str, int],
+        rescore_limit: Optional[int],
+        target_vector: Optional[str] = None,
+    ) -> Dict[str, object]:
+        """config.update arguments that change the HNSW search parameters (and
+        the rescore limit of the index's quantizer) of `target_vector`, or of
+        every vector index."""
+        quantizers = {
+            _BQConfig: wvc.Reconfigure.VectorIndex.Quantizer.bq,
+            _SQConfig: wvc.Reconfigure.VectorIndex.Quantizer.sq,
+            _RQConfig: wvc.Reconfigure.VectorIndex.Quantizer.rq,
+        }
+
+        def hnsw_update(name: str, index_config):
+            if index_config.vector_index_type() != "hnsw":
+                raise Exception(
+                    f"Vector index '{name}' is not HNSW; ef, dynamic ef and rescore_limit apply to HNSW indexes only."
+                )
+            quantizer = None
+            if rescore_limit is not None:
+                reconfigure = quantizers.get(type(index_config.quantizer))
+                if reconfigure is None:
+                    raise Exception(
+                        f"Vector index '{name}' has no BQ, SQ or RQ quantizer to set rescore_limit on."
+                    )
+                quantizer = reconfigure(rescore_limit=rescore_limit)
+            return wvc.Reconfigure.VectorIndex.hnsw(
+                quantizer=quantizer, **search_params
+            )
+
+        if config.vector_config:
+            if target_vector is not None and target_vector not in config.vector_config:
+                raise Exception(
+                    f"Named vector '{target_vector}' not found. Available: {', '.join(config.vector_config)}."
+                )
+            return {
+                "vector_config": [
+                    wvc.Reconfigure.Vectors.update(
+                        name=name,
+                        vector_index_config=hnsw_update(
+                            name, vector.vector_index_config
+                        ),
+                    )
+                    for name, vector in config.vector_config.items()
+                    if target_vector is None or name == target_vector
+                ]
+            }
+        if target_vector is not None:
+            raise Exception(
+                f"Collection has no named vectors; --target_vector '{target_vector}' doesn't apply."
+            )
+        return {
+            "vector_index_config": hnsw_update("default", config.vector_index_config)
+        }
+
     def delete_collection(
         self,
         collection: str = DeleteCollectionDefaults.collection,
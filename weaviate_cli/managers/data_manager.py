@@ -1,20 +1,24 @@
+import asyncio
 import base64
 import importlib.resources as resources
 import json
 import math
 import random
+import struct
 import threading
 import time
 from collections import deque
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from typing import Dict, List, Optional, Union, Any, Tuple
 
 import click
 import numpy as np
 import weaviate.classes.config as wvc
 from faker import Faker
-from weaviate import WeaviateClient
+from weaviate import WeaviateAsyncClient, WeaviateClient
 from weaviate.classes.query import Filter
 from weaviate.classes.query import MetadataQuery
 from weaviate.collections import Collection
@@ -22,6 +26,7 @@ from weaviate.collections.classes.tenants import TenantActivityStatus
 
 from weaviate_cli.defaults import (
     MAX_OBJECTS_PER_BATCH,
+    MAX_OBJECTS_PER_WORK_UNIT,
     QUERY_MAXIMUM_RESULTS,
     MAX_WORKERS,
     CreateDataDefaults,
@@ -29,6 +34,7 @@ from weaviate_cli.defaults import (
     QueryDataDefaults,
     UpdateDataDefaults,
     DeleteDataDefaults,
+    ExportDataDefaults,
 )
 from weaviate_cli.utils import pp_objects
 
@@ -63,6 +69,190 @@ class _ErrorTracker:
                 self.examples.append((getattr(fo, "original_uuid", None), msg))
 
 
+class _WorkScheduler:
+    """
+    Runs independent write units (a slice of UUIDs from one tenant) on a fixed
+    pool of worker threads. All units go through one shared queue, so an idle
+    worker always picks up the next pending unit regardless of which tenant
+    produced it, and a few large tenants cannot leave the rest of the pool idle.
+
+    Every request, whether a planner's page fetch or a worker's write, must be
+    issued inside `request()`, which enforces a single in-flight budget across
+    all tenants. Planners block in `submit()` once too many units are pending.
+    """
+
+    def __init__(self, max_in_flight: int, max_pending: Optional[int] = None) -> None:
+        self.max_in_flight: int = max(1, max_in_flight)
+        self._budget = threading.BoundedSemaphore(self.max_in_flight)
+        self._pending = threading.BoundedSemaphore(
+            max_pending or self.max_in_flight * 2
+        )
+        self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+
+    def __enter__(self) -> "_WorkScheduler":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._executor.shutdown(wait=True)
+
+    @contextmanager
+    def request(self):
+        with self._budget:
+            yield
+
+    def split(self, items: List) -> List[List]:
+        """Split a page into units small enough to spread over every worker."""
+        if not items:
+            return []
+        size = min(
+            MAX_OBJECTS_PER_WORK_UNIT,
+            max(1, math.ceil(len(items) / self.max_in_flight)),
+        )
+        return [items[i : i + size] for i in range(0, len(items), size)]
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        self._pending.acquire()
+
+        def _run():
+            try:
+                with self._budget:
+                    return fn(*args, **kwargs)
+            finally:
+                self._pending.release()
+
+        try:
+            return self._executor.submit(_run)
+        except Exception:
+            self._pending.release()
+            raise
+
+
+class _NpyStreamWriter:
+    """
+    Appends float32 rows to an .npy file without keeping them in memory.
+    The header is written with a fixed width up front and rewritten with the
+    final row count on close, so the result loads with plain `np.load`.
+    """
+
+    HEADER_SIZE = 128
+
+    def __init__(self, path: str, dim: int) -> None:
+        self.path = path
+        self.dim = dim
+        self.rows = 0
+        self._f = open(path, "wb")
+        self._write_header()
+
+    def _write_header(self) -> None:
+        magic = np.lib.format.magic(1, 0)
+        header = "{'descr': '<f4', 'fortran_order': False, 'shape': (%d, %d), }" % (
+            self.rows,
+            self.dim,
+        )
+        header = header.ljust(self.HEADER_SIZE - len(magic) - 2 - 1) + "\n"
+        self._f.seek(0)
+        self._f.write(magic + struct.pack("<H", len(header)) + header.encode("latin1"))
+
+    def append(self, block: np.ndarray) -> None:
+        self._f.seek(0, 2)
+        self._f.write(np.ascontiguousarray(block, dtype="<f4").tobytes())
+        self.rows += block.shape[0]
+
+    def append_missing(self, count: int, chunk: int = 10000) -> None:
+        """Append `count` all-NaN rows (objects without this vector)."""
+        while count > 0:
+            n = min(chunk, count)
+            self.append(np.full((n, self.dim), np.nan, dtype=np.float32))
+            count -= n
+
+    def close(self) -> None:
+        self._write_header()
+        self._f.close()
+
+
+class _JsonlRowWriter:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._f = open(path, "w")
+
+    def write(self, rows: List[Dict]) -> None:
+        self._f.write("".join(json.dumps(row, default=str) + "\n" for row in rows))
+
+    def close(self) -> None:
+        self._f.close()
+
+
+class _ParquetRowWriter:
+    """
+    Writes each page as one Parquet row group. The schema is built up front from
+    the collection's properties, so a column that is null on the first pages or
+    only shows up later keeps its type. Nested objects are stored as JSON
+    strings; geo coordinates, phone numbers and blobs as strings.
+    """
+
+    def __init__(self, path: str, properties: List[Any], tenant: bool = False) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except Exception as imp_err:
+            raise RuntimeError(
+                "pyarrow is required for --format parquet. Install it and retry."
+            ) from imp_err
+        self._pa = pa
+        self._pq = pq
+        self.path = path
+        scalar = {
+            "text": pa.string(),
+            "uuid": pa.string(),
+            "int": pa.int64(),
+            "number": pa.float64(),
+            "boolean": pa.bool_(),
+            "date": pa.timestamp("us", tz="UTC"),
+        }
+        fields = [pa.field("uuid", pa.string())]
+        if tenant:
+            fields.append(pa.field("tenant", pa.string()))
+        self._json_columns = set()
+        for prop in properties:
+            data_type = prop.data_type.value
+            base = data_type[:-2] if data_type.endswith("[]") else data_type
+            if base == "object":
+                self._json_columns.add(prop.name)
+            arrow_type = scalar.get(base, pa.string())
+            if data_type.endswith("[]") and base != "object":
+                arrow_type = pa.list_(arrow_type)
+            fields.append(pa.field(prop.name, arrow_type))
+        self._schema = pa.schema(fields)
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    @classmethod
+    def _plain(cls, value: Any) -> Any:
+        if value is None or isinstance(value, (str, int, float, bool, datetime)):
+            return value
+        if isinstance(value, list):
+            return [cls._plain(v) for v in value]
+        return str(value)
+
+    def _cell(self, name: str, value: Any) -> Any:
+        if name in self._json_columns and value is not None:
+            return json.dumps(value, default=str)
+        return self._plain(value)
+
+    def write(self, rows: List[Dict]) -> None:
+        unknown = {k for row in rows for k in row} - set(self._schema.names)
+        if unknown:
+            raise Exception(
+                f"Properties not in the collection schema: {', '.join(sorted(unknown))}. "
+                "They were added during the export; run it again."
+            )
+        rows = [{k: self._cell(k, v) for k, v in row.items()} for row in rows]
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
 # Constants for data generation optimization
 
 MOVIE_GENRES = [
@@ -242,8 +432,13 @@ def _streaming_generate_chunk(args) -> List[Dict]:
 
 
 class DataManager:
-    def __init__(self, client: WeaviateClient):
+    def __init__(
+        self,
+        client: WeaviateClient,
+        async_client: Optional[WeaviateAsyncClient] = None,
+    ):
         self.client = client
+        self.async_client = async_client
         self.fake = Faker()
         # Seed the Faker instance for reproducibility
         Faker.seed(42)
@@ -1000,15 +1195,35 @@ class DataManager:
         skip_seed: bool,
         verbose: bool = False,
         json_output: bool = False,
+        scheduler: Optional[_WorkScheduler] = None,
     ) -> int:
-        """Update objects in the collection, either with random data or incremental changes."""
+        """Update objects in the collection, either with random data or incremental changes.
+
+        Pages are fetched here one after another and split into work units that the
+        shared scheduler writes concurrently, so a single tenant still uses the whole
+        in-flight budget.
+        """
+
+        if scheduler is None:
+            with _WorkScheduler(1) as own_scheduler:
+                return self.__update_data(
+                    collection,
+                    num_objects,
+                    cl,
+                    randomize,
+                    skip_seed,
+                    verbose,
+                    json_output=json_output,
+                    scheduler=own_scheduler,
+                )
 
         if not skip_seed:
             random.seed(42)
+        vector_rng = np.random.default_rng(None if skip_seed else 42)
 
         start_time = time.time()
         cl_collection = collection.with_consistency_level(cl)
-        total_updated = 0
+        scheduled = 0
 
         collection_size = len(collection)
         if verbose:
@@ -1039,9 +1254,10 @@ class DataManager:
         iterations = math.ceil(num_objects / MAX_OBJECTS_PER_BATCH)
 
         vector_dimensions = 1536
-        object_with_vector = collection.query.fetch_objects(
-            limit=1, include_vector=True
-        )
+        with scheduler.request():
+            object_with_vector = collection.query.fetch_objects(
+                limit=1, include_vector=True
+            )
         if len(object_with_vector.objects) > 0:
             vec = object_with_vector.objects[0].vector
             if isinstance(vec, dict):
@@ -1055,36 +1271,63 @@ class DataManager:
             elif vec is not None:
                 vector_dimensions = len(vec)
 
+        def _update_unit(
+            unit: List[Tuple[Any, Optional[Dict], Optional[List[float]]]],
+        ) -> int:
+            for obj, updated_props, vector in unit:
+                if updated_props is not None:
+                    cl_collection.data.replace(
+                        uuid=obj.uuid,
+                        properties=updated_props,
+                        vector=vector,
+                    )
+                    continue
+                for property, value in obj.properties.items():
+                    if isinstance(value, str):
+                        obj.properties[property] = "updated-" + value
+                    elif isinstance(value, int):
+                        obj.properties[property] += 1
+                    elif isinstance(value, float):
+                        obj.properties[property] += 1.0
+                    elif isinstance(value, datetime):
+                        obj.properties[property] = value + timedelta(days=1)
+                    elif isinstance(value, bytes):
+                        obj.properties[property] = value << 1
+
+                cl_collection.data.update(
+                    uuid=obj.uuid,
+                    properties=obj.properties,
+                )
+            return len(unit)
+
+        futures: List[Future] = []
         for i in range(iterations):
-            batch_size = min(MAX_OBJECTS_PER_BATCH, num_objects - total_updated)
+            batch_size = min(MAX_OBJECTS_PER_BATCH, num_objects - scheduled)
             if batch_size <= 0:
                 break
 
             if use_random_offsets:
                 offset = random_offset + (i * MAX_OBJECTS_PER_BATCH)
-                if verbose:
-                    print(
-                        f"Fetching batch {i + 1}/{iterations} ({batch_size} objects, offset: {offset})"
-                    )
             else:
                 offset = i * batch_size
-                if verbose:
-                    print(
-                        f"Fetching batch {i + 1}/{iterations} ({batch_size} objects, offset: {offset})"
-                    )
+            if verbose:
+                print(
+                    f"Fetching batch {i + 1}/{iterations} ({batch_size} objects, offset: {offset})"
+                )
 
-            res = collection.query.fetch_objects(limit=batch_size, offset=offset)
+            with scheduler.request():
+                res = collection.query.fetch_objects(limit=batch_size, offset=offset)
             data_objects = res.objects
 
             if not data_objects:
-                if total_updated == 0:
+                if scheduled == 0:
                     print(
                         f"No objects found in class '{collection.name}'. Insert objects first using <create data> command"
                     )
                     return -1
                 else:
                     print(
-                        f"No more objects found in class '{collection.name}' after updating {total_updated} objects."
+                        f"No more objects found in class '{collection.name}' after scheduling {scheduled} objects."
                     )
                     break
 
@@ -1093,67 +1336,41 @@ class DataManager:
             if randomize:
                 if i == 0 and verbose:
                     print(f"Updating objects with random data...")
-
-                random_objects = [
-                    self.__generate_single_object(is_update=True)
-                    for _ in range(batch_count)
-                ]
-
-                for j, (obj, updated_props) in enumerate(
-                    zip(data_objects, random_objects)
-                ):
-                    random_vector = np.random.rand(vector_dimensions).tolist()
-
-                    cl_collection.data.replace(
-                        uuid=obj.uuid,
-                        properties=updated_props,
-                        vector=random_vector,
+                # Properties and vectors are generated here rather than in the
+                # workers, so a seeded run assigns the same values to the same
+                # objects however the units are interleaved. Release dates
+                # count back from now, so they only repeat within one second.
+                pairs = [
+                    (
+                        obj,
+                        self.__generate_single_object(is_update=True),
+                        vector_rng.random(vector_dimensions).tolist(),
                     )
-                    total_updated += 1
-
-                    if verbose and (j + 1) % max(1, batch_count // 5) == 0:
-                        batch_progress = (j + 1) / batch_count * 100
-                        total_progress = total_updated / num_objects * 100
-                        elapsed = time.time() - start_time
-                        rate = total_updated / elapsed if elapsed > 0 else 0
-                        print(
-                            f"Batch progress: {batch_progress:.1f}%, Overall: {total_progress:.1f}% ({total_updated}/{num_objects}), speed: {rate:.1f} objects/second"
-                        )
+                    for obj in data_objects
+                ]
             else:
                 if i == 0 and verbose:
                     print(f"Updating objects with incremental changes...")
+                pairs = [(obj, None, None) for obj in data_objects]
 
-                for j, obj in enumerate(data_objects):
-                    for property, value in obj.properties.items():
-                        if isinstance(value, str):
-                            obj.properties[property] = "updated-" + value
-                        elif isinstance(value, int):
-                            obj.properties[property] += 1
-                        elif isinstance(value, float):
-                            obj.properties[property] += 1.0
-                        elif isinstance(value, datetime):
-                            obj.properties[property] = value + timedelta(days=1)
-                        elif isinstance(value, bytes):
-                            obj.properties[property] = value << 1
-
-                    cl_collection.data.update(
-                        uuid=obj.uuid,
-                        properties=obj.properties,
-                    )
-                    total_updated += 1
-
-                    if verbose and (j + 1) % max(1, batch_count // 5) == 0:
-                        batch_progress = (j + 1) / batch_count * 100
-                        total_progress = total_updated / num_objects * 100
-                        elapsed = time.time() - start_time
-                        rate = total_updated / elapsed if elapsed > 0 else 0
-                        print(
-                            f"Batch progress: {batch_progress:.1f}%, Overall: {total_progress:.1f}% ({total_updated}/{num_objects}), speed: {rate:.1f} objects/second"
-                        )
+            for unit in scheduler.split(pairs):
+                futures.append(scheduler.submit(_update_unit, unit))
+            scheduled += batch_count
 
             if not use_random_offsets and batch_count < batch_size:
                 break
 
+        total_updated = 0
+        for done, future in enumerate(as_completed(futures), start=1):
+            total_updated += future.result()
+            if verbose and done % max(1, len(futures) // 5) == 0:
+                total_progress = total_updated / max(1, num_objects) * 100
+                elapsed = time.time() - start_time
+                rate = total_updated / elapsed if elapsed > 0 else 0
+                print(
+                    f"Overall: {total_progress:.1f}% ({total_updated}/{num_objects}), speed: {rate:.1f} objects/second"
+                )
+
         if total_updated < num_objects and not json_output:
             print(
                 f"Warning: Only found {total_updated} objects to update, less than the requested {num_objects}"
@@ -1212,7 +1429,7 @@ class DataManager:
             click.echo(f"Preparing to update {limit} objects into class '{col.name}'")
         total_updated = 0
 
-        def _update_one_tenant(tenant: str) -> int:
+        def _update_one_tenant(tenant: str, scheduler: _WorkScheduler) -> int:
             if tenant == "None":
                 return self.__update_data(
                     col,
@@ -1222,6 +1439,7 @@ class DataManager:
                     skip_seed,
                     verbose,
                     json_output=json_output,
+                    scheduler=scheduler,
                 )
             if not json_output and parallel_workers <= 1:
                 click.echo(f"Processing tenant '{tenant}'")
@@ -1233,47 +1451,52 @@ class DataManager:
                 skip_seed,
                 verbose,
                 json_output=json_output,
+                scheduler=scheduler,
             )
 
-        if len(tenants) > 1 and parallel_workers > 1:
-            actual_workers = min(parallel_workers, len(tenants))
-            _lock = threading.Lock()
-            _errors: List[str] = []
-            with ThreadPoolExecutor(max_workers=actual_workers) as executor:
-                future_to_tenant = {
-                    executor.submit(_update_one_tenant, t): t for t in tenants
-                }
-                for future in as_completed(future_to_tenant):
-                    t = future_to_tenant[future]
-                    try:
-                        ret = future.result()
-                        if ret == -1:
-                            _errors.append(
-                                f"Failed to update objects in class '{col.name}' for tenant '{t}'"
-                            )
-                        else:
-                            with _lock:
-                                total_updated += ret
-                    except Exception as exc:
-                        _errors.append(f"Tenant '{t}': {exc}")
-            if _errors:
-                raise Exception(
-                    "Errors during parallel data update:\n" + "\n".join(_errors)
-                )
-        else:
-            _errors: List[str] = []
-            for tenant in tenants:
-                ret = _update_one_tenant(tenant)
-                if ret == -1:
-                    _errors.append(
-                        f"Failed to update objects in class '{col.name}' for tenant '{tenant}'"
+        # Tenants are planned in parallel, but every fetch and write of every
+        # tenant shares the scheduler's single budget of parallel_workers requests.
+        with _WorkScheduler(parallel_workers) as scheduler:
+            if len(tenants) > 1 and parallel_workers > 1:
+                actual_workers = min(parallel_workers, len(tenants))
+                _lock = threading.Lock()
+                _errors: List[str] = []
+                with ThreadPoolExecutor(max_workers=actual_workers) as executor:
+                    future_to_tenant = {
+                        executor.submit(_update_one_tenant, t, scheduler): t
+                        for t in tenants
+                    }
+                    for future in as_completed(future_to_tenant):
+                        t = future_to_tenant[future]
+                        try:
+                            ret = future.result()
+                            if ret == -1:
+                                _errors.append(
+                                    f"Failed to update objects in class '{col.name}' for tenant '{t}'"
+                                )
+                            else:
+                                with _lock:
+                                    total_updated += ret
+                        except Exception as exc:
+                            _errors.append(f"Tenant '{t}': {exc}")
+                if _errors:
+                    raise Exception(
+                        "Errors during parallel data update:\n" + "\n".join(_errors)
+                    )
+            else:
+                _errors: List[str] = []
+                for tenant in tenants:
+                    ret = _update_one_tenant(tenant, scheduler)
+                    if ret == -1:
+                        _errors.append(
+                            f"Failed to update objects in class '{col.name}' for tenant '{tenant}'"
+                        )
+                    else:
+                        total_updated += ret
+                if _errors:
+                    raise Exception(
+                        "Errors during sequential data update:\n" + "\n".join(_errors)
                     )
-                else:
-                    total_updated += ret
-            if _errors:
-                raise Exception(
-                    "Errors during sequential data update:\n" + "\n".join(_errors)
-                )
 
         if json_output:
             click.echo(
@@ -1295,11 +1518,25 @@ class DataManager:
         uuid: Optional[str] = None,
         verbose: bool = False,
         json_output: bool = False,
+        scheduler: Optional[_WorkScheduler] = None,
     ) -> int:
 
+        if scheduler is None:
+            with _WorkScheduler(1) as own_scheduler:
+                return self.__delete_data(
+                    collection,
+                    num_objects,
+                    cl,
+                    uuid,
+                    verbose,
+                    json_output,
+                    scheduler=own_scheduler,
+                )
+
         if uuid:
             start_time = time.time()
-            collection.with_consistency_level(cl).data.delete_by_id(uuid=uuid)
+            with scheduler.request():
+                collection.with_consistency_level(cl).data.delete_by_id(uuid=uuid)
             elapsed = time.time() - start_time
             if not json_output:
                 print(
@@ -1310,49 +1547,63 @@ class DataManager:
 
         start_time = time.time()
         iterations = math.ceil(num_objects / MAX_OBJECTS_PER_BATCH)
-        deleted_objects = 0
+        cl_collection = collection.with_consistency_level(cl)
 
         if verbose:
             print(
                 f"Preparing to delete up to {num_objects} objects from class '{collection.name}'"
             )
 
+        def _delete_unit(ids: List) -> int:
+            cl_collection.data.delete_many(where=Filter.by_id().contains_any(ids))
+            return len(ids)
+
+        # Walk the collection with a cursor (ids only) and hand each page to the
+        # scheduler in UUID-contiguous units. Deleting objects behind the cursor
+        # does not disturb the pages still ahead of it.
+        after = None
+        scheduled = 0
+        futures: List[Future] = []
         for i in range(iterations):
-            batch_size = min(MAX_OBJECTS_PER_BATCH, num_objects - deleted_objects)
+            batch_size = min(MAX_OBJECTS_PER_BATCH, num_objects - scheduled)
             if batch_size <= 0:
                 break
 
             if verbose:
                 print(f"Fetching batch {i + 1}/{iterations} ({batch_size} objects)")
 
-            res = collection.query.fetch_objects(limit=batch_size)
-            if len(res.objects) == 0:
-                print(
-                    f"No objects found in class '{collection.name}'. Insert objects first using <create data> command"
+            with scheduler.request():
+                res = collection.query.fetch_objects(
+                    limit=batch_size, after=after, return_properties=False
                 )
-                return deleted_objects
+            if len(res.objects) == 0:
+                if scheduled == 0:
+                    print(
+                        f"No objects found in class '{collection.name}'. Insert objects first using <create data> command"
+                    )
+                break
 
             ids = [o.uuid for o in res.objects]
-            batch_start = time.time()
-            collection.with_consistency_level(cl).data.delete_many(
-                where=Filter.by_id().contains_any(ids)
-            )
-            batch_elapsed = time.time() - batch_start
+            after = ids[-1]
+            for unit in scheduler.split(ids):
+                futures.append(scheduler.submit(_delete_unit, unit))
+            scheduled += len(ids)
 
-            deleted_objects += len(ids)
+            if len(ids) < batch_size:
+                break
 
-            if verbose:
-                progress = min(100, (deleted_objects / num_objects) * 100)
+        deleted_objects = 0
+        for done, future in enumerate(as_completed(futures), start=1):
+            deleted_objects += future.result()
+            if verbose and done % max(1, len(futures) // 5) == 0:
+                progress = min(100, (deleted_objects / max(1, num_objects)) * 100)
                 elapsed = time.time() - start_time
                 rate = deleted_objects / elapsed if elapsed > 0 else 0
                 print(
                     f"Progress: {progress:.1f}% ({deleted_objects}/{num_objects}), "
-                    + f"batch of {len(ids)} deleted in {batch_elapsed:.2f}s (rate: {rate:.1f} objects/second)"
+                    + f"rate: {rate:.1f} objects/second"
                 )
 
-            if len(ids) < batch_size:
-                break
-
         total_elapsed = time.time() - start_time
         if not json_output:
             print(
@@ -1401,10 +1652,16 @@ class DataManager:
 
         total_deleted = 0
 
-        def _delete_one_tenant(tenant: str) -> int:
+        def _delete_one_tenant(tenant: str, scheduler: _WorkScheduler) -> int:
             if tenant == "None":
                 return self.__delete_data(
-                    col, limit, cl_map[consistency_level], uuid, verbose, json_output
+                    col,
+                    limit,
+                    cl_map[consistency_level],
+                    uuid,
+                    verbose,
+                    json_output,
+                    scheduler=scheduler,
                 )
             if not json_output and parallel_workers <= 1:
                 click.echo(f"Processing tenant '{tenant}'")
@@ -1415,30 +1672,35 @@ class DataManager:
                 uuid,
                 verbose,
                 json_output,
+                scheduler=scheduler,
             )
 
-        if len(tenants) > 1 and parallel_workers > 1:
-            actual_workers = min(parallel_workers, len(tenants))
-            _lock = threading.Lock()
-            _errors: List[str] = []
-            with ThreadPoolExecutor(max_workers=actual_workers) as executor:
-                future_to_tenant = {
-                    executor.submit(_delete_one_tenant, t): t for t in tenants
-                }
-                for future in as_completed(future_to_tenant):
-                    t = future_to_tenant[future]
-                    try:
-                        with _lock:
-                            total_deleted += future.result()
-                    except Exception as exc:
-                        _errors.append(f"Tenant '{t}': {exc}")
-            if _errors:
-                raise Exception(
-                    "Errors during parallel data deletion:\n" + "\n".join(_errors)
-                )
-        else:
-            for tenant in tenants:
-                total_deleted += _delete_one_tenant(tenant)
+        # Tenants are planned in parallel, but every fetch and delete of every
+        # tenant shares the scheduler's single budget of parallel_workers requests.
+        with _WorkScheduler(parallel_workers) as scheduler:
+            if len(tenants) > 1 and parallel_workers > 1:
+                actual_workers = min(parallel_workers, len(tenants))
+                _lock = threading.Lock()
+                _errors: List[str] = []
+                with ThreadPoolExecutor(max_workers=actual_workers) as executor:
+                    future_to_tenant = {
+                        executor.submit(_delete_one_tenant, t, scheduler): t
+                        for t in tenants
+                    }
+                    for future in as_completed(future_to_tenant):
+                        t = future_to_tenant[future]
+                        try:
+                            with _lock:
+                                total_deleted += future.result()
+                        except Exception as exc:
+                            _errors.append(f"Tenant '{t}': {exc}")
+                if _errors:
+                    raise Exception(
+                        "Errors during parallel data deletion:\n" + "\n".join(_errors)
+                    )
+            else:
+                for tenant in tenants:
+                    total_deleted += _delete_one_tenant(tenant, scheduler)
 
         if json_output:
             click.echo(
@@ -1452,70 +1714,668 @@ class DataManager:
                 )
             )
 
-    def __query_data(
+    def __search(
         self,
-        collection: Collection,
-        num_objects: int,
-        cl: wvc.ConsistencyLevel,
+        query_obj: Any,
         search_type: str,
         query: str,
-        properties: str,
+        num_objects: int,
         target_vector: Optional[str] = None,
-        json_output: bool = False,
-    ) -> None:
+        return_properties: Optional[List[str]] = None,
+    ) -> Any:
+        """Dispatch one search on a sync or async `collection.query` object.
 
-        start_time = datetime.now()
-        response = None
+        Only the metadata shown for the search type is requested, and only
+        `return_properties` when given (None returns every property).
+        For the async client the returned value is a coroutine to await.
+        """
         if search_type == "fetch":
-            response = collection.with_consistency_level(cl).query.fetch_objects(
-                limit=num_objects
+            return query_obj.fetch_objects(
+                limit=num_objects, return_properties=return_properties
             )
         elif search_type == "vector":
-            response = collection.with_consistency_level(cl).query.near_text(
+            return query_obj.near_text(
                 query=query,
                 return_metadata=MetadataQuery(distance=True, certainty=True),
+                return_properties=return_properties,
                 limit=num_objects,
                 target_vector=target_vector,
             )
         elif search_type == "keyword":
-            response = collection.with_consistency_level(cl).query.bm25(
+            return query_obj.bm25(
                 query=query,
                 return_objects=True,
-                return_metadata=MetadataQuery(score=True, explain_score=True),
+                return_metadata=MetadataQuery(score=True),
+                return_properties=return_properties,
                 limit=num_objects,
             )
         elif search_type == "hybrid":
-            response = collection.with_consistency_level(cl).query.hybrid(
+            return query_obj.hybrid(
                 query=query,
                 return_metadata=MetadataQuery(score=True),
+                return_properties=return_properties,
                 limit=num_objects,
                 target_vector=target_vector,
             )
         elif search_type == "uuid":
-            num_objects = 1
-            response = collection.with_consistency_level(cl).query.fetch_object_by_id(
-                uuid=query
+            return query_obj.fetch_object_by_id(
+                uuid=query, return_properties=return_properties
             )
-        else:
-            click.echo(
-                f"Invalid search type: {search_type}. Please choose from 'fetch', 'vector', 'keyword', or 'hybrid'."
+        elif search_type == "near_vector":
+            return query_obj.near_vector(
+                near_vector=query,
+                return_metadata=MetadataQuery(distance=True, certainty=True),
+                return_properties=return_properties,
+                limit=num_objects,
+                target_vector=target_vector,
+            )
+        raise ValueError(
+            f"Invalid search type: {search_type}. Please choose from 'fetch', 'vector', 'near_vector', 'keyword', or 'hybrid'."
+        )
+
+    def __query_data(
+        self,
+        collection: Collection,
+        num_objects: int,
+        cl: wvc.ConsistencyLevel,
+        search_type: str,
+        query: str,
+        properties: str,
+        target_vector: Optional[str] = None,
+        json_output: bool = False,
+        repeat: int = 1,
+        warmup: int = 0,
+        concurrency: int = 1,
+        return_properties: Optional[List[str]] = None,
+        jsonl: bool = False,
+    ) -> None:
+
+        if search_type == "uuid":
+            num_objects = 1
+        query_obj = collection.with_consistency_level(cl).query
+
+        def _timed_search(run: int) -> Tuple[Any, int]:
+            run_query = query
+            if search_type == "near_vector":
+                # Cycle through the query vectors so repeated runs differ.
+                run_query = np.asarray(query[run % len(query)], dtype=np.float32)
+                run_query = run_query.tolist()
+            t0 = time.perf_counter_ns()
+            response = self.__search(
+                query_obj,
+                search_type,
+                run_query,
+                num_objects,
+                target_vector,
+                return_properties,
             )
+            return response, time.perf_counter_ns() - t0
+
+        try:
+            for run in range(warmup):
+                _timed_search(run)
+            if repeat > 1 and concurrency > 1:
+                with ThreadPoolExecutor(max_workers=min(concurrency, repeat)) as pool:
+                    runs = list(pool.map(_timed_search, range(warmup, warmup + repeat)))
+            else:
+                runs = [_timed_search(run) for run in range(warmup, warmup + repeat)]
+        except ValueError as e:
+            click.echo(str(e))
             return -1
 
+        response = runs[-1][0]
+        network_ns = runs[-1][1]
+        repeat_stats = (
+            self.__repeat_latency_stats([took for _, took in runs], warmup, concurrency)
+            if repeat > 1
+            else None
+        )
+        render_start = time.perf_counter_ns()
         if response is not None:
             properties_list = [prop.strip() for prop in properties.split(",")]
-            pp_objects(response, properties_list, json_output=json_output)
+            # With --json, the latency summary goes into the same document.
+            pp_objects(
+                response,
+                properties_list,
+                json_output=json_output,
+                jsonl=jsonl,
+                extra={"repeat": repeat_stats} if repeat_stats else None,
+            )
         else:
             click.echo("No objects found")
             return -1
-        end_time = datetime.now()
-        latency = end_time - start_time
+        render_ns = time.perf_counter_ns() - render_start
 
-        print(
-            f"Queried {num_objects} objects using {search_type} search into class '{collection.name}' in {latency.total_seconds()} s"
-        )
+        if not jsonl and not (json_output and repeat_stats):
+            print(
+                f"Queried {num_objects} objects using {search_type} search into class '{collection.name}' "
+                f"in {network_ns / 1e9} s (rendering took {render_ns / 1e9} s)"
+            )
+        if repeat_stats and not json_output:
+            lat = repeat_stats["latency_ms"]
+            print(
+                f"Network latency over {repeat_stats['runs']} runs ({warmup} warmup discarded, concurrency {concurrency}): "
+                f"min {lat['min']} ms, p50 {lat['p50']} ms, p99 {lat['p99']} ms, max {lat['max']} ms, mean {lat['mean']} ms"
+            )
         return num_objects
 
+    def __repeat_latency_stats(
+        self,
+        latencies_ns: List[int],
+        warmup: int,
+        concurrency: int,
+    ) -> dict:
+        """Summarise the network time of repeated runs of one query."""
+        latencies_ms = np.array(latencies_ns, dtype=np.float64) / 1e6
+        p50, p99 = np.percentile(latencies_ms, [50, 99])
+        return {
+            "runs": len(latencies_ms),
+            "warmup_runs": warmup,
+            "concurrency": concurrency,
+            "latency_ms": {
+                "min": round(float(latencies_ms.min()), 3),
+                "p50": round(float(p50), 3),
+                "p99": round(float(p99), 3),
+                "max": round(float(latencies_ms.max()), 3),
+                "mean": round(float(latencies_ms.mean()), 3),
+            },
+        }
+
+    async def __query_tenants_async(
+        self,
+        collection: str,
+        tenants: List[str],
+        cl: wvc.ConsistencyLevel,
+        search_type: str,
+        query: str,
+        num_objects: int,
+        target_vector: Optional[str],
+        concurrency: int,
+        return_properties: Optional[List[str]] = None,
+    ) -> List[Tuple[str, Any, float, Optional[Exception]]]:
+        """Run the same search against every tenant on the async client.
+
+        Returns one (tenant, response, latency_s, error) tuple per tenant, in the
+        order of `tenants`. At most `concurrency` queries are in flight at once.
+        """
+        await self.async_client.connect()
+        try:
+            col = self.async_client.collections.get(collection).with_consistency_level(
+                cl
+            )
+            sem = asyncio.Semaphore(max(1, concurrency))
+
+            async def _query_one(tenant: str):
+                async with sem:
+                    t0 = time.perf_counter()
+                    try:
+                        response = await self.__search(
+                            col.with_tenant(tenant).query,
+                            search_type,
+                            query,
+                            num_objects,
+                            target_vector,
+                            return_properties,
+                        )
+                        return tenant, response, time.perf_counter() - t0, None
+                    except Exception as e:
+                        return tenant, None, time.perf_counter() - t0, e
+
+            return await asyncio.gather(*(_query_one(t) for t in tenants))
+        finally:
+            await self.async_client.close()
+
+    def __fan_out_query(
+        self,
+        col: Collection,
+        tenants: List[str],
+        cl: wvc.ConsistencyLevel,
+        search_type: str,
+        query: str,
+        limit: int,
+        properties: str,
+        target_vector: Optional[str],
+        concurrency: int,
+        merge_results: bool,
+        json_output: bool,
+        return_properties: Optional[List[str]] = None,
+        jsonl: bool = False,
+    ) -> None:
+        properties_list = [prop.strip() for prop in properties.split(",")]
+        num_objects = 1 if search_type == "uuid" else limit
+
+        start_time = time.perf_counter()
+        results = asyncio.run(
+            self.__query_tenants_async(
+                col.name,
+                tenants,
+                cl,
+                search_type,
+                query,
+                num_objects,
+                target_vector,
+                concurrency,
+                return_properties,
+            )
+        )
+        wall_time = time.perf_counter() - start_time
+
+        failed = [(tenant, err) for tenant, _, _, err in results if err is not None]
+        succeeded = [
+            (tenant, resp, lat) for tenant, resp, lat, err in results if err is None
+        ]
+
+        if merge_results:
+            # Vector search ranks by distance (lower is better), keyword and
+            # hybrid by score (higher is better).
+            rank_by = (
+                "distance" if search_type in ("vector", "near_vector") else "score"
+            )
+            candidates = []
+            for tenant, resp, _ in succeeded:
+                for obj in resp.objects:
+                    value = getattr(obj.metadata, rank_by, None)
+                    if value is not None:
+                        candidates.append((value, tenant, obj))
+            candidates.sort(key=lambda c: c[0], reverse=rank_by == "score")
+            top_k = candidates[:limit]
+            if not json_output:
+                print(
+                    f"Merged top {len(top_k)} objects by {rank_by} across {len(succeeded)} tenants"
+                )
+            pp_objects(
+                SimpleNamespace(objects=[obj for _, _, obj in top_k]),
+                properties_list,
+                json_output=json_output,
+                tenants=[tenant for _, tenant, _ in top_k],
+                jsonl=jsonl,
+            )
+        else:
+            for tenant, resp, lat in succeeded:
+                if not json_output:
+                    print(f"Querying tenant '{tenant}'")
+                if resp is None:
+                    click.echo("No objects found")
+                    continue
+                pp_objects(
+                    resp,
+                    properties_list,
+                    json_output=json_output,
+                    # JSONL rows of all tenants share one stream, so tag them.
+                    tenants=[tenant] * len(resp.objects) if jsonl else None,
+                    jsonl=jsonl,
+                )
+                if not json_output:
+                    print(
+                        f"Queried {num_objects} objects using {search_type} search into class '{col.name}' in {lat} s"
+                    )
+
+        latencies_ms = np.array([lat * 1000 for _, _, lat in succeeded])
+        summary: Dict[str, Any] = {
+            "tenants_queried": len(results),
+            "tenants_failed": len(failed),
+            "concurrency": concurrency,
+            "wall_time_s": round(wall_time, 3),
+        }
+        if len(latencies_ms) > 0:
+            p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99])
+            summary["latency_ms"] = {
+                "min": round(float(latencies_ms.min()), 2),
+                "p50": round(float(p50), 2),
+                "p95": round(float(p95), 2),
+                "p99": round(float(p99), 2),
+                "max": round(float(latencies_ms.max()), 2),
+            }
+            slowest = sorted(succeeded, key=lambda r: r[2], reverse=True)[:5]
+            summary["slowest_tenants"] = [
+                {"tenant": tenant, "latency_ms": round(lat * 1000, 2)}
+                for tenant, _, lat in slowest
+            ]
+
+        if json_output:
+            if not jsonl:
+                click.echo(json.dumps({"latency_summary": summary}, indent=2))
+        else:
+            print(
+                f"\nQueried {len(results)} tenants in {wall_time:.3f} s "
+                f"(concurrency {concurrency}, {len(failed)} failed)"
+            )
+            if "latency_ms" in summary:
+                lat = summary["latency_ms"]
+                print(
+                    f"Per-tenant latency (ms): min {lat['min']}, p50 {lat['p50']}, "
+                    f"p95 {lat['p95']}, p99 {lat['p99']}, max {lat['max']}"
+                )
+                print(
+                    "Slowest tenants: "
+                    + ", ".join(
+                        f"{t['tenant']} ({t['latency_ms']} ms)"
+                        for t in summary["slowest_tenants"]
+                    )
+                )
+
+        if failed:
+            raise Exception(
+                f"Failed to query objects in class '{col.name}' for tenants: "
+                + ", ".join(f"'{tenant}' ({err})" for tenant, err in failed)
+            )
+
+    @staticmethod
+    def _load_vectors_file(path: str) -> np.ndarray:
+        """Memory-map the query vectors of a `.npy` or `.fvecs` file, one per row."""
+        if path.endswith(".fvecs"):
+            # .fvecs: every vector is an int32 dimension followed by that many float32.
+            raw = np.memmap(path, dtype=np.int32, mode="r")
+            if raw.size == 0:
+                raise Exception(f"No query vectors found in '{path}'.")
+            dim = int(raw[0])
+            if dim <= 0 or raw.size % (dim + 1) != 0:
+                raise Exception(f"'{path}' is not a valid .fvecs file.")
+            return raw.reshape(-1, dim + 1)[:, 1:].view(np.float32)
+        vectors = np.load(path, mmap_mode="r")
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        if vectors.ndim != 2:
+            raise Exception(
+                f"Expected a 2-D array of query vectors in '{path}', got shape {vectors.shape}."
+            )
+        return vectors
+
+    def _detect_vector_dimensions(
+        self, col: Collection, target_vector: Optional[str] = None
+    ) -> int:
+        """Read the dimensions of `target_vector` (or the only/first vector) from one stored object."""
+        response = col.query.fetch_objects(limit=1, include_vector=True)
+        if len(response.objects) == 0:
+            raise Exception(
+                f"Cannot detect the vector dimensions of class '{col.name}': it has no objects. Pass --vector instead."
+            )
+        vec = response.objects[0].vector
+        if isinstance(vec, dict):
+            if target_vector is not None:
+                if target_vector not in vec:
+                    raise Exception(
+                        f"Target vector '{target_vector}' not found in class '{col.name}'. Available: {', '.join(vec.keys())}"
+                    )
+                vec = vec[target_vector]
+            else:
+                vec = vec.get("default", next(iter(vec.values()), None))
+        if not vec:
+            raise Exception(f"Objects in class '{col.name}' have no vectors.")
+        # Multi-vectors are lists of vectors; query with a single token vector.
+        return len(vec[0]) if isinstance(vec[0], list) else len(vec)
+
+    def _resolve_query_vectors(
+        self,
+        col: Collection,
+        vector: Optional[str],
+        vector_seed: int,
+        count: int,
+        target_vector: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Build the query vectors for a near_vector search from --vector.
+
+        `vector` is an inline list ("0.1,0.2,..." or "[0.1, 0.2, ...]"), a path to
+        a .npy/.fvecs file, or None to generate `count` seeded random vectors
+        with the dimensions detected from the collection.
+        """
+        if vector is None:
+            dim = self._detect_vector_dimensions(col, target_vector)
+            rng = np.random.default_rng(vector_seed)
+            return (2 * rng.random((count, dim), dtype=np.float32) - 1).astype(
+                np.float32
+            )
+        if vector.endswith((".npy", ".fvecs")):
+            return self._load_vectors_file(vector)
+        try:
+            values = [
+                float(v) for v in vector.strip().strip("[]").split(",") if v.strip()
+            ]
+        except ValueError:
+            raise Exception(
+                f"Invalid --vector '{vector}': expected a comma separated list of floats or a .npy/.fvecs file."
+            )
+        if not values:
+            raise Exception("--vector must contain at least one value.")
+        return np.array([values], dtype=np.float32)
+
+    @staticmethod
+    def _load_queries_file(path: str) -> Tuple[str, Any]:
+        """
+        Load the queries of a --queries_file.
+
+        A `.npy` or `.fvecs` file holds one query vector per row and is
+        memory-mapped, any other file holds one query string per non-empty line.
+        Returns ("vector", array) or ("text", list of strings).
+        """
+        if path.endswith((".npy", ".fvecs")):
+            return "vector", DataManager._load_vectors_file(path)
+        with open(path, "r") as f:
+            return "text", [line.strip() for line in f if line.strip()]
+
+    async def __run_queries_file_async(
+        self,
+        collection: str,
+        tenants: List[str],
+        cl: wvc.ConsistencyLevel,
+        search_type: str,
+        queries: Any,
+        limit: int,
+        properties_list: List[str],
+        target_vector: Optional[str],
+        concurrency: int,
+        writer: _JsonlRowWriter,
+        return_properties: Optional[List[str]] = None,
+    ) -> Tuple[List[float], int]:
+        """
+        Stream every (tenant, query) pair through `concurrency` workers on the
+        async client and write one JSONL row per query as soon as it completes.
+
+        The work queue is bounded so a large queries file is never fully
+        materialised as pending tasks. Returns the per-query latencies in
+        seconds of the successful queries and the number of failed queries.
+        """
+        await self.async_client.connect()
+        try:
+            base = self.async_client.collections.get(collection).with_consistency_level(
+                cl
+            )
+            work: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+            latencies: List[float] = []
+            failed = 0
+
+            async def _produce() -> None:
+                for tenant in tenants:
+                    for idx in range(len(queries)):
+                        await work.put((tenant, idx))
+                for _ in range(concurrency):
+                    await work.put(None)
+
+            async def _worker() -> None:
+                nonlocal failed
+                while True:
+                    item = await work.get()
+                    if item is None:
+                        return
+                    tenant, idx = item
+                    target = base if tenant == "None" else base.with_tenant(tenant)
+                    query = queries[idx]
+                    if search_type == "near_vector":
+                        query = np.asarray(query, dtype=np.float32).tolist()
+                    row: Dict[str, Any] = {"query_index": idx}
+                    if search_type != "near_vector":
+                        row["query"] = query
+                    if tenant != "None":
+                        row["tenant"] = tenant
+                    t0 = time.perf_counter()
+                    try:
+                        response = await self.__search(
+                            target.query,
+                            search_type,
+                            query,
+                            limit,
+                            target_vector,
+                            return_properties,
+                        )
+                        took = time.perf_counter() - t0
+                        latencies.append(took)
+                        row["latency_ms"] = round(took * 1000, 3)
+                        row["results"] = [
+                            {
+                                "uuid": str(obj.uuid),
+                                "score": getattr(obj.metadata, "score", None),
+                                "distance": getattr(obj.metadata, "distance", None),
+                                **{
+                                    prop: obj.properties.get(prop)
+                                    for prop in properties_list
+                                },
+                            }
+                            for obj in response.objects
+                        ]
+                    except Exception as e:
+                        failed += 1
+                        row["error"] = str(e)
+                    writer.write([row])
+
+            await asyncio.gather(_produce(), *(_worker() for _ in range(concurrency)))
+            return latencies, failed
+        finally:
+            await self.async_client.close()
+
+    def __query_from_file(
+        self,
+        col: Collection,
+        tenants: List[str],
+        cl: wvc.ConsistencyLevel,
+        search_type: str,
+        queries_file: str,
+        output: Optional[str],
+        limit: int,
+        properties: str,
+        target_vector: Optional[str],
+        concurrency: int,
+        json_output: bool,
+        return_properties: Optional[List[str]] = None,
+    ) -> None:
+        kind, queries = self._load_queries_file(queries_file)
+        if kind == "vector":
+            search_type = "near_vector"
+        elif search_type == "near_vector":
+            raise Exception("near_vector search needs a .npy or .fvecs --queries_file.")
+        elif search_type not in ("vector", "keyword", "hybrid"):
+            raise Exception(
+                "A text --queries_file can only be used with vector, keyword or hybrid search."
+            )
+        if len(queries) == 0:
+            raise Exception(f"No queries found in '{queries_file}'.")
+        if self.async_client is None:
+            raise Exception("--queries_file requires an async client.")
+
+        output = output or f"{queries_file}.results.jsonl"
+        properties_list = [prop.strip() for prop in properties.split(",")]
+        writer = _JsonlRowWriter(output)
+        start_time = time.perf_counter()
+        try:
+            latencies, failed = asyncio.run(
+                self.__run_queries_file_async(
+                    col.name,
+                    tenants,
+                    cl,
+                    search_type,
+                    queries,
+                    limit,
+                    properties_list,
+                    target_vector,
+                    concurrency,
+                    writer,
+                    return_properties,
+                )
+            )
+        finally:
+            writer.close()
+        wall_time = time.perf_counter() - start_time
+
+        total = len(queries) * len(tenants)
+        summary: Dict[str, Any] = {
+            "queries_file": queries_file,
+            "output": output,
+            "queries_run": total,
+            "queries_failed": failed,
+            "concurrency": concurrency,
+            "wall_time_s": round(wall_time, 3),
+            "throughput_qps": round(len(latencies) / wall_time, 2) if wall_time else 0,
+        }
+        if latencies:
+            latencies_ms = np.array(latencies) * 1000
+            p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99])
+            summary["latency_ms"] = {
+                "min": round(float(latencies_ms.min()), 2),
+                "p50": round(float(p50), 2),
+                "p95": round(float(p95), 2),
+                "p99": round(float(p99), 2),
+                "max": round(float(latencies_ms.max()), 2),
+            }
+
+        if json_output:
+            click.echo(json.dumps(summary, indent=2))
+        else:
+            print(
+                f"Ran {total} {search_type} queries from '{queries_file}' against class '{col.name}' "
+                f"in {wall_time:.3f} s ({summary['throughput_qps']} QPS, concurrency {concurrency}, {failed} failed)"
+            )
+            if "latency_ms" in summary:
+                lat = summary["latency_ms"]
+                print(
+                    f"Latency (ms): min {lat['min']}, p50 {lat['p50']}, "
+                    f"p95 {lat['p95']}, p99 {lat['p99']}, max {lat['max']}"
+                )
+            print(f"Results written to '{output}'")
+
+        if failed == total:
+            raise Exception(
+                f"All {total} queries from '{queries_file}' failed against class '{col.name}'."
+            )
+
+    def _resolve_tenants_for_read(
+        self,
+        col: Collection,
+        mt_enabled: bool,
+        tenants: Optional[str],
+        action: str = "Querying",
+    ) -> List[str]:
+        """
+        Resolve which tenants a read operation (query, export) should visit.
+
+        Returns ["None"] for non-MT collections. For MT collections, returns the
+        comma-separated `tenants` (or every tenant if not given), keeping only
+        ACTIVE ones unless auto tenant activation is enabled.
+        """
+        if not mt_enabled:
+            if tenants is not None:
+                raise Exception(
+                    f"Collection '{col.name}' does not have multi-tenancy enabled. {action} tenants is not possible."
+                )
+            return ["None"]
+
+        if tenants is not None:
+            tenants_with_status = col.tenants.get_by_names(
+                [t.strip() for t in tenants.split(",") if t.strip()]
+            )
+        else:
+            tenants_with_status = col.tenants.get()
+        if col.config.get().multi_tenancy_config.auto_tenant_activation:
+            # When auto_tenant_activation is enabled, Weaviate is expected to automatically
+            # activate tenants on read. We therefore include all tenants here regardless
+            # of their current activity status. If the server is configured not to auto-
+            # activate tenants, reading an inactive tenant may fail.
+            return [tenant for tenant in tenants_with_status.keys()]
+        return [
+            tenant
+            for tenant, status in tenants_with_status.items()
+            if status.activity_status == TenantActivityStatus.ACTIVE
+        ]
+
     def query_data(
         self,
         collection: str = QueryDataDefaults.collection,
@@ -1526,7 +2386,16 @@ class DataManager:
         properties: str = QueryDataDefaults.properties,
         tenants: Optional[str] = QueryDataDefaults.tenants,
         target_vector: Optional[str] = QueryDataDefaults.target_vector,
+        concurrency: Optional[int] = QueryDataDefaults.concurrency,
+        merge_results: bool = QueryDataDefaults.merge_results,
+        repeat: int = QueryDataDefaults.repeat,
+        warmup: int = QueryDataDefaults.warmup,
+        queries_file: Optional[str] = QueryDataDefaults.queries_file,
+        output: Optional[str] = QueryDataDefaults.output,
+        vector: Optional[str] = QueryDataDefaults.vector,
+        vector_seed: int = QueryDataDefaults.vector_seed,
         json_output: bool = False,
+        jsonl: bool = False,
     ) -> None:
 
         if not self.client.collections.exists(collection):
@@ -1537,47 +2406,107 @@ class DataManager:
                 )
 
         col: Collection = self.client.collections.get(collection)
-        mt_enabled = col.config.get().multi_tenancy_config.enabled
-        if mt_enabled:
-            if tenants is not None:
-                tenants_with_status = col.tenants.get_by_names(
-                    [t.strip() for t in tenants.split(",") if t.strip()]
+        col_config = col.config.get()
+        mt_enabled = col_config.multi_tenancy_config.enabled
+        existing_tenants = self._resolve_tenants_for_read(
+            col, mt_enabled, tenants, action="Querying"
+        )
+        # Only fetch the displayed columns; unknown names are left out so they
+        # render as empty instead of failing the query.
+        schema_properties = {prop.name for prop in col_config.properties}
+        return_properties = [
+            prop.strip()
+            for prop in properties.split(",")
+            if prop.strip() in schema_properties
+        ]
+
+        benchmark_mode = repeat > 1 or warmup > 0
+        if merge_results and benchmark_mode:
+            raise Exception(
+                "--merge_results cannot be combined with --repeat or --warmup."
+            )
+        if queries_file is not None and (merge_results or benchmark_mode):
+            raise Exception(
+                "--queries_file cannot be combined with --merge_results, --repeat or --warmup."
+            )
+        if jsonl:
+            if queries_file is not None or benchmark_mode:
+                raise Exception(
+                    "--jsonl cannot be combined with --queries_file, --repeat or --warmup."
                 )
-                if col.config.get().multi_tenancy_config.auto_tenant_activation:
-                    # When auto_tenant_activation is enabled, Weaviate is expected to automatically
-                    # activate tenants on query. We therefore include all tenants here regardless
-                    # of their current activity status. If the server is configured not to auto-
-                    # activate tenants, querying an inactive tenant may fail.
-                    existing_tenants = [tenant for tenant in tenants_with_status.keys()]
-                else:
-                    existing_tenants = [
-                        tenant
-                        for tenant, status in tenants_with_status.items()
-                        if status.activity_status == TenantActivityStatus.ACTIVE
-                    ]
-            else:
-                tenants_with_status = col.tenants.get()
-                if col.config.get().multi_tenancy_config.auto_tenant_activation:
-                    # See comment above: when auto_tenant_activation is enabled, include all tenants.
-                    existing_tenants = [tenant for tenant in tenants_with_status.keys()]
-                else:
-                    existing_tenants = [
-                        tenant
-                        for tenant, status in tenants_with_status.items()
-                        if status.activity_status == TenantActivityStatus.ACTIVE
-                    ]
-        else:
-            if tenants is not None:
+            # JSONL output is a pure object stream: suppress progress messages too.
+            json_output = True
+
+        if merge_results:
+            if search_type not in ("vector", "near_vector", "keyword", "hybrid"):
                 raise Exception(
-                    f"Collection '{col.name}' does not have multi-tenancy enabled. Querying tenants is not possible."
+                    "--merge_results can only be used with vector, near_vector, keyword or hybrid search."
+                )
+            if not mt_enabled:
+                raise Exception(
+                    f"Collection '{col.name}' does not have multi-tenancy enabled. Merging tenant results is not possible."
                 )
-            existing_tenants = ["None"]
 
         cl_map = {
             "quorum": wvc.ConsistencyLevel.QUORUM,
             "all": wvc.ConsistencyLevel.ALL,
             "one": wvc.ConsistencyLevel.ONE,
         }
+        # --repeat measures one query stream unless asked to run in parallel.
+        repeat_concurrency = concurrency or 1
+        concurrency = concurrency or MAX_WORKERS
+
+        if queries_file is not None:
+            self.__query_from_file(
+                col,
+                existing_tenants,
+                cl_map[consistency_level],
+                search_type,
+                queries_file,
+                output,
+                limit,
+                properties,
+                target_vector,
+                concurrency,
+                json_output,
+                return_properties=return_properties,
+            )
+            return
+
+        if search_type == "near_vector":
+            # Dimensions are detected on the first tenant for generated vectors.
+            vector_col = (
+                col
+                if existing_tenants[:1] in ([], ["None"])
+                else col.with_tenant(existing_tenants[0])
+            )
+            query = self._resolve_query_vectors(
+                vector_col, vector, vector_seed, warmup + repeat, target_vector
+            )
+
+        if (
+            self.async_client is not None
+            and not benchmark_mode
+            and (len(existing_tenants) > 1 or merge_results)
+        ):
+            if search_type == "near_vector":
+                query = np.asarray(query[0], dtype=np.float32).tolist()
+            self.__fan_out_query(
+                col,
+                existing_tenants,
+                cl_map[consistency_level],
+                search_type,
+                query,
+                limit,
+                properties,
+                target_vector,
+                concurrency,
+                merge_results,
+                json_output,
+                return_properties=return_properties,
+                jsonl=jsonl,
+            )
+            return
 
         for tenant in existing_tenants:
             if tenant == "None":
@@ -1590,6 +2519,11 @@ class DataManager:
                     properties,
                     target_vector,
                     json_output=json_output,
+                    repeat=repeat,
+                    warmup=warmup,
+                    concurrency=repeat_concurrency,
+                    return_properties=return_properties,
+                    jsonl=jsonl,
                 )
             else:
                 if not json_output:
@@ -1603,8 +2537,198 @@ class DataManager:
                     properties,
                     target_vector,
                     json_output=json_output,
+                    repeat=repeat,
+                    warmup=warmup,
+                    concurrency=repeat_concurrency,
+                    return_properties=return_properties,
+                    jsonl=jsonl,
                 )
             if ret == -1:
                 raise Exception(
                     f"Failed to query objects in class '{col.name}' for tenant '{tenant}'"
                 )
+
+    def export_data(
+        self,
+        collection: str = ExportDataDefaults.collection,
+        output: Optional[str] = ExportDataDefaults.output,
+        file_format: str = ExportDataDefaults.file_format,
+        tenants: Optional[str] = ExportDataDefaults.tenants,
+        include_vectors: bool = ExportDataDefaults.include_vectors,
+        consistency_level: str = ExportDataDefaults.consistency_level,
+        page_size: int = ExportDataDefaults.page_size,
+        prefetch: int = ExportDataDefaults.prefetch,
+        parallel_workers: int = ExportDataDefaults.parallel_workers,
+        json_output: bool = False,
+    ) -> int:
+        """Stream a whole collection (or the selected tenants) to disk.
+
+        Each tenant is walked with its own cursor on a worker thread; pages are
+        handed to this thread through a queue of at most `prefetch` pages, so
+        memory stays constant regardless of the collection size. Properties go
+        to one JSONL or Parquet file and every named vector to its own .npy
+        file; row i of each .npy belongs to row i of the properties file.
+        Returns the number of exported objects.
+        """
+        from queue import Queue
+
+        if not self.client.collections.exists(collection):
+            alias_list = self.client.alias.list_all()
+            if collection not in alias_list.keys():
+                raise Exception(
+                    f"Class '{collection}' does not exist in Weaviate. Create first using <create class> command."
+                )
+
+        col: Collection = self.client.collections.get(collection)
+        config = col.config.get()
+        mt_enabled = config.multi_tenancy_config.enabled
+        tenant_names = self._resolve_tenants_for_read(
+            col, mt_enabled, tenants, action="Exporting"
+        )
+        if not tenant_names:
+            raise Exception(f"No active tenants found in class '{col.name}'.")
+
+        cl_map = {
+            "quorum": wvc.ConsistencyLevel.QUORUM,
+            "all": wvc.ConsistencyLevel.ALL,
+            "one": wvc.ConsistencyLevel.ONE,
+        }
+        cl = cl_map[consistency_level]
+
+        output = output or f"{col.name}.{file_format}"
+        stem = (
+            output[: -len(f".{file_format}")]
+            if output.endswith(f".{file_format}")
+            else output
+        )
+        row_writer = (
+            _ParquetRowWriter(output, config.properties, tenant=mt_enabled)
+            if file_format == "parquet"
+            else _JsonlRowWriter(output)
+        )
+        vector_writers: Dict[str, _NpyStreamWriter] = {}
+        skipped_vectors: set = set()
+
+        q: Queue = Queue(maxsize=max(1, prefetch))
+        stop = threading.Event()
+        errors: List[str] = []
+
+        def _fetch_tenant(tenant: str) -> None:
+            target = col if tenant == "None" else col.with_tenant(tenant)
+            target = target.with_consistency_level(cl)
+            after = None
+            try:
+                while not stop.is_set():
+                    res = target.query.fetch_objects(
+                        limit=page_size, after=after, include_vector=include_vectors
+                    )
+                    if len(res.objects) == 0:
+                        break
+                    q.put((tenant, res.objects))
+                    after = res.objects[-1].uuid
+                    if len(res.objects) < page_size:
+                        break
+            except Exception as e:
+                errors.append(f"Tenant '{tenant}': {e}")
+            finally:
+                q.put(None)
+
+        def _write_page(tenant: str, objects: List, exported: int) -> None:
+            rows = []
+            for obj in objects:
+                row: Dict[str, Any] = {"uuid": str(obj.uuid)}
+                if tenant != "None":
+                    row["tenant"] = tenant
+                row.update(obj.properties)
+                rows.append(row)
+            row_writer.write(rows)
+            if not include_vectors:
+                return
+
+            for obj in objects:
+                for name, vec in (obj.vector or {}).items():
+                    if name in vector_writers or name in skipped_vectors or not vec:
+                        continue
+                    if isinstance(vec[0], list):
+                        # Multi-vectors have no fixed row width; leave them out.
+                        skipped_vectors.add(name)
+                        continue
+                    writer = _NpyStreamWriter(f"{stem}.{name}.npy", len(vec))
+                    writer.append_missing(exported)
+                    vector_writers[name] = writer
+            for name, writer in vector_writers.items():
+                block = np.full((len(objects), writer.dim), np.nan, dtype=np.float32)
+                for i, obj in enumerate(objects):
+                    vec = (obj.vector or {}).get(name)
+                    if vec is not None and len(vec) == writer.dim:
+                        block[i] = vec
+                writer.append(block)
+
+        start_time = time.time()
+        exported = 0
+        write_error: Optional[Exception] = None
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(parallel_workers, len(tenant_names)))
+            ) as executor:
+                for tenant in tenant_names:
+                    executor.submit(_fetch_tenant, tenant)
+                finished = 0
+                while finished < len(tenant_names):
+                    item = q.get()
+                    if item is None:
+                        finished += 1
+                        continue
+                    if write_error is not None:
+                        # Keep draining so blocked fetchers can exit.
+                        continue
+                    tenant, objects = item
+                    try:
+                        _write_page(tenant, objects, exported)
+                    except Exception as e:
+                        write_error = e
+                        stop.set()
+                        continue
+                    exported += len(objects)
+                    if not json_output and exported % (page_size * 10) < len(objects):
+                        elapsed = time.time() - start_time
+                        rate = exported / elapsed if elapsed > 0 else 0
+                        print(
+                            f"Exported {exported} objects ({rate:.0f} objects/second)"
+                        )
+        finally:
+            row_writer.close()
+            for writer in vector_writers.values():
+                writer.close()
+
+        if write_error is not None:
+            raise write_error
+        if errors:
+            raise Exception("Errors during data export:\n" + "\n".join(errors))
+        if skipped_vectors and not json_output:
+            click.echo(
+                f"Skipped multi-vectors (not representable as .npy): {', '.join(sorted(skipped_vectors))}"
+            )
+
+        elapsed = time.time() - start_time
+        vector_files = {name: w.path for name, w in vector_writers.items()}
+        if json_output:
+            click.echo(
+                json.dumps(
+                    {
+                        "status": "success",
+                        "collection": col.name,
+                        "objects_exported": exported,
+                        "output": output,
+                        "vectors": vector_files,
+                    },
+                    indent=2,
+                )
+            )
+        else:
+            print(
+                f"Exported {exported} objects from class '{col.name}' to '{output}' in {elapsed:.2f} seconds"
+            )
+            for name, path in vector_files.items():
+                print(f"Vectors '{name}' written to '{path}'")
+        return exported
@@ -8,6 +8,7 @@ import click
 import string
 import random
 import semver
+import sys
 import weaviate
 from weaviate.rbac.models import Permissions, RoleScope, PermissionsCreateType
 from typing import Callable, Optional, Union, List
@@ -54,8 +55,59 @@ def print_json_or_text(
         text_fn()
 
 
+# Rows rendered per write to stdout by pp_objects.
+PP_OBJECTS_CHUNK_SIZE = 1000
+
+
+def _pp_object_dict(obj, main_properties, tenant=None) -> dict:
+    metadata = obj.metadata
+    obj_dict = {
+        "uuid": str(obj.uuid),
+        "properties": {
+            prop: obj.properties.get(prop, None) for prop in main_properties
+        },
+        "distance": getattr(metadata, "distance", None) if metadata else None,
+        "certainty": getattr(metadata, "certainty", None) if metadata else None,
+        "score": getattr(metadata, "score", None) if metadata else None,
+    }
+    if tenant is not None:
+        obj_dict["tenant"] = tenant
+    return obj_dict
+
+
+def _write_chunked(lines) -> None:
+    """Write an iterable of lines to stdout, PP_OBJECTS_CHUNK_SIZE lines at a time."""
+    out = sys.stdout
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= PP_OBJECTS_CHUNK_SIZE:
+            out.write("\n".join(chunk) + "\n")
+            chunk = []
+    if chunk:
+        out.write("\n".join(chunk) + "\n")
+    out.flush()
+
+
 # Pretty print objects in the response in a table format
-def pp_objects(response, main_properties, json_output: bool = False):
+def pp_objects(
+    response,
+    main_properties,
+    json_output: bool = False,
+    tenants: Optional[List[str]] = None,
+    jsonl: bool = False,
+    extra: Optional[dict] = None,
+):
+    """Print query results as a table, JSON or JSONL.
+
+    Rows are formatted with a template built once and written to stdout in
+    chunks; JSON and JSONL are streamed object by object, so large results are
+    never held in memory as one string.
+
+    If `tenants` is given it must be aligned with the response objects, and a
+    tenant column is added (used for results merged across tenants).
+    `extra` adds top-level keys to the JSON document.
+    """
 
     objects = []
     if type(response) == weaviate.collections.classes.internal.ObjectSingleReturn:
@@ -63,57 +115,74 @@ def pp_objects(response, main_properties, json_output: bool = False):
     else:
         objects = response.objects
 
-    if json_output:
-        json_objects = []
-        for obj in objects:
-            obj_dict = {
-                "uuid": str(obj.uuid),
-                "properties": {
-                    prop: obj.properties.get(prop, None) for prop in main_properties
-                },
-                "distance": (
-                    getattr(obj.metadata, "distance", None) if obj.metadata else None
-                ),
-                "certainty": (
-                    getattr(obj.metadata, "certainty", None) if obj.metadata else None
-                ),
-                "score": getattr(obj.metadata, "score", None) if obj.metadata else None,
-            }
-            json_objects.append(obj_dict)
-        click.echo(
-            json.dumps(
-                {"objects": json_objects, "total": len(json_objects)},
-                indent=2,
-                default=str,
-            )
+    def _tenant(idx):
+        return tenants[idx] if tenants is not None else None
+
+    if jsonl:
+        _write_chunked(
+            json.dumps(_pp_object_dict(obj, main_properties, _tenant(idx)), default=str)
+            for idx, obj in enumerate(objects)
         )
         return
 
-    # Create the header
+    if json_output:
+        # Same document as json.dumps({"objects": [...], "total": n, **extra},
+        # indent=2); the tail is dumped as is and stripped of its opening brace.
+        tail = json.dumps({"total": len(objects), **(extra or {})}, indent=2)[2:]
+        if len(objects) == 0:
+            _write_chunked(['{\n  "objects": [],\n' + tail])
+            return
+
+        def _json_lines():
+            yield '{\n  "objects": ['
+            last = len(objects) - 1
+            for idx, obj in enumerate(objects):
+                dumped = json.dumps(
+                    _pp_object_dict(obj, main_properties, _tenant(idx)),
+                    indent=2,
+                    default=str,
+                )
+                yield "    " + dumped.replace("\n", "\n    ") + (
+                    "," if idx < last else ""
+                )
+            yield "  ],\n" + tail
+
+        _write_chunked(_json_lines())
+        return
+
+    # One template for header and rows: 36-char columns (truncated and padded)
+    # for the id, tenant and properties, 10-char columns for the metadata.
+    n_columns = len(main_properties) + 1 + (1 if tenants is not None else 0)
+    row_fmt = "{:<36.36} " * n_columns + "{:<10.10} {:<10.10} {:<10.10}"
+
     header = f"{'ID':<37}"
+    if tenants is not None:
+        header += f"{'Tenant':<37}"
     for prop in main_properties:
         header += f"{prop.capitalize():<37}"
     header += f"{'Distance':<11}{'Certainty':<11}{'Score':<11}"
-    print(header)
 
     if len(objects) == 0:
-        print("No objects found")
+        _write_chunked([header, "No objects found"])
         return
 
-    # Print each object
-    for obj in objects:
-        row = f"{str(obj.uuid):<36} "
-        for prop in main_properties:
-            row += f"{str(obj.properties.get(prop, ''))[:36]:<36} "
-        row += f"{str(obj.metadata.distance)[:10] if hasattr(obj.metadata, 'distance') else 'None':<10} "
-        row += f"{str(obj.metadata.certainty)[:10] if hasattr(obj.metadata, 'certainty') else 'None':<10} "
-        row += f"{str(obj.metadata.score)[:10] if hasattr(obj.metadata, 'score') else 'None':<10}"
-        print(row)
-
-    # Print footer
-    footer = f"{'':<37}" * (len(main_properties) + 1) + f"{'':<11}{'':<11}{'':<11}"
-    print(footer)
-    print(f"Total: {len(objects)} objects")
+    def _rows():
+        yield header
+        for idx, obj in enumerate(objects):
+            metadata = obj.metadata
+            values = [str(obj.uuid)]
+            if tenants is not None:
+                values.append(str(tenants[idx]))
+            props = obj.properties
+            values.extend(str(props.get(prop, "")) for prop in main_properties)
+            values.append(str(getattr(metadata, "distance", None)))
+            values.append(str(getattr(metadata, "certainty", None)))
+            values.append(str(getattr(metadata, "score", None)))
+            yield row_fmt.format(*values)
+        yield f"{'':<37}" * n_columns + f"{'':<11}{'':<11}{'':<11}"
+        yield f"Total: {len(objects)} objects"
+
+    _write_chunked(_rows())
 
 
 def parse_permission(perm: str) -> PermissionsCreateType: